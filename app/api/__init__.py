@@ -1,10 +1,26 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from .conditional import conditional_get
 
 api_router = APIRouter()
 
 # Include all endpoint routers here
-from .endpoints import accounts, sync, values  # noqa
+from .endpoints import accounts, health, series, stats, sync, values
 
-api_router.include_router(accounts.router, prefix="/accounts", tags=["accounts"])
-api_router.include_router(values.router, prefix="/values", tags=["values"])
+# Served from the accounts and values data alone, so revalidated against the
+# data version (sync and health report state that changes without it)
+data_routers = {
+    "accounts": accounts.router,
+    "values": values.router,
+    "series": series.router,
+    "stats": stats.router,
+}
+for name, router in data_routers.items():
+    api_router.include_router(
+        router,
+        prefix=f"/{name}",
+        tags=[name],
+        dependencies=[Depends(conditional_get)],
+    )
 api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
+api_router.include_router(health.router, prefix="/health", tags=["health"])
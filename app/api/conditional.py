@@ -0,0 +1,70 @@
+"""
+Conditional GETs for endpoints that serve only accounts and values data.
+
+Their responses can only change when the data version does, so it is their
+ETag and its time their Last-Modified. The version is read from the database,
+so imports by another process count too. A request whose If-None-Match (or,
+failing that, If-Modified-Since) still matches is answered 304 after that one
+read, before the endpoint runs.
+"""
+
+from datetime import UTC
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.services import data_version
+
+
+def _etag(version: data_version.Version) -> str:
+    # The change time too: a new database file starts counting from 1 again
+    return f'"{version.version}-{version.changed_at:%Y%m%d%H%M%S%f}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _not_modified_since(if_modified_since: str, changed_at) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have whole seconds
+    return changed_at.replace(microsecond=0) <= since
+
+
+async def conditional_get(
+    request: Request, response: Response, db: AsyncSession = Depends(get_read_db)
+) -> None:
+    """
+    Router dependency: validators on GET responses, 304 when they match. It
+    shares the request's read session with the endpoint.
+    """
+    if request.method != "GET":
+        return
+    version = await data_version.committed(db)
+    changed_at = version.changed_at.replace(tzinfo=UTC)
+    headers = {
+        "ETag": _etag(version),
+        "Last-Modified": format_datetime(changed_at, usegmt=True),
+        # Cache, but check back every time: a sync can land at any moment
+        "Cache-Control": "no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        unchanged = _matches(if_none_match, headers["ETag"])
+    else:
+        unchanged = if_modified_since is not None and _not_modified_since(
+            if_modified_since, changed_at
+        )
+    if unchanged:
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
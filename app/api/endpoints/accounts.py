@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.account import Account as AccountModel
 from app.schemas.account import Account, AccountCreate
+from app.services import data_version
 
 router = APIRouter()
 
@@ -25,27 +28,30 @@ def create_account(account: AccountCreate, db: Session = Depends(get_db)):
 
     db_account = AccountModel(**account.model_dump())
     db.add(db_account)
+    data_version.bump(db)
     db.commit()
     db.refresh(db_account)
     return db_account
 
 
 @router.get("/", response_model=List[Account])
-def list_accounts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def list_accounts(
+    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_read_db)
+):
     """
     List all accounts with pagination
     """
-    accounts = db.query(AccountModel).offset(skip).limit(limit).all()
-    return accounts
+    accounts = await db.scalars(select(AccountModel).offset(skip).limit(limit))
+    return accounts.all()
 
 
 @router.get("/{account_name}", response_model=Account)
-def get_account(account_name: str, db: Session = Depends(get_db)):
+async def get_account(account_name: str, db: AsyncSession = Depends(get_read_db)):
     """
     Get a specific account by name
     """
-    db_account = (
-        db.query(AccountModel).filter(AccountModel.name == account_name).first()
+    db_account = await db.scalar(
+        select(AccountModel).where(AccountModel.name == account_name)
     )
     if db_account is None:
         raise HTTPException(status_code=404, detail="Account not found")
@@ -64,5 +70,6 @@ def delete_account(account_name: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Account not found")
 
     db.delete(db_account)
+    data_version.bump(db)
     db.commit()
     return {"message": "Account deleted successfully"}
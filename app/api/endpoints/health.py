@@ -0,0 +1,55 @@
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+from app.services.sync_jobs import sync_jobs
+
+router = APIRouter()
+
+
+class Health(BaseModel):
+    status: str
+    # "fresh" once a sync has succeeded since startup, "stale" until then
+    data: str
+    sync_in_progress: bool
+    detail: str
+    last_sync_error: str | None
+
+
+@router.get("/", response_model=Health)
+async def health():
+    """
+    Readiness: the API serves existing data straight away, while the startup
+    sync may still be running in the background.
+    """
+    job = sync_jobs.latest()
+    if job is None:
+        return Health(
+            status="ok",
+            data="stale",
+            sync_in_progress=False,
+            detail="stale, no sync since startup",
+            last_sync_error=None,
+        )
+    if not job.finished:
+        return Health(
+            status="ok",
+            data="stale",
+            sync_in_progress=True,
+            detail="stale, sync in progress",
+            last_sync_error=None,
+        )
+    if job.status == "succeeded":
+        return Health(
+            status="ok",
+            data="fresh",
+            sync_in_progress=False,
+            detail="fresh",
+            last_sync_error=None,
+        )
+    return Health(
+        status="ok",
+        data="stale",
+        sync_in_progress=False,
+        detail="stale, last sync failed",
+        last_sync_error=job.error,
+    )
@@ -0,0 +1,128 @@
+from datetime import date
+from enum import Enum
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+from sqlalchemy import Date, Integer, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.enums import AccountType, AssetClass, Portfolio, Term
+from app.models.account import Account as AccountModel
+from app.models.value import Value as ValueModel
+
+router = APIRouter()
+
+GroupBy = Literal["term", "type", "portfolio", "asset_class", "account"]
+Bucket = Literal["day", "month", "quarter", "year"]
+
+GROUP_COLUMNS = {
+    "term": AccountModel.term,
+    "type": AccountModel.type,
+    "portfolio": AccountModel.portfolio,
+    "asset_class": AccountModel.asset_class,
+    "account": AccountModel.name,
+}
+
+
+def _bucket_start(bucket: Bucket, column):
+    """The first day of the bucket `column` falls in, computed by SQLite."""
+    modifiers = {
+        "day": (),
+        "month": ("start of month",),
+        "quarter": (
+            "start of month",
+            func.printf(
+                "-%d months", (func.strftime("%m", column).cast(Integer) - 1) % 3
+            ),
+        ),
+        "year": ("start of year",),
+    }[bucket]
+    return func.date(column, *modifiers, type_=Date)
+
+
+class Series(BaseModel):
+    # The group's value (account name or attribute), None for accounts without it
+    name: str | None
+    # One point per label; None where the group has no value in that bucket
+    data: list[float | None]
+
+
+class SeriesResponse(BaseModel):
+    group_by: GroupBy | None
+    bucket: Bucket
+    # First day of each bucket, ascending
+    labels: list[date]
+    series: list[Series]
+
+
+@router.get("/", response_model=SeriesResponse)
+async def get_series(
+    group_by: GroupBy | None = None,
+    bucket: Bucket = "day",
+    term: list[Term] | None = Query(None),
+    type: list[AccountType] | None = Query(None),
+    portfolio: list[Portfolio] | None = Query(None),
+    asset_class: list[AssetClass] | None = Query(None),
+    accounts: list[str] | None = Query(None),
+    start_date: date | None = None,
+    end_date: date | None = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Net worth over time as chart-ready arrays, one series per group (a
+    single "Total" series without group_by). Each account contributes its
+    latest value in every bucket, and those are summed per group, in one
+    query. Filters take repeated parameters (?type=Asset&type=Liability).
+    """
+    group = (GROUP_COLUMNS[group_by] if group_by else literal("Total")).label("grp")
+    bucket_start = _bucket_start(bucket, ValueModel.date).label("bucket")
+
+    # SQLite takes the bare columns from the row that supplies max(date): the
+    # account's latest value in the bucket
+    latest = (
+        select(group, bucket_start, ValueModel.amount, func.max(ValueModel.date))
+        .join(ValueModel.account)
+        .group_by(ValueModel.account_id, bucket_start)
+    )
+    for column, wanted in (
+        (AccountModel.term, term),
+        (AccountModel.type, type),
+        (AccountModel.portfolio, portfolio),
+        (AccountModel.asset_class, asset_class),
+        (AccountModel.name, accounts),
+    ):
+        if wanted:
+            latest = latest.where(column.in_(wanted))
+    if start_date:
+        latest = latest.where(ValueModel.date >= start_date)
+    if end_date:
+        latest = latest.where(ValueModel.date <= end_date)
+
+    latest = latest.subquery()
+    query = select(latest.c.grp, latest.c.bucket, func.sum(latest.c.amount)).group_by(
+        latest.c.grp, latest.c.bucket
+    )
+    rows = (await db.execute(query)).all()
+
+    labels = sorted({row.bucket for row in rows})
+    index = {label: i for i, label in enumerate(labels)}
+    totals: dict[str | None, list[float | None]] = {}
+    for name, label, amount in rows:
+        if isinstance(name, Enum):
+            name = name.value
+        totals.setdefault(name, [None] * len(labels))[index[label]] = amount
+
+    return SeriesResponse(
+        group_by=group_by,
+        bucket=bucket,
+        labels=labels,
+        # Named groups alphabetically, accounts without the attribute last
+        series=[
+            Series(name=name, data=data)
+            for name, data in sorted(
+                totals.items(), key=lambda s: (s[0] is None, s[0] or "")
+            )
+        ],
+    )
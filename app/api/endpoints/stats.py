@@ -0,0 +1,85 @@
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.services import data_version, stats
+
+router = APIRouter()
+
+# Figure name -> (data version it was computed at, result); every write bumps
+# the version, in this process or another, so an entry is served until the
+# data changes
+_cache: dict[str, tuple[data_version.Version, Any]] = {}
+
+
+async def _cached(db: AsyncSession, name: str, compute: Callable) -> Any:
+    version = await data_version.committed(db)
+    hit = _cache.get(name)
+    if hit is not None and hit[0] == version:
+        return hit[1]
+    result = await db.run_sync(compute)
+    _cache[name] = (version, result)
+    return result
+
+
+class Delta(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    amount: float
+    pct: float | None
+    baseline_date: date
+
+
+class Summary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    latest_date: date
+    net_worth: float
+    assets: float
+    liabilities: float
+    month_delta: Delta | None
+    ytd_delta: Delta | None
+
+
+class AccountChange(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    previous: float | None
+    current: float | None
+    change: float
+    pct: float | None
+
+
+class MonthlyChanges(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    previous_date: date
+    current_date: date
+    changes: list[AccountChange]
+    total_change: float
+
+
+@router.get("/summary", response_model=Summary | None)
+async def summary(db: AsyncSession = Depends(get_read_db)):
+    """
+    Net worth, assets and liabilities at the latest date, with the change
+    since the previous date and year to date; null before any values.
+    """
+    result = await _cached(db, "summary", stats.summary)
+    return None if result is None else Summary.model_validate(result)
+
+
+@router.get("/monthly-changes", response_model=MonthlyChanges | None)
+async def monthly_changes(db: AsyncSession = Depends(get_read_db)):
+    """
+    Each account's change between the latest two dates, largest first;
+    null with fewer than two dates.
+    """
+    result = await _cached(db, "monthly_changes", stats.monthly_changes)
+    return None if result is None else MonthlyChanges.model_validate(result)
@@ -1,75 +1,222 @@
-import threading
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_read_db
+from app.models.sync_run import SyncRun
 from app.models.sync_state import SyncState
 from app.models.value import Value
-from app.services.drive import DriveConfigError, DriveError
-from app.services.importer import ExcelParseError
-from app.services.sync import SyncNotConfigured, run_drive_sync
+from app.services.scheduler import current_scheduler
+from app.services.sync_history import DEFAULT_WINDOW, phase_percentiles
+from app.services.sync_jobs import SyncJob, sync_jobs
 
 router = APIRouter()
 
-# One sync at a time - overlapping wipe-and-reloads would corrupt the data
-_sync_lock = threading.Lock()
+
+class ScheduleStatus(BaseModel):
+    interval_seconds: float
+    next_run_at: datetime | None
+    last_run_at: datetime | None
+    last_result: str | None
+    consecutive_failures: int
+    fast_until: datetime | None
 
 
 class SyncStatus(BaseModel):
     file_name: str | None
     last_synced_at: datetime | None
     latest_value_date: datetime | None
+    # None when periodic sync is disabled
+    schedule: ScheduleStatus | None
 
 
 @router.get("/status", response_model=SyncStatus)
-def sync_status(db: Session = Depends(get_db)):
-    """When the data was last synced and how recent it is."""
-    state = db.get(SyncState, 1)
-    latest_value_date = db.query(func.max(Value.date)).scalar()
+async def sync_status(db: AsyncSession = Depends(get_read_db)):
+    """When the data was last synced, how recent it is and when the next
+    periodic sync is due."""
+    state = await db.get(SyncState, 1)
+    latest_value_date = await db.scalar(select(func.max(Value.date)))
+    scheduler = current_scheduler()
+    schedule = scheduler.state if scheduler else None
     return SyncStatus(
         file_name=state.file_name if state else None,
         last_synced_at=state.synced_at if state else None,
         latest_value_date=latest_value_date,
+        schedule=ScheduleStatus(
+            interval_seconds=schedule.interval.total_seconds(),
+            next_run_at=schedule.next_run_at,
+            last_run_at=schedule.last_run_at,
+            last_result=schedule.last_result,
+            consecutive_failures=schedule.consecutive_failures,
+            fast_until=schedule.fast_until,
+        )
+        if schedule
+        else None,
     )
 
 
+class DriveRequest(BaseModel):
+    name: str
+    # None when Drive could not be reached
+    status: int | None
+    seconds: float
+    retries: int
+
+
 class SyncResult(BaseModel):
     accounts_loaded: int
     values_loaded: int
     file_name: str
     drive_modified_time: str
     skipped: bool
+    values_inserted: int
+    values_updated: int
+    values_deleted: int
+    # Each Drive request the sync made, retries included
+    drive_requests: list[DriveRequest]
+
+
+class SyncJobStatus(BaseModel):
+    id: str
+    status: str
+    force: bool
+    phase: str | None
+    bytes_downloaded: int
+    rows_imported: int
+    backup_pages: int
+    backup_total_pages: int
+    timings: dict[str, float]
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    error: str | None
+    error_kind: str | None
+    result: SyncResult | None
 
 
-@router.post("/", response_model=SyncResult)
-def sync_from_drive(force: bool = False, db: Session = Depends(get_db)):
+def _job_status(job: SyncJob) -> SyncJobStatus:
+    outcome = job.outcome
+    return SyncJobStatus(
+        id=job.id,
+        status=job.status,
+        force=job.force,
+        phase=job.progress.phase,
+        bytes_downloaded=job.progress.bytes_downloaded,
+        rows_imported=job.progress.rows_imported,
+        backup_pages=job.progress.backup_pages,
+        backup_total_pages=job.progress.backup_total_pages,
+        timings=job.progress.timings,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        error_kind=job.error_kind,
+        result=SyncResult(
+            accounts_loaded=outcome.accounts_loaded,
+            values_loaded=outcome.values_loaded,
+            file_name=outcome.file_name,
+            drive_modified_time=outcome.drive_modified_time,
+            skipped=outcome.skipped,
+            values_inserted=outcome.values_inserted,
+            values_updated=outcome.values_updated,
+            values_deleted=outcome.values_deleted,
+            drive_requests=[
+                DriveRequest(
+                    name=timing.name,
+                    status=timing.status,
+                    seconds=timing.seconds,
+                    retries=timing.retries,
+                )
+                for timing in outcome.drive_requests
+            ],
+        )
+        if outcome
+        else None,
+    )
+
+
+@router.post("/", response_model=SyncJobStatus, status_code=202)
+def sync_from_drive(force: bool = False):
     """
-    Download the workbook from Google Drive and replace all accounts and
-    values with its contents. Skipped when the file hasn't changed since
-    the last sync, unless force=true.
+    Start a background job that downloads the workbook from Google Drive and
+    brings accounts and values in line with its contents, writing only what
+    changed. Skipped when the file hasn't changed since the last sync;
+    force=true always runs and does a full wipe-and-reload. If a sync is
+    already running, that job is returned instead of starting another.
+    Poll GET /sync/jobs/{id} for progress and the result.
     """
-    if not _sync_lock.acquire(blocking=False):
-        raise HTTPException(status_code=409, detail="A sync is already in progress")
-
-    try:
-        outcome = run_drive_sync(db, force=force)
-    except (SyncNotConfigured, DriveConfigError) as e:
-        raise HTTPException(status_code=503, detail=str(e))
-    except DriveError as e:
-        raise HTTPException(status_code=502, detail=str(e))
-    except ExcelParseError as e:
-        raise HTTPException(status_code=422, detail=str(e))
-    finally:
-        _sync_lock.release()
-
-    return SyncResult(
-        accounts_loaded=outcome.accounts_loaded,
-        values_loaded=outcome.values_loaded,
-        file_name=outcome.file_name,
-        drive_modified_time=outcome.drive_modified_time,
-        skipped=outcome.skipped,
+    return _job_status(sync_jobs.submit(force=force))
+
+
+@router.get("/jobs/{job_id}", response_model=SyncJobStatus)
+async def get_sync_job(job_id: str):
+    """Phase, progress, per-phase timings and (once finished) the result,
+    with the latency of each Drive request."""
+    job = sync_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+    return _job_status(job)
+
+
+class SyncRunRecord(BaseModel):
+    model_config = {"from_attributes": True}
+
+    id: int
+    started_at: datetime
+    finished_at: datetime
+    force: bool
+    status: str
+    error: str | None
+    error_kind: str | None
+    auth_seconds: float | None
+    metadata_seconds: float | None
+    download_seconds: float | None
+    parse_seconds: float | None
+    snapshot_seconds: float | None
+    import_seconds: float | None
+    bytes_downloaded: int
+    accounts_loaded: int | None
+    values_loaded: int | None
+    values_inserted: int | None
+    values_updated: int | None
+    values_deleted: int | None
+
+
+class PhasePercentiles(BaseModel):
+    runs: int
+    p50: float
+    p95: float
+
+
+class SyncHistory(BaseModel):
+    total: int
+    runs: list[SyncRunRecord]
+    # Over the last `window` runs; phases no run reached are left out
+    window: int
+    phases: dict[str, PhasePercentiles]
+
+
+@router.get("/history", response_model=SyncHistory)
+async def sync_history(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    window: int = Query(DEFAULT_WINDOW, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Past sync runs, newest first, with p50/p95 duration of each phase."""
+    runs = await db.scalars(
+        select(SyncRun).order_by(SyncRun.id.desc()).offset(offset).limit(limit)
+    )
+    phases = await db.run_sync(phase_percentiles, window)
+    return SyncHistory(
+        total=await db.scalar(select(func.count()).select_from(SyncRun)),
+        runs=runs.all(),
+        window=window,
+        phases={
+            phase: PhasePercentiles(runs=stats.runs, p50=stats.p50, p95=stats.p95)
+            for phase, stats in phases.items()
+        },
     )
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
 from datetime import datetime
+from typing import List, Optional
 
-from app.database import get_db
-from app.models.value import Value as ValueModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_read_db
 from app.models.account import Account as AccountModel
+from app.models.value import Value as ValueModel
 from app.schemas.value import Value, ValueCreate
+from app.services import data_version
 
 router = APIRouter()
 
@@ -15,72 +19,60 @@ router = APIRouter()
 @router.post("/", response_model=Value)
 def create_value(value: ValueCreate, db: Session = Depends(get_db)):
     """
-    Create or update a value entry for an account on a specific date
+    Create or update the value for an account on a specific date
     """
-    # Check if the account exists
-    account = (
-        db.query(AccountModel).filter(AccountModel.name == value.account_name).first()
+    # One statement: resolve the account, insert or overwrite that day's
+    # value via the unique (account_id, date) index, and return the row
+    values = ValueModel.__table__
+    stmt = insert(values).from_select(
+        ["account_id", "amount", "date"],
+        select(
+            AccountModel.id, literal(value.amount), literal(value.date.date())
+        ).where(AccountModel.name == value.account_name),
     )
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[values.c.account_id, values.c.date],
+        set_={"amount": stmt.excluded.amount},
+    ).returning(values.c.id, values.c.amount, values.c.date)
 
-    # Check if a value already exists for this account and date
-    # Truncate time part for date comparison (only compare year, month, day)
-    existing_value = (
-        db.query(ValueModel)
-        .filter(
-            ValueModel.account_name == value.account_name,
-            # Extract date part for comparison
-            func.date(ValueModel.date) == func.date(value.date),
-        )
-        .first()
+    row = db.execute(stmt).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Account not found")
+    data_version.bump(db)
+    db.commit()
+    return Value(
+        id=row.id, account_name=value.account_name, amount=row.amount, date=row.date
     )
 
-    if existing_value:
-        # Update existing value
-        existing_value.amount = value.amount
-        existing_value.date = (
-            value.date
-        )  # Update timestamp too in case time part changed
-        db.commit()
-        db.refresh(existing_value)
-        return existing_value
-    else:
-        # Create new value
-        db_value = ValueModel(
-            account_name=value.account_name, amount=value.amount, date=value.date
-        )
-        db.add(db_value)
-        db.commit()
-        db.refresh(db_value)
-        return db_value
-
 
 @router.get("/", response_model=List[Value])
-def list_values(
+async def list_values(
     account_name: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     List values with optional filtering by account and date range
     """
-    query = db.query(ValueModel)
+    query = select(ValueModel)
 
     if account_name:
-        query = query.filter(ValueModel.account_name == account_name)
+        query = query.join(ValueModel.account).where(AccountModel.name == account_name)
 
+    # Compare as days: a datetime bound against the date column compares as text
     if start_date:
-        query = query.filter(ValueModel.date >= start_date)
+        query = query.where(ValueModel.date >= start_date.date())
 
     if end_date:
-        query = query.filter(ValueModel.date <= end_date)
+        query = query.where(ValueModel.date <= end_date.date())
 
-    values = query.order_by(ValueModel.date.desc()).offset(skip).limit(limit).all()
-    return values
+    values = await db.scalars(
+        query.order_by(ValueModel.date.desc()).offset(skip).limit(limit)
+    )
+    return values.all()
 
 
 @router.delete("/{value_id}", response_model=dict)
@@ -88,37 +80,82 @@ def delete_value(value_id: str, db: Session = Depends(get_db)):
     """
     Delete a value by ID
     """
-    db_value = db.query(ValueModel).filter(ValueModel.id == value_id).first()
+    db_value = db.get(ValueModel, int(value_id)) if value_id.isdigit() else None
     if db_value is None:
         raise HTTPException(status_code=404, detail="Value not found")
 
     db.delete(db_value)
+    data_version.bump(db)
     db.commit()
     return {"message": "Value deleted successfully"}
 
 
 @router.get("/account/{account_name}", response_model=List[Value])
-def get_values_by_account(
+async def get_values_by_account(
     account_name: str,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get all values for a specific account with optional date filtering
     """
     # Check if the account exists
-    account = db.query(AccountModel).filter(AccountModel.name == account_name).first()
+    account = await db.scalar(
+        select(AccountModel).where(AccountModel.name == account_name)
+    )
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    query = db.query(ValueModel).filter(ValueModel.account_name == account_name)
+    query = select(ValueModel).where(ValueModel.account_id == account.id)
 
     if start_date:
-        query = query.filter(ValueModel.date >= start_date)
+        query = query.where(ValueModel.date >= start_date.date())
 
     if end_date:
-        query = query.filter(ValueModel.date <= end_date)
+        query = query.where(ValueModel.date <= end_date.date())
+
+    values = await db.scalars(query.order_by(ValueModel.date.desc()))
+    return values.all()
 
-    values = query.order_by(ValueModel.date.desc()).all()
-    return values
+
+@router.get("/batch", response_model=dict[str, list[Value]])
+async def get_values_by_accounts(
+    accounts: list[str] = Query(...),
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get the values of several accounts at once (?accounts=a&accounts=b),
+    keyed by account name in the order requested, with optional date
+    filtering
+    """
+    names = list(dict.fromkeys(accounts))
+    rows = await db.execute(
+        select(AccountModel.name, AccountModel.id).where(AccountModel.name.in_(names))
+    )
+    ids = dict(rows.all())
+    missing = [name for name in names if name not in ids]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Accounts not found: {', '.join(missing)}"
+        )
+
+    # One backwards scan of the (account_id, date) index - both columns
+    # descending, so SQLite doesn't sort - grouped as it streams
+    query = select(ValueModel).where(ValueModel.account_id.in_(ids.values()))
+
+    if start_date:
+        query = query.where(ValueModel.date >= start_date.date())
+
+    if end_date:
+        query = query.where(ValueModel.date <= end_date.date())
+
+    grouped: dict[str, list[ValueModel]] = {name: [] for name in names}
+    values = await db.scalars(
+        query.order_by(ValueModel.account_id.desc(), ValueModel.date.desc())
+    )
+    for value in values:
+        grouped[value.account_name].append(value)
+    return grouped
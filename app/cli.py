@@ -4,7 +4,8 @@
 Default mode serves the built frontend and the API from a single uvicorn
 process, rebuilding the frontend first if the source has changed. Pass
 --dev to also start the Vite dev server (hot reload) alongside a
-reloading backend.
+reloading backend. `uv run tracker restore` puts back a database snapshot
+taken before an import.
 """
 
 import argparse
@@ -55,9 +56,9 @@ def _build_frontend():
     subprocess.run([_npm(), "run", "build"], cwd=FRONTEND, check=True)
 
 
-def _open_browser_when_ready(url: str, port: int, timeout: float = 60.0):
-    """Open the browser once the server accepts connections (startup can
-    take a few seconds while it syncs from Drive)."""
+def _open_browser_when_ready(url: str, port: int, timeout: float = 15.0):
+    """Open the browser once the server accepts connections. The startup
+    Drive sync runs in the background, so this is just uvicorn's boot time."""
 
     def wait_and_open():
         deadline = time.monotonic() + timeout
@@ -72,8 +73,43 @@ def _open_browser_when_ready(url: str, port: int, timeout: float = 60.0):
     threading.Thread(target=wait_and_open, daemon=True).start()
 
 
+def _restore(args):
+    from app.services.backup import BACKUP_DIR, list_snapshots, restore_snapshot
+
+    if args.list:
+        for snapshot in reversed(list_snapshots()):
+            size = snapshot.stat().st_size
+            print(f"{snapshot.name}  ({size / 1024:,.0f} KiB)")
+        return
+
+    snapshot = args.snapshot
+    if snapshot is not None and not snapshot.exists():
+        snapshot = BACKUP_DIR / snapshot
+    try:
+        restored = restore_snapshot(snapshot)
+    except FileNotFoundError as e:
+        sys.exit(str(e))
+    print(f"Restored {restored.name} (the previous database was snapshotted first)")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Start the Net Worth Tracker")
+    commands = parser.add_subparsers(dest="command")
+    restore = commands.add_parser(
+        "restore",
+        help="restore a database snapshot",
+        description="Restore the database from a snapshot in backups/. "
+        "Stop the server first.",
+    )
+    restore.add_argument(
+        "snapshot",
+        nargs="?",
+        type=Path,
+        help="snapshot file or name in backups/ (default: the newest)",
+    )
+    restore.add_argument(
+        "--list", action="store_true", help="list snapshots, newest first"
+    )
     parser.add_argument("--port", type=int, default=8000, help="backend port")
     parser.add_argument(
         "--dev",
@@ -85,15 +121,22 @@ def main():
     )
     args = parser.parse_args()
 
+    snapshot = getattr(args, "snapshot", None)
+    if snapshot is not None and snapshot.exists():
+        args.snapshot = snapshot.resolve()  # before leaving the caller's cwd
+
     # The SQLite path and .env are relative to the repo root
     os.chdir(ROOT)
 
+    if args.command == "restore":
+        _restore(args)
+        return
+
     if args.dev:
         vite = subprocess.Popen([_npm(), "run", "dev"], cwd=FRONTEND)
         if not args.no_browser:
             # Wait on the backend, not Vite: Vite is up in milliseconds, but
-            # the API only accepts connections after its startup Drive sync,
-            # and the page is empty until the API is reachable
+            # the page is empty until the (reloading) API is reachable
             _open_browser_when_ready("http://localhost:5173", args.port)
         try:
             uvicorn.run("app.main:app", port=args.port, reload=True)
@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -11,9 +12,21 @@ load_dotenv()
 class Settings:
     drive_file_id: str | None
     service_account_file: Path
+    workbook_reader: str
+    workbook_engine: str
+    max_download_bytes: int
+    # None disables the periodic Drive sync
+    sync_interval: timedelta | None
+    # SQLite connection profile (see app.database.database.connection_pragmas)
+    sqlite_journal_mode: str
+    sqlite_synchronous: str
+    sqlite_cache_bytes: int
+    sqlite_mmap_bytes: int
+    sqlite_busy_timeout_ms: int
 
 
 def get_settings() -> Settings:
+    interval_minutes = float(os.environ.get("SYNC_INTERVAL_MINUTES", "15"))
     return Settings(
         drive_file_id=os.environ.get("DRIVE_FILE_ID") or None,
         service_account_file=Path(
@@ -21,4 +34,13 @@ def get_settings() -> Settings:
                 "GOOGLE_SERVICE_ACCOUNT_FILE", "secrets/service-account.json"
             )
         ),
+        workbook_reader=os.environ.get("WORKBOOK_READER", "pandas"),
+        workbook_engine=os.environ.get("WORKBOOK_ENGINE", "openpyxl"),
+        max_download_bytes=int(os.environ.get("DRIVE_MAX_DOWNLOAD_MB", "100")) << 20,
+        sync_interval=timedelta(minutes=interval_minutes) if interval_minutes else None,
+        sqlite_journal_mode=os.environ.get("SQLITE_JOURNAL_MODE", "wal"),
+        sqlite_synchronous=os.environ.get("SQLITE_SYNCHRONOUS", "normal"),
+        sqlite_cache_bytes=int(os.environ.get("SQLITE_CACHE_MB", "64")) << 20,
+        sqlite_mmap_bytes=int(os.environ.get("SQLITE_MMAP_MB", "256")) << 20,
+        sqlite_busy_timeout_ms=int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000")),
     )
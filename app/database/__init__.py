@@ -1,3 +1,3 @@
-from .database import Base, init_db, get_db, SessionLocal
+from .database import Base, SessionLocal, get_db, get_read_db, init_db
 
-__all__ = ["Base", "init_db", "get_db", "SessionLocal"]
+__all__ = ["Base", "SessionLocal", "get_db", "get_read_db", "init_db"]
@@ -1,17 +1,120 @@
-from sqlalchemy import create_engine
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from app.config import Settings, get_settings
+
 # SQLite database URL - stores data in a file in the project root
-SQLALCHEMY_DATABASE_URL = "sqlite:///./net_worth_tracker.db"
+DATABASE_PATH = "./net_worth_tracker.db"
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+
+# Connections kept for GET endpoints, and how many more a burst may open:
+# up to 40 in all, the size of the threadpool serving the sync endpoints, so
+# a request never waits on the pool for long. See create_read_engine
+READ_POOL_SIZE = 8
+READ_POOL_OVERFLOW = 32
+# Seconds a GET waits for a connection before failing, rather than the
+# default 30
+READ_POOL_TIMEOUT = 5
+
+# Reported at startup, in this order
+REPORTED_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "busy_timeout",
+)
+# Names for the PRAGMAs SQLite reports as numbers
+_PRAGMA_VALUE_NAMES = {
+    "synchronous": ("off", "normal", "full", "extra"),
+    "temp_store": ("default", "file", "memory"),
+}
+
+
+def connection_pragmas(settings: Settings) -> dict[str, str | int]:
+    """
+    The PRAGMAs run on every new connection. WAL lets dashboard reads carry
+    on while a sync writes (and synchronous=NORMAL is durable enough with
+    it); the page cache and mmap keep the whole database in memory for the
+    chart queries.
+    """
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        # Negative means KiB rather than pages
+        "cache_size": -(settings.sqlite_cache_bytes >> 10),
+        "mmap_size": settings.sqlite_mmap_bytes,
+        "temp_store": "memory",
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+    }
+
+
+def _apply_on_connect(sqlite_engine: Engine, pragmas: dict[str, str | int]) -> None:
+    @event.listens_for(sqlite_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Required for SQLite
+def create_sqlite_engine(
+    url: str, pragmas: dict[str, str | int], **engine_args
+) -> Engine:
+    """An engine whose connections all get `pragmas`."""
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},  # Required for SQLite
+        **engine_args,
+    )
+    _apply_on_connect(sqlite_engine, pragmas)
+    return sqlite_engine
+
+
+def create_read_engine(
+    path: str, pragmas: dict[str, str | int], pool_size: int = READ_POOL_SIZE
+) -> AsyncEngine:
+    """
+    A read-only aiosqlite engine over the database at `path`, for the async
+    GET endpoints: opened with mode=ro and query_only set, with a pool of
+    its own that grows by READ_POOL_OVERFLOW under load and gives up after
+    READ_POOL_TIMEOUT. Under WAL its connections read a consistent snapshot
+    while a sync writes, and requests wait on the event loop rather than
+    holding a threadpool worker. The journal mode is left to the write
+    engine.
+    """
+    read_pragmas = {name: v for name, v in pragmas.items() if name != "journal_mode"}
+    read_engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:{path}?mode=ro&uri=true",
+        pool_size=pool_size,
+        max_overflow=READ_POOL_OVERFLOW,
+        pool_timeout=READ_POOL_TIMEOUT,
+    )
+    _apply_on_connect(read_engine.sync_engine, {**read_pragmas, "query_only": 1})
+    return read_engine
+
+
+# Create SQLAlchemy engines: everything that writes (and the importer and
+# scripts) goes through the sync `engine`
+engine = create_sqlite_engine(
+    SQLALCHEMY_DATABASE_URL, connection_pragmas(get_settings())
 )
+read_engine = create_read_engine(DATABASE_PATH, connection_pragmas(get_settings()))
 
-# Session factory
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = async_sessionmaker(read_engine, autoflush=False)
 
 # Base class for models
 Base = declarative_base()
@@ -29,6 +132,28 @@ def get_db():
         db.close()
 
 
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Like get_db, but an AsyncSession on the read-only engine: for the async
+    GET endpoints. Any write raises.
+    """
+    async with ReadSessionLocal() as db:
+        yield db
+
+
+def effective_pragmas(sqlite_engine: Engine) -> dict[str, str | int]:
+    """What SQLite actually applied - e.g. journal_mode stays "memory" for an
+    in-memory database whatever was asked for."""
+    with sqlite_engine.connect() as conn:
+        values = {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in REPORTED_PRAGMAS
+        }
+    for name, names in _PRAGMA_VALUE_NAMES.items():
+        values[name] = names[values[name]]
+    return values
+
+
 def init_db():
     """
     Initialize the database by creating all tables.
@@ -36,7 +161,14 @@ def init_db():
     """
 
     import app.models  # noqa: F401  (register all models with Base)
+    from app.database.migrations import upgrade
+    from app.services import data_version
 
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    upgrade(engine)
     print("Database tables created")
+    with SessionLocal() as db:
+        data_version.load(db)
+    settings = ", ".join(f"{k}={v}" for k, v in effective_pragmas(engine).items())
+    print(f"SQLite: {settings}")
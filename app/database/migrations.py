@@ -0,0 +1,106 @@
+"""
+Schema upgrades for databases created by older versions of the app.
+
+create_all() only creates missing tables, so columns added to existing
+models since are added here. New columns must be nullable. Changes that
+rebuild tables are numbered: PRAGMA user_version records the last one
+applied.
+"""
+
+from sqlalchemy import Connection, Engine, inspect
+
+from app.database.database import Base
+
+# Bumped with each table-rebuilding migration below
+SCHEMA_VERSION = 1
+
+
+def upgrade(engine: Engine) -> None:
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    if version < 1 and _has_column(engine, "values", "account_name"):
+        _rebuild(engine, _integer_keys)
+    if version < SCHEMA_VERSION:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    _add_missing_columns(engine)
+
+
+def _has_column(engine: Engine, table: str, column: str) -> bool:
+    inspector = inspect(engine)
+    return inspector.has_table(table) and column in {
+        c["name"] for c in inspector.get_columns(table)
+    }
+
+
+def _rebuild(engine: Engine, migration) -> None:
+    """Run a table-rebuilding migration in one transaction, after taking a
+    snapshot of the database."""
+    from app.services.backup import snapshot_db
+
+    snapshot = snapshot_db()
+    print(f"Migrating database schema ({migration.__name__}), snapshot: {snapshot}")
+    with engine.connect() as conn:
+        # pysqlite doesn't open a transaction for DDL on its own
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            migration(conn)
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
+def _integer_keys(conn: Connection) -> None:
+    """
+    UUID string keys and a name-based foreign key to integer keys, an
+    account_id foreign key and date-only values, one per account per day
+    (the latest, where an old database has several).
+    """
+    from app.models.account import Account
+    from app.models.value import Value
+
+    for table in ("accounts", "values"):
+        conn.exec_driver_sql(f'ALTER TABLE "{table}" RENAME TO "{table}_old"')
+    # Index names are global, and the new tables reuse them
+    for (index,) in conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'index' "
+        "AND tbl_name IN ('accounts_old', 'values_old') AND sql IS NOT NULL"
+    ).all():
+        conn.exec_driver_sql(f'DROP INDEX "{index}"')
+
+    Account.__table__.create(conn)
+    Value.__table__.create(conn)
+    conn.exec_driver_sql(
+        "INSERT INTO accounts (name, description, term, type, portfolio, asset_class) "
+        "SELECT name, description, term, type, portfolio, asset_class "
+        "FROM accounts_old ORDER BY name"
+    )
+    # SQLite takes the bare amount from the row that supplies max(date)
+    conn.exec_driver_sql(
+        'INSERT INTO "values" (account_id, amount, date) '
+        "SELECT a.id, v.amount, date(max(v.date)) "
+        "FROM values_old v JOIN accounts a ON a.name = v.account_name "
+        "GROUP BY a.id, date(v.date)"
+    )
+    conn.exec_driver_sql("DROP TABLE values_old")
+    conn.exec_driver_sql("DROP TABLE accounts_old")
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                print(f"Adding column {table.name}.{column.name}")
+                conn.exec_driver_sql(
+                    f'ALTER TABLE "{table.name}" '
+                    f'ADD COLUMN "{column.name}" {column_type}'
+                )
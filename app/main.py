@@ -7,8 +7,12 @@ from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api import api_router
-from app.database import init_db, SessionLocal
-from app.services.sync import sync_on_startup
+from app.config import get_settings
+from app.database import init_db
+from app.database.database import engine, read_engine
+from app.services.importer import report_engine
+from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.sync_jobs import sync_jobs, sync_on_startup
 
 FRONTEND_DIST = Path(__file__).resolve().parent.parent / "frontend" / "dist"
 
@@ -18,13 +22,19 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize database
     init_db()
     print("Database initialized")
+    settings = get_settings()
+    report_engine(settings.workbook_engine)
+    # Runs on a worker thread: existing data is served while it syncs
     sync_on_startup()
+    start_scheduler(sync_jobs, settings.sync_interval, settings.drive_file_id)
 
     yield
 
     # Shutdown: Clean up resources
     print("Shutting down application")
-    SessionLocal.close_all()
+    stop_scheduler()
+    engine.dispose()
+    await read_engine.dispose()
 
 
 app = FastAPI(
@@ -1,5 +1,7 @@
 from app.models.account import Account
+from app.models.data_version import DataVersion
+from app.models.sync_run import SyncRun
 from app.models.sync_state import SyncState
 from app.models.value import Value
 
-__all__ = ["Account", "SyncState", "Value"]
+__all__ = ["Account", "DataVersion", "SyncRun", "SyncState", "Value"]
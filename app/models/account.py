@@ -1,5 +1,4 @@
-from sqlalchemy import Column, String, Text, Enum as SQLEnum
-import uuid
+from sqlalchemy import Column, Integer, String, Text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from app.database import Base
 from app.enums import Term, AccountType, Portfolio, AssetClass
@@ -8,9 +7,7 @@ from app.enums import Term, AccountType, Portfolio, AssetClass
 class Account(Base):
     __tablename__ = "accounts"
 
-    id = Column(
-        String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
-    )
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, index=True, unique=True)
     description = Column(Text, nullable=True)
     term = Column(SQLEnum(Term), nullable=True)
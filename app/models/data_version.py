@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, Integer
+
+from app.database import Base
+
+
+class DataVersion(Base):
+    """Single-row counter bumped by every write to accounts or values."""
+
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True, default=1)
+    version = Column(Integer, nullable=False)
+    # UTC, naive like every DateTime SQLite stores
+    changed_at = Column(DateTime, nullable=False)
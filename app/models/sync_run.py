@@ -0,0 +1,33 @@
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text
+
+from app.database import Base
+
+
+class SyncRun(Base):
+    """One Drive sync attempt: how it ended and where the time went."""
+
+    __tablename__ = "sync_runs"
+
+    id = Column(Integer, primary_key=True)
+    started_at = Column(DateTime, nullable=False, index=True)
+    finished_at = Column(DateTime, nullable=False)
+    force = Column(Boolean, nullable=False, default=False)
+    # "succeeded", "skipped" or "failed"
+    status = Column(String(16), nullable=False)
+    error = Column(Text, nullable=True)
+    error_kind = Column(String(16), nullable=True)
+
+    # Wall-clock seconds per phase; NULL when the run never reached it
+    auth_seconds = Column(Float, nullable=True)
+    metadata_seconds = Column(Float, nullable=True)
+    download_seconds = Column(Float, nullable=True)
+    parse_seconds = Column(Float, nullable=True)
+    snapshot_seconds = Column(Float, nullable=True)
+    import_seconds = Column(Float, nullable=True)
+
+    bytes_downloaded = Column(Integer, nullable=False, default=0)
+    accounts_loaded = Column(Integer, nullable=True)
+    values_loaded = Column(Integer, nullable=True)
+    values_inserted = Column(Integer, nullable=True)
+    values_updated = Column(Integer, nullable=True)
+    values_deleted = Column(Integer, nullable=True)
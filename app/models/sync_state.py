@@ -11,4 +11,6 @@ class SyncState(Base):
     id = Column(Integer, primary_key=True, default=1)
     file_name = Column(String(255), nullable=False)
     drive_modified_time = Column(String(64), nullable=False)
+    # md5 of the workbook bytes (Drive's md5Checksum, or computed locally)
+    content_hash = Column(String(64), nullable=True)
     synced_at = Column(DateTime, nullable=False)
@@ -1,23 +1,34 @@
-from sqlalchemy import Column, String, Float, ForeignKey, DateTime, func
-from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy import Column, Date, Float, ForeignKey, Index, Integer, func, select
+from sqlalchemy.orm import column_property, relationship
+
 from app.database import Base
+from app.models.account import Account
 
 
 class Value(Base):
     __tablename__ = "values"
-
-    id = Column(
-        String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # One value per account per day; also serves an account's date ranges
+        Index("ux_values_account_date", "account_id", "date", unique=True),
     )
-    account_name = Column(
-        String(100), ForeignKey("accounts.name"), nullable=False, index=True
+
+    id = Column(Integer, primary_key=True)
+    account_id = Column(
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False
     )
     amount = Column(Float, nullable=False)
-    date = Column(DateTime, nullable=False, default=func.now(), index=True)
+    date = Column(Date, nullable=False, default=func.current_date(), index=True)
 
     # Relationship to account
     account = relationship("Account", back_populates="values")
 
+    # The API identifies accounts by name; loaded in the same SELECT
+    account_name = column_property(
+        select(Account.name)
+        .where(Account.id == account_id)
+        .correlate_except(Account)
+        .scalar_subquery()
+    )
+
     def __repr__(self):
         return f"<Value {self.account_name}: {self.amount} on {self.date}>"
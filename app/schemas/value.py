@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -13,7 +13,7 @@ class ValueCreate(ValueBase):
 
 
 class Value(ValueBase):
-    id: str
+    # Integer key in the database, a string in the API
+    model_config = ConfigDict(from_attributes=True, coerce_numbers_to_str=True)
 
-    class Config:
-        from_attributes = True
+    id: str
@@ -1,38 +1,231 @@
-"""Snapshot the SQLite database before destructive imports."""
+"""
+Snapshot the SQLite database before destructive imports, and restore it.
 
+Snapshots are gzip-compressed and named after a hash of their contents, so
+a database that hasn't changed since the newest snapshot isn't stored (or
+compressed) again. Usually that's known before copying anything: the data
+version and schema version at the newest snapshot are kept beside it, and
+if the database still has the same ones it is not read at all - changes
+that don't bump the data version (sync bookkeeping) don't warrant a new
+snapshot on their own. The hash covers databases without a data version.
+
+The copy is taken a few pages at a time, releasing the read lock between
+steps, and a sync runs it on a background thread while it downloads and
+parses (see BackgroundSnapshot).
+"""
+
+import gzip
+import hashlib
+import shutil
 import sqlite3
+import tempfile
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
 from app.database.database import SQLALCHEMY_DATABASE_URL
+from app.services import data_version
 
 DB_PATH = Path(SQLALCHEMY_DATABASE_URL.removeprefix("sqlite:///"))
 BACKUP_DIR = Path("backups")
 
+# Leading hex digits of the sha256 kept in snapshot names
+HASH_LENGTH = 16
+CHUNK_BYTES = 1 << 20
 
-def snapshot_db(keep: int = 10) -> Path | None:
-    """Copy the database to backups/, pruning to the newest `keep` files.
-    Returns the snapshot path, or None if there is no database yet."""
-    if not DB_PATH.exists():
-        return None
+# Pages copied per backup step; the source is only read-locked during a step,
+# so writers get in between steps
+BACKUP_STEP_PAGES = 256
+# Back-off when a step finds the database busy or locked
+BACKUP_SLEEP_SECONDS = 0.05
 
-    BACKUP_DIR.mkdir(exist_ok=True)
-    stamp = time.strftime("%Y%m%d-%H%M%S")
-    dest = BACKUP_DIR / f"{DB_PATH.stem}-{stamp}.db"
+# Called with (pages copied, total pages) after each backup step
+BackupProgress = Callable[[int, int], None]
+
+# One snapshot at a time, so a snapshot finishing in the background is never
+# overtaken by the next sync's
+_snapshot_lock = threading.Lock()
+# Runs BackgroundSnapshots; the future carries any error back to wait()
+_snapshot_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+
+
+def _copy_database(
+    source_path: Path, target_path: Path, progress: BackupProgress | None = None
+) -> None:
+    def on_step(status: int, remaining: int, total: int) -> None:
+        progress(total - remaining, total)
 
     # sqlite3's backup API is safe even if the app has the DB open
-    source = sqlite3.connect(DB_PATH)
+    source = sqlite3.connect(source_path)
     try:
-        target = sqlite3.connect(dest)
+        target = sqlite3.connect(target_path)
         try:
-            source.backup(target)
+            source.backup(
+                target,
+                pages=BACKUP_STEP_PAGES,
+                progress=on_step if progress else None,
+                sleep=BACKUP_SLEEP_SECONDS,
+            )
         finally:
             target.close()
     finally:
         source.close()
 
-    snapshots = sorted(BACKUP_DIR.glob(f"{DB_PATH.stem}-*.db"))
-    for old in snapshots[:-keep]:
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def list_snapshots() -> list[Path]:
+    """Snapshots of the database, oldest first."""
+    # By mtime: two snapshots taken within a second share a timestamp
+    return sorted(
+        BACKUP_DIR.glob(f"{DB_PATH.stem}-*.db.gz"),
+        key=lambda path: (path.stat().st_mtime_ns, path.name),
+    )
+
+
+def _marker_path() -> Path:
+    return BACKUP_DIR / f"{DB_PATH.stem}.marker"
+
+
+def _change_marker() -> str | None:
+    """Schema and data version of the database: if neither moved, the
+    accounts and values haven't changed. None without a data version."""
+    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    try:
+        schema = conn.execute("PRAGMA user_version").fetchone()[0]
+        row = conn.execute("SELECT version, changed_at FROM data_version").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    return f"{schema}:{row[0]}:{row[1]}"
+
+
+def _unchanged_since_newest(marker: str | None) -> Path | None:
+    """The newest snapshot, if it was taken at `marker`."""
+    snapshots = list_snapshots()
+    if marker is None or not snapshots or not _marker_path().exists():
+        return None
+    if _marker_path().read_text() != f"{marker}\t{snapshots[-1].name}":
+        return None
+    return snapshots[-1]
+
+
+def _remember(marker: str | None, snapshot: Path) -> None:
+    if marker is None:
+        _marker_path().unlink(missing_ok=True)
+    else:
+        _marker_path().write_text(f"{marker}\t{snapshot.name}")
+
+
+def _snapshot_hash(path: Path) -> str:
+    return path.name.removesuffix(".db.gz").rsplit("-", 1)[-1]
+
+
+def snapshot_db(keep: int = 10, progress: BackupProgress | None = None) -> Path | None:
+    """Compress a copy of the database into backups/, pruning to the newest
+    `keep` snapshots. Returns the snapshot path - the newest existing one if
+    the database is unchanged since - or None if there is no database yet.
+    `progress` is called with (pages copied, total pages) as the copy runs."""
+    with _snapshot_lock:
+        return _snapshot(keep, progress)
+
+
+def _snapshot(keep: int, progress: BackupProgress | None) -> Path | None:
+    if not DB_PATH.exists():
+        return None
+
+    # Read before copying: a write during the copy leaves the marker behind,
+    # so the next snapshot copies again rather than missing it
+    marker = _change_marker()
+    if (newest := _unchanged_since_newest(marker)) is not None:
+        return newest
+
+    BACKUP_DIR.mkdir(exist_ok=True)
+    # A consistent copy first: the live file may be mid-write
+    with tempfile.TemporaryDirectory(dir=BACKUP_DIR) as tmp:
+        copy = Path(tmp) / DB_PATH.name
+        _copy_database(DB_PATH, copy, progress)
+        content_hash = _file_hash(copy)
+
+        snapshots = list_snapshots()
+        if snapshots and _snapshot_hash(snapshots[-1]) == content_hash:
+            _remember(marker, snapshots[-1])
+            return snapshots[-1]
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        dest = BACKUP_DIR / f"{DB_PATH.stem}-{stamp}-{content_hash}.db.gz"
+        partial = Path(tmp) / dest.name
+        with open(copy, "rb") as src, gzip.open(partial, "wb") as out:
+            shutil.copyfileobj(src, out, CHUNK_BYTES)
+        partial.replace(dest)
+
+    for old in list_snapshots()[:-keep]:
         old.unlink()
 
+    _remember(marker, dest)
     return dest
+
+
+class BackgroundSnapshot:
+    """
+    snapshot_db() on a worker thread, so a sync can download and parse while
+    the database is copied. wait() must return before the next destructive
+    write; it re-raises anything the snapshot raised.
+    """
+
+    def __init__(self, keep: int = 10, progress: BackupProgress | None = None):
+        self._future = _snapshot_worker.submit(snapshot_db, keep, progress)
+
+    def wait(self) -> Path | None:
+        return self._future.result()
+
+
+def restore_snapshot(snapshot: Path | None = None) -> Path:
+    """Replace the database's contents with `snapshot` (default: the newest).
+    The current database is snapshotted first, so a restore can be undone.
+    Returns the snapshot restored."""
+    if snapshot is None:
+        snapshots = list_snapshots()
+        if not snapshots:
+            raise FileNotFoundError(f"No snapshots in {BACKUP_DIR}/")
+        snapshot = snapshots[-1]
+    if not snapshot.exists():
+        raise FileNotFoundError(f"Snapshot not found: {snapshot}")
+
+    snapshot_db()
+    engine = create_engine(f"sqlite:///{DB_PATH}")
+    try:
+        with Session(engine) as db:
+            live_version = data_version.persisted(db)
+        with tempfile.TemporaryDirectory() as tmp:
+            copy = Path(tmp) / DB_PATH.name
+            with gzip.open(snapshot, "rb") as src, open(copy, "wb") as out:
+                shutil.copyfileobj(src, out, CHUNK_BYTES)
+            # Through the backup API rather than a file move, so open
+            # connections and any journal files stay consistent
+            _copy_database(copy, DB_PATH)
+
+        # The snapshot's data version is older: move past the replaced one,
+        # so nothing cached against a version number sees other data under it
+        with Session(engine) as db:
+            data_version.persisted(db)
+            data_version.bump(db, past=live_version)
+            db.commit()
+    finally:
+        engine.dispose()
+
+    return snapshot
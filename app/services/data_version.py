@@ -0,0 +1,112 @@
+"""
+A version number for the accounts and values data, so anything derived from
+it can be cached until it changes.
+
+bump() increments the persisted counter in the same transaction as the write
+it accompanies; the in-memory copy current() returns only moves once that
+transaction commits. Writes made by another process (an import by
+scripts/load_from_excel.py, tracker restore) only show in the database, so
+anything served from a cache checks committed(), a one-row primary key read.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+
+# Session.info keys for a bump awaiting its transaction's commit, and for
+# the version committed() read
+_PENDING = "data_version"
+_COMMITTED = "committed_data_version"
+
+
+@dataclass(frozen=True)
+class Version:
+    version: int
+    # Naive UTC, as stored
+    changed_at: datetime
+
+
+_lock = threading.Lock()
+_current = Version(0, datetime(1970, 1, 1))
+
+
+def current() -> Version:
+    """The latest committed version."""
+    return _current
+
+
+def load(db: Session) -> Version:
+    """Read the persisted version into memory, starting the counter at 1 on
+    a database that has none yet."""
+    global _current
+    row = db.scalar(select(DataVersion))
+    if row is None:
+        bump(db)
+        db.commit()
+        row = db.scalar(select(DataVersion))
+    with _lock:
+        _current = Version(row.version, row.changed_at)
+    return _current
+
+
+async def committed(db: AsyncSession) -> Version:
+    """The version committed to the database, whichever process wrote it:
+    read once per session, and published as current() if newer."""
+    global _current
+    if _COMMITTED in db.info:
+        return db.info[_COMMITTED]
+    row = (
+        await db.execute(select(DataVersion.version, DataVersion.changed_at))
+    ).one_or_none()
+    if row is None:
+        return _current
+    version = db.info[_COMMITTED] = Version(row.version, row.changed_at)
+    with _lock:
+        if version.version > _current.version:
+            _current = version
+    return version
+
+
+def persisted(db: Session) -> int:
+    """The version stored in the database (0 if none), creating the table if
+    the database predates it."""
+    DataVersion.__table__.create(db.connection(), checkfirst=True)
+    return db.scalar(select(DataVersion.version)) or 0
+
+
+def bump(db: Session, past: int = 0) -> None:
+    """Increment the version as part of db's transaction, to beyond `past`
+    too if given; current() follows when it commits."""
+    now = datetime.now(UTC).replace(tzinfo=None)
+    table = DataVersion.__table__
+    stmt = insert(table).values(id=1, version=past + 1, changed_at=now)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={"version": func.max(table.c.version, past) + 1, "changed_at": now},
+    ).returning(table.c.version, table.c.changed_at)
+    row = db.execute(stmt).one()
+    db.info[_PENDING] = Version(row.version, row.changed_at)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish(session: Session) -> None:
+    global _current
+    pending = session.info.pop(_PENDING, None)
+    if pending is None:
+        return
+    with _lock:
+        # Concurrent writers can commit out of order
+        if pending.version > _current.version:
+            _current = pending
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -5,13 +5,24 @@ The service account's JSON key file must exist locally and the Drive file
 must be shared (Viewer is enough) with the service account's email address.
 """
 
+import contextlib
+import hashlib
 import json
+import random
+import tempfile
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import BinaryIO
 
 import requests
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
 
 SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
@@ -19,6 +30,20 @@ XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 GOOGLE_SHEET_MIME = "application/vnd.google-apps.spreadsheet"
 TIMEOUT_SECONDS = 30
 
+# Transient failures worth retrying; GETs are idempotent so this is safe
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+POOL_MAXSIZE = 4
+
+# Access tokens are reused across syncs until this close to expiry
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+# Downloads stay in memory up to this size, then spill to a temp file
+SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024
+
 
 class DriveConfigError(Exception):
     """Local configuration problem (missing or invalid service account key)."""
@@ -33,37 +58,173 @@ class DriveMetadata:
     name: str
     mime_type: str
     modified_time: str
+    # Only binary files have one; native Google Sheets don't
+    md5_checksum: str | None = None
 
 
-class DriveClient:
-    """Authenticates once, then fetches metadata and content separately."""
+@dataclass
+class Download:
+    """Downloaded content, rewound and ready to read. Close `file` when done."""
 
-    def __init__(self, service_account_file: Path):
-        if not service_account_file.exists():
-            raise DriveConfigError(
-                f"Service account key file not found: {service_account_file}"
-            )
-        try:
-            self._credentials = service_account.Credentials.from_service_account_file(
-                str(service_account_file), scopes=SCOPES
-            )
-        except (ValueError, json.JSONDecodeError) as e:
-            raise DriveConfigError(
-                f"Invalid service account key file {service_account_file}: {e}"
-            ) from e
+    file: BinaryIO
+    size: int
+    md5: str
+
+
+@dataclass
+class RequestTiming:
+    """One logical Drive request, including any retries."""
+
+    name: str
+    status: int | None
+    seconds: float
+    retries: int
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _shared_session() -> requests.Session:
+    """Process-wide keep-alive session, so metadata and download (and
+    successive syncs) reuse one TLS connection instead of one per request."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+# Service-account credentials keyed by (key file path, mtime), so the key is
+# read once and its access token shared by every sync until it nears expiry
+_credentials: dict[tuple[str, float], service_account.Credentials] = {}
+_credentials_lock = threading.Lock()
+
+
+def _cached_credentials(service_account_file: Path) -> service_account.Credentials:
+    if not service_account_file.exists():
+        raise DriveConfigError(
+            f"Service account key file not found: {service_account_file}"
+        )
+    path = str(service_account_file.resolve())
+    key = (path, service_account_file.stat().st_mtime)
+    with _credentials_lock:
+        credentials = _credentials.get(key)
+        if credentials is None:
+            try:
+                credentials = service_account.Credentials.from_service_account_file(
+                    path, scopes=SCOPES
+                )
+            except (ValueError, json.JSONDecodeError) as e:
+                raise DriveConfigError(
+                    f"Invalid service account key file {service_account_file}: {e}"
+                ) from e
+            # A changed key file replaces the stale entry for its path
+            for stale in [k for k in _credentials if k[0] == path]:
+                del _credentials[stale]
+            _credentials[key] = credentials
+        return credentials
+
+
+def _fresh_token(credentials: service_account.Credentials) -> str:
+    """The cached access token, refreshed first if it is about to expire."""
+    with _credentials_lock:
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(UTC).replace(tzinfo=None)
+        if (
+            credentials.token is None
+            or credentials.expiry is None
+            or credentials.expiry - TOKEN_REFRESH_MARGIN <= now
+        ):
+            try:
+                credentials.refresh(Request())
+            except Exception as e:
+                raise DriveError(f"Could not authenticate with Google: {e}") from e
+        return credentials.token
+
+
+def _backoff_seconds(retry: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**retry))
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """The server's Retry-After (delta-seconds or HTTP-date), if any."""
+    header = response.headers.get("Retry-After")
+    if not header:
+        return None
+    try:
+        seconds = float(header)
+    except ValueError:
         try:
-            self._credentials.refresh(Request())
-        except Exception as e:
-            raise DriveError(f"Could not authenticate with Google: {e}") from e
+            seconds = parsedate_to_datetime(header).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), BACKOFF_MAX_SECONDS)
+
+
+class DriveClient:
+    """
+    Fetches metadata and content separately, authenticating with cached
+    service-account credentials (refreshed lazily, shortly before expiry).
+    Every request is recorded in `timings` (latency and retry count).
+    """
+
+    def __init__(self, service_account_file: Path, base_url: str = DRIVE_FILES_URL):
+        self._base_url = base_url
+        self.timings: list[RequestTiming] = []
+        self._credentials = _cached_credentials(service_account_file)
+        _fresh_token(self._credentials)  # fail fast on bad credentials
 
-    def _get(self, url: str, file_id: str, **kwargs) -> requests.Response:
-        headers = {"Authorization": f"Bearer {self._credentials.token}"}
+    def _get(self, name: str, url: str, file_id: str, **kwargs) -> requests.Response:
+        """
+        GET with retries on connection errors, timeouts and RETRY_STATUSES,
+        backing off exponentially (or as long as Retry-After asks).
+        """
+        session = _shared_session()
+        started = time.perf_counter()
+        retries = 0
+        response = None
         try:
-            response = requests.get(
-                url, headers=headers, timeout=TIMEOUT_SECONDS, **kwargs
+            while True:
+                token = _fresh_token(self._credentials)
+                headers = {"Authorization": f"Bearer {token}"}
+                try:
+                    response = session.get(
+                        url, headers=headers, timeout=TIMEOUT_SECONDS, **kwargs
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    response = None
+                    if retries >= MAX_RETRIES:
+                        raise DriveError(f"Could not reach Google Drive: {e}") from e
+                    delay = _backoff_seconds(retries)
+                except requests.RequestException as e:
+                    raise DriveError(f"Could not reach Google Drive: {e}") from e
+                else:
+                    if (
+                        response.status_code not in RETRY_STATUSES
+                        or retries >= MAX_RETRIES
+                    ):
+                        break
+                    delay = _retry_after_seconds(response)
+                    if delay is None:
+                        delay = _backoff_seconds(retries)
+                    response.close()
+                retries += 1
+                time.sleep(delay)
+        finally:
+            self.timings.append(
+                RequestTiming(
+                    name=name,
+                    status=response.status_code if response is not None else None,
+                    seconds=time.perf_counter() - started,
+                    retries=retries,
+                )
             )
-        except requests.RequestException as e:
-            raise DriveError(f"Could not reach Google Drive: {e}") from e
+
         if response.status_code in (403, 404):
             raise DriveError(
                 f"Drive file '{file_id}' not found or not shared with the "
@@ -77,24 +238,73 @@ class DriveClient:
 
     def get_metadata(self, file_id: str) -> DriveMetadata:
         data = self._get(
-            f"{DRIVE_FILES_URL}/{file_id}",
+            "metadata",
+            f"{self._base_url}/{file_id}",
             file_id,
-            params={"fields": "name,mimeType,modifiedTime"},
+            params={"fields": "name,mimeType,modifiedTime,md5Checksum"},
         ).json()
         return DriveMetadata(
             name=data.get("name", file_id),
             mime_type=data.get("mimeType", ""),
             modified_time=data.get("modifiedTime", ""),
+            md5_checksum=data.get("md5Checksum"),
         )
 
-    def download(self, file_id: str, mime_type: str) -> bytes:
-        """Download file content; native Google Sheets are exported as xlsx."""
+    def download(
+        self,
+        file_id: str,
+        mime_type: str,
+        max_bytes: int,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> Download:
+        """
+        Stream file content into a spooled temp file, hashing it on the way;
+        native Google Sheets are exported as xlsx. `on_progress` is called
+        with the byte count so far after each chunk. Raises DriveError if the
+        file is larger than max_bytes.
+        """
         if mime_type == GOOGLE_SHEET_MIME:
-            return self._get(
-                f"{DRIVE_FILES_URL}/{file_id}/export",
+            response = self._get(
+                "download",
+                f"{self._base_url}/{file_id}/export",
                 file_id,
                 params={"mimeType": XLSX_MIME},
-            ).content
-        return self._get(
-            f"{DRIVE_FILES_URL}/{file_id}", file_id, params={"alt": "media"}
-        ).content
+                stream=True,
+            )
+        else:
+            response = self._get(
+                "download",
+                f"{self._base_url}/{file_id}",
+                file_id,
+                params={"alt": "media"},
+                stream=True,
+            )
+
+        too_large = DriveError(
+            f"Drive file '{file_id}' is larger than the {max_bytes:,} byte limit"
+        )
+        digest = hashlib.md5()
+        size = 0
+        # The spool is closed on any failure; on success the caller owns it
+        with contextlib.ExitStack() as on_failure:
+            spool = on_failure.enter_context(
+                tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+            )
+            try:
+                with response:
+                    if int(response.headers.get("Content-Length") or 0) > max_bytes:
+                        raise too_large
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_BYTES):
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise too_large
+                        digest.update(chunk)
+                        spool.write(chunk)
+                        if on_progress:
+                            on_progress(size)
+            except requests.RequestException as e:
+                raise DriveError(f"Download from Google Drive failed: {e}") from e
+            on_failure.pop_all()
+
+        spool.seek(0)
+        return Download(file=spool, size=size, md5=digest.hexdigest())
@@ -11,21 +11,75 @@ Rows sharing an account name have their per-date amounts summed; duplicate
 rows with inconsistent classification attributes are an error.
 """
 
+import importlib.util
+import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from io import BytesIO
+from itertools import batched
 from pathlib import Path
+from typing import BinaryIO
 
 import pandas as pd
+from openpyxl import load_workbook
+from sqlalchemy import MetaData, bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.enums import AccountType, AssetClass, Portfolio, Term
 from app.models.account import Account
 from app.models.value import Value
+from app.services import data_version
 
 SHEET_NAME = "Net Worth"
 
+# "replace" wipes and reloads; "incremental" writes only what changed;
+# "swap" loads staging tables and renames them over the live ones
+IMPORT_MODES = ("replace", "incremental", "swap")
+
+# Tables reloaded by an import, parents first, and the suffix of their
+# staging copies in "swap" mode
+_IMPORT_TABLES = ("accounts", "values")
+STAGING_SUFFIX = "_next"
+
+# Rows per executemany INSERT when loading values
+INSERT_BATCH_SIZE = 5000
+
+# Table and index names in the DDL SQLite keeps in sqlite_master
+_CREATE_TABLE = re.compile(r'CREATE TABLE\s+("[^"]+"|\w+)')
+_CREATE_INDEX = re.compile(
+    r'(?P<head>CREATE\s+(?:UNIQUE\s+)?INDEX\s+)("[^"]+"|\w+)\s+ON\s+'
+    r'"?(?P<table>\w+)"?'
+)
+
+_ACCOUNT_ATTRIBUTES = ("description", "term", "type", "portfolio", "asset_class")
+
+# "pandas" loads the sheet into a DataFrame and parses it vectorized;
+# "streaming" walks rows lazily and stops reading at the summary rows
+READERS = ("pandas", "streaming")
+
+# pandas read_excel engines for the "pandas" reader. calamine (Rust, needs the
+# optional python-calamine package) is much faster than pure-Python openpyxl.
+ENGINES = ("openpyxl", "calamine")
+# Checked once at import, so a missing package is reported once, not per parse
+_CALAMINE_INSTALLED = importlib.util.find_spec("python_calamine") is not None
+
+# Cell text pandas' read_excel treats as missing, so both readers agree on
+# where the data ends and which cells are blank
+_NA_STRINGS = frozenset(
+    ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan"]
+    + ["1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None"]
+    + ["n/a", "nan", "null"]
+)
+
+# (enum, label used in errors, column position) for the classification columns
+_ENUM_COLUMNS = [
+    (Term, "Term", 1),
+    (AccountType, "Type", 2),
+    (Portfolio, "Portfolio", 3),
+    (AssetClass, "Asset Class", 4),
+]
+
 
 class ExcelParseError(Exception):
     """The workbook could not be parsed into accounts and values."""
@@ -46,6 +100,11 @@ class ParsedAccount:
 class ImportSummary:
     accounts_loaded: int
     values_loaded: int
+    values_inserted: int = 0
+    values_updated: int = 0
+    values_deleted: int = 0
+    # Rows written (inserted + updated + deleted) per second of import time
+    rows_per_second: float = 0.0
 
 
 def _parse_cell(cell_value) -> str | None:
@@ -71,13 +130,33 @@ def _parse_enum(enum_cls: type[Enum], cell_value, column: str, row_num: int):
         ) from None
 
 
-def parse_workbook(source: str | Path | BytesIO) -> dict[str, ParsedAccount]:
-    """
-    Parse the workbook into a map of account name -> ParsedAccount.
-    Raises ExcelParseError on any structural or value problem.
-    """
+def _resolve_engine(engine: str) -> str:
+    """The engine to use, falling back to openpyxl if calamine isn't installed."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown workbook engine '{engine}' (one of {ENGINES})")
+    if engine == "calamine" and not _CALAMINE_INSTALLED:
+        return "openpyxl"
+    return engine
+
+
+def report_engine(engine: str) -> None:
+    """Log the workbook engine at startup if it falls back from `engine`;
+    parsing itself stays quiet."""
+    resolved = _resolve_engine(engine)
+    if resolved != engine:
+        print(
+            f"python-calamine is not installed - reading workbooks with {resolved}",
+            flush=True,
+        )
+
+
+def _read_sheet(
+    source: str | Path | BinaryIO, engine: str = "openpyxl"
+) -> pd.DataFrame:
     try:
-        df = pd.read_excel(source, sheet_name=SHEET_NAME, header=0)
+        df = pd.read_excel(
+            source, sheet_name=SHEET_NAME, header=0, engine=_resolve_engine(engine)
+        )
     except ExcelParseError:
         raise
     except Exception as e:
@@ -88,67 +167,81 @@ def parse_workbook(source: str | Path | BytesIO) -> dict[str, ParsedAccount]:
             f"Sheet '{SHEET_NAME}' has {len(df.columns)} columns; expected the "
             "6 attribute columns plus at least one date column"
         )
+    return df
 
-    date_columns = [col for col in df.columns[6:] if not pd.isna(col)]
 
-    accounts: dict[str, ParsedAccount] = {}
+def _parse_header_date(column) -> datetime | None:
+    """A date column header as a midnight datetime, or None if it isn't one."""
+    if isinstance(column, (pd.Timestamp, datetime)):
+        date = pd.Timestamp(column).to_pydatetime()
+    else:
+        try:
+            date = pd.to_datetime(column).to_pydatetime()
+        except (ValueError, TypeError):
+            return None
+    return date.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    for idx, row in df.iterrows():
-        row_num = idx + 2  # +2 because header is row 1
 
-        # Summary rows (no Description) mark the end of account data
-        if pd.isna(row[df.columns[0]]):
-            break
+def parse_workbook(
+    source: str | Path | BinaryIO, reader: str = "pandas", engine: str = "openpyxl"
+) -> dict[str, ParsedAccount]:
+    """
+    Parse the workbook into a map of account name -> ParsedAccount.
+    `reader` is one of READERS and `engine` (used by the pandas reader) one of
+    ENGINES; every combination produces identical results.
+    Raises ExcelParseError on any structural or value problem.
+    """
+    if reader == "streaming":
+        return _parse_streaming(source)
+    if reader != "pandas":
+        raise ValueError(f"Unknown workbook reader '{reader}' (one of {READERS})")
+    return _parse_frame(_read_sheet(source, engine))
 
-        account_name = row[df.columns[5]]
-        if pd.isna(account_name):
-            continue
-        account_name = str(account_name).strip()
-
-        parsed = ParsedAccount(
-            name=account_name,
-            description=_parse_cell(row[df.columns[0]]),
-            term=_parse_enum(Term, row[df.columns[1]], "Term", row_num),
-            type=_parse_enum(AccountType, row[df.columns[2]], "Type", row_num),
-            portfolio=_parse_enum(Portfolio, row[df.columns[3]], "Portfolio", row_num),
-            asset_class=_parse_enum(
-                AssetClass, row[df.columns[4]], "Asset Class", row_num
-            ),
-        )
 
-        existing = accounts.setdefault(account_name, parsed)
-        if existing is not parsed and (
-            existing.term != parsed.term
-            or existing.type != parsed.type
-            or existing.portfolio != parsed.portfolio
-            or existing.asset_class != parsed.asset_class
-        ):
+def _is_missing(cell) -> bool:
+    """pandas.isna() for a raw openpyxl cell value."""
+    return cell is None or (isinstance(cell, str) and cell in _NA_STRINGS)
+
+
+def _parse_streaming(source: str | Path | BinaryIO) -> dict[str, ParsedAccount]:
+    """
+    Row-at-a-time parse straight from openpyxl's read-only worksheet. Only
+    the current row is held in memory and reading stops at the first row
+    without a Description, so summary rows below the data are never loaded.
+    """
+    try:
+        workbook = load_workbook(source, read_only=True, data_only=True)
+    except Exception as e:
+        raise ExcelParseError(f"Could not read sheet '{SHEET_NAME}': {e}") from e
+
+    try:
+        if SHEET_NAME not in workbook.sheetnames:
             raise ExcelParseError(
-                f"Account '{account_name}' has inconsistent attributes across rows "
-                f"(row {row_num} differs from an earlier row)"
+                f"Could not read sheet '{SHEET_NAME}': worksheet not found"
             )
+        rows = workbook[SHEET_NAME].iter_rows(values_only=True)
 
-        for date_col in date_columns:
-            value = row[date_col]
-            if pd.isna(value):
-                continue
-            try:
-                amount = float(value)
-            except (ValueError, TypeError):
-                continue
-
-            if isinstance(date_col, (pd.Timestamp, datetime)):
-                date = pd.Timestamp(date_col).to_pydatetime()
-            else:
-                try:
-                    date = pd.to_datetime(date_col).to_pydatetime()
-                except (ValueError, TypeError):
-                    continue
-            date = date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-            existing.values_by_date[date] = (
-                existing.values_by_date.get(date, 0.0) + amount
+        header = next(rows, ())
+        if len(header) < 7:
+            raise ExcelParseError(
+                f"Sheet '{SHEET_NAME}' has {len(header)} columns; expected the "
+                "6 attribute columns plus at least one date column"
             )
+        date_columns = [
+            (position, date)
+            for position, column in enumerate(header[6:], start=6)
+            if not _is_missing(column)
+            and (date := _parse_header_date(column)) is not None
+        ]
+
+        accounts: dict[str, ParsedAccount] = {}
+        for row_num, row in enumerate(rows, start=2):
+            # Summary rows (no Description) mark the end of account data
+            if not row or _is_missing(row[0]):
+                break
+            _add_row(accounts, row, date_columns, row_num)
+    finally:
+        workbook.close()
 
     if not accounts:
         raise ExcelParseError(f"No account rows found in sheet '{SHEET_NAME}'")
@@ -156,35 +249,417 @@ def parse_workbook(source: str | Path | BytesIO) -> dict[str, ParsedAccount]:
     return accounts
 
 
-def import_accounts(db: Session, parsed: dict[str, ParsedAccount]) -> ImportSummary:
+def _add_row(
+    accounts: dict[str, ParsedAccount],
+    row: tuple,
+    date_columns: list[tuple[int, datetime]],
+    row_num: int,
+) -> None:
+    """Merge one raw worksheet row into `accounts`."""
+    cells = [None if _is_missing(cell) else cell for cell in row]
+    cells += [None] * (max(7, len(row)) - len(row))
+
+    if cells[5] is None:
+        return
+    account_name = str(cells[5]).strip()
+
+    parsed = ParsedAccount(
+        name=account_name,
+        description=_parse_cell(cells[0]),
+        term=_parse_enum(Term, cells[1], "Term", row_num),
+        type=_parse_enum(AccountType, cells[2], "Type", row_num),
+        portfolio=_parse_enum(Portfolio, cells[3], "Portfolio", row_num),
+        asset_class=_parse_enum(AssetClass, cells[4], "Asset Class", row_num),
+    )
+
+    existing = accounts.setdefault(account_name, parsed)
+    if existing is not parsed and (
+        existing.term != parsed.term
+        or existing.type != parsed.type
+        or existing.portfolio != parsed.portfolio
+        or existing.asset_class != parsed.asset_class
+    ):
+        raise ExcelParseError(
+            f"Account '{account_name}' has inconsistent attributes across rows "
+            f"(row {row_num} differs from an earlier row)"
+        )
+
+    for position, date in date_columns:
+        value = cells[position] if position < len(cells) else None
+        if value is None:
+            continue
+        try:
+            amount = float(value)
+        except (ValueError, TypeError):
+            continue
+        existing.values_by_date[date] = existing.values_by_date.get(date, 0.0) + amount
+
+
+def _parse_frame(df: pd.DataFrame) -> dict[str, ParsedAccount]:
     """
-    Replace all accounts and values with the parsed data, in one transaction.
-    On failure the transaction is rolled back and the existing data is kept.
+    Vectorized parse: date headers are parsed once, enum columns are
+    validated per distinct value, and the value block is melted to long form
+    and summed per (account, date) with a single groupby.
     """
+    # Summary rows (no Description) mark the end of account data
+    empty_description = df.iloc[:, 0].isna().to_numpy()
+    cutoff = int(empty_description.argmax()) if empty_description.any() else len(df)
+    rows = df.iloc[:cutoff]
+    rows = rows[rows.iloc[:, 5].notna()]
+    if rows.empty:
+        raise ExcelParseError(f"No account rows found in sheet '{SHEET_NAME}'")
+
+    row_nums = rows.index.to_numpy() + 2  # +2 because header is row 1
+    names = rows.iloc[:, 5].astype(str).str.strip().to_numpy()
+
+    # Validate the classification columns one distinct value at a time. The
+    # loop-based parser raised the first problem in row order (Term, Type,
+    # Portfolio, Asset Class, then the consistency check), so collect the
+    # earliest offending row per check and raise the earliest overall.
+    errors: list[tuple[int, int, ExcelParseError]] = []
+    attributes: list[list] = []
+    normalised: list[pd.Series] = []
+    for check, (enum_cls, label, position) in enumerate(_ENUM_COLUMNS):
+        cells = rows.iloc[:, position].map(_parse_cell)
+        lookup = {}
+        for value in cells.dropna().unique():
+            try:
+                lookup[value] = enum_cls(value)
+            except ValueError:
+                lookup[value] = None
+                bad_row = int(row_nums[(cells == value).to_numpy()].min())
+                allowed = ", ".join(e.value for e in enum_cls)
+                errors.append(
+                    (
+                        bad_row,
+                        check,
+                        ExcelParseError(
+                            f"Row {bad_row}: invalid {label} '{value}' "
+                            f"(allowed: {allowed})"
+                        ),
+                    )
+                )
+        attributes.append([lookup.get(v) for v in cells])
+        normalised.append(cells.fillna(""))
+
+    # Duplicate rows must agree with the first row for their account
+    signature = pd.Series(
+        ["\x1f".join(parts) for parts in zip(*normalised)], index=names
+    )
+    first_signature = signature[~signature.index.duplicated()]
+    inconsistent = signature.to_numpy() != first_signature.reindex(names).to_numpy()
+    if inconsistent.any():
+        position = int(inconsistent.argmax())
+        errors.append(
+            (
+                int(row_nums[position]),
+                len(_ENUM_COLUMNS),
+                ExcelParseError(
+                    f"Account '{names[position]}' has inconsistent attributes "
+                    f"across rows (row {row_nums[position]} differs from an "
+                    "earlier row)"
+                ),
+            )
+        )
+    if errors:
+        raise min(errors, key=lambda e: (e[0], e[1]))[2]
+
+    descriptions = [_parse_cell(v) for v in rows.iloc[:, 0]]
+    accounts: dict[str, ParsedAccount] = {}
+    for i, name in enumerate(names):
+        if name not in accounts:
+            accounts[name] = ParsedAccount(
+                name=name,
+                description=descriptions[i],
+                term=attributes[0][i],
+                type=attributes[1][i],
+                portfolio=attributes[2][i],
+                asset_class=attributes[3][i],
+            )
+
+    # Parse each date header once; columns whose header isn't a date are dropped
+    codes: dict[datetime, int] = {}
+    date_positions: list[int] = []
+    date_codes: list[int] = []
+    for position, column in enumerate(df.columns[6:], start=6):
+        if pd.isna(column):
+            continue
+        date = _parse_header_date(column)
+        if date is None:
+            continue
+        date_positions.append(position)
+        date_codes.append(codes.setdefault(date, len(codes)))
+    if not date_positions:
+        return accounts
+
+    block = rows.iloc[:, date_positions].copy()
+    block.columns = date_codes
+    block.insert(0, "_account", names)
+    long = block.melt(id_vars="_account", var_name="_date", value_name="_amount")
+    long["_amount"] = pd.to_numeric(long["_amount"], errors="coerce")
+    long = long.dropna(subset=["_amount"])
+    totals = long.groupby(["_account", "_date"], sort=False)["_amount"].sum()
+
+    dates = list(codes)
+    for (name, code), amount in zip(totals.index.tolist(), totals.tolist()):
+        accounts[name].values_by_date[dates[code]] = amount
+
+    return accounts
+
+
+def import_accounts(
+    db: Session, parsed: dict[str, ParsedAccount], mode: str = "replace"
+) -> ImportSummary:
+    """
+    Bring the accounts and values tables in line with the parsed data, in one
+    transaction. On failure the transaction is rolled back and the existing
+    data is kept.
+
+    "replace" deletes everything and bulk-inserts the parsed data;
+    "incremental" diffs against the database and only writes the accounts
+    and (account, date) points that changed; "swap" bulk-loads and indexes
+    staging tables, then swaps them in with a quick rename, so the write
+    lock readers wait on is held for milliseconds whatever the data size.
+    """
+    if mode not in IMPORT_MODES:
+        raise ValueError(f"Unknown import mode '{mode}' (one of {IMPORT_MODES})")
+
+    started = time.perf_counter()
     try:
-        # Bulk deletes bypass ORM cascade, so delete values explicitly first
-        db.query(Value).delete()
-        db.query(Account).delete()
-
-        values_loaded = 0
-        for account in parsed.values():
-            db.add(
-                Account(
-                    name=account.name,
-                    description=account.description,
-                    term=account.term,
-                    type=account.type,
-                    portfolio=account.portfolio,
-                    asset_class=account.asset_class,
+        if mode == "incremental":
+            inserted, updated, deleted = _apply_diff(db, parsed)
+        elif mode == "swap":
+            inserted, updated, deleted = _load_and_swap(db, parsed)
+        else:
+            inserted, updated, deleted = _replace_all(db, parsed)
+        data_version.bump(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    elapsed = time.perf_counter() - started
+    written = inserted + updated + deleted
+    return ImportSummary(
+        accounts_loaded=len(parsed),
+        values_loaded=sum(len(a.values_by_date) for a in parsed.values()),
+        values_inserted=inserted,
+        values_updated=updated,
+        values_deleted=deleted,
+        rows_per_second=written / elapsed if elapsed else 0.0,
+    )
+
+
+def _account_row(account: ParsedAccount) -> dict:
+    return {
+        "name": account.name,
+        "description": account.description,
+        "term": account.term,
+        "type": account.type,
+        "portfolio": account.portfolio,
+        "asset_class": account.asset_class,
+    }
+
+
+def _insert_values(db: Session, rows) -> int:
+    """executemany INSERT of value mappings in INSERT_BATCH_SIZE batches."""
+    inserted = 0
+    for batch in batched(rows, INSERT_BATCH_SIZE):
+        db.execute(insert(Value.__table__), list(batch))
+        inserted += len(batch)
+    return inserted
+
+
+def _account_ids(db: Session, accounts=Account.__table__) -> dict[str, int]:
+    return dict(db.execute(select(accounts.c.name, accounts.c.id)).all())
+
+
+def _value_rows(parsed: dict[str, ParsedAccount], ids: dict[str, int]):
+    """Value mappings for every parsed point, dates stored as days."""
+    return (
+        {"account_id": ids[account.name], "amount": amount, "date": date.date()}
+        for account in parsed.values()
+        for date, amount in account.values_by_date.items()
+    )
+
+
+def _replace_all(db: Session, parsed: dict[str, ParsedAccount]) -> tuple[int, int, int]:
+    """
+    Wipe and reload. Rows go in through Core executemany INSERTs, skipping
+    ORM object construction and the identity map.
+    """
+    # Bulk deletes bypass ORM cascade, so delete values explicitly first
+    deleted = db.query(Value).delete()
+    db.query(Account).delete()
+
+    db.execute(insert(Account.__table__), [_account_row(a) for a in parsed.values()])
+    inserted = _insert_values(db, _value_rows(parsed, _account_ids(db)))
+    return inserted, 0, deleted
+
+
+def _apply_diff(db: Session, parsed: dict[str, ParsedAccount]) -> tuple[int, int, int]:
+    """Insert, update and delete only what differs from the parsed data."""
+    accounts = Account.__table__
+    values = Value.__table__
+
+    current_accounts = {
+        row["name"]: row for row in db.execute(select(accounts)).mappings()
+    }
+    current_values = {
+        (row.account_id, row.date): (row.id, row.amount)
+        for row in db.execute(
+            select(values.c.id, values.c.account_id, values.c.date, values.c.amount)
+        )
+    }
+
+    # (account name, day, amount): new accounts have no id until inserted
+    new_values = []
+    changed_values = []
+    for account in parsed.values():
+        current_account = current_accounts.get(account.name)
+        account_id = current_account["id"] if current_account else None
+        for date, amount in account.values_by_date.items():
+            day = date.date()
+            current = current_values.pop((account_id, day), None)
+            if current is None:
+                new_values.append((account.name, day, amount))
+            elif current[1] != amount:
+                changed_values.append({"b_id": current[0], "b_amount": amount})
+    # Whatever wasn't matched above has vanished from the workbook
+    vanished_values = [{"b_id": value_id} for value_id, _ in current_values.values()]
+
+    if vanished_values:
+        db.execute(
+            delete(values).where(values.c.id == bindparam("b_id")), vanished_values
+        )
+    removed_accounts = [
+        {"b_name": name} for name in current_accounts if name not in parsed
+    ]
+    if removed_accounts:
+        db.execute(
+            delete(accounts).where(accounts.c.name == bindparam("b_name")),
+            removed_accounts,
+        )
+
+    new_accounts = []
+    changed_accounts = []
+    for account in parsed.values():
+        row = _account_row(account)
+        current = current_accounts.get(account.name)
+        if current is None:
+            new_accounts.append(row)
+        elif any(current[key] != value for key, value in row.items()):
+            changed_accounts.append({f"b_{key}": value for key, value in row.items()})
+    if new_accounts:
+        db.execute(insert(accounts), new_accounts)
+    if changed_accounts:
+        db.execute(
+            update(accounts)
+            .where(accounts.c.name == bindparam("b_name"))
+            .values({key: bindparam(f"b_{key}") for key in _ACCOUNT_ATTRIBUTES}),
+            changed_accounts,
+        )
+
+    if changed_values:
+        db.execute(
+            update(values)
+            .where(values.c.id == bindparam("b_id"))
+            .values(amount=bindparam("b_amount")),
+            changed_values,
+        )
+    ids = (
+        _account_ids(db)
+        if new_accounts
+        else {name: row["id"] for name, row in current_accounts.items()}
+    )
+    inserted = _insert_values(
+        db,
+        (
+            {"account_id": ids[name], "amount": amount, "date": day}
+            for name, day, amount in new_values
+        ),
+    )
+
+    return inserted, len(changed_values), len(vanished_values)
+
+
+def _staging_name(name: str) -> str:
+    """
+    Staging copy of a table or index name. Index names are global in SQLite
+    and survive the rename, so a live index that is itself a former staging
+    index alternates back to the plain name.
+    """
+    if name.endswith(STAGING_SUFFIX):
+        return name.removesuffix(STAGING_SUFFIX)
+    return name + STAGING_SUFFIX
+
+
+def _load_and_swap(
+    db: Session, parsed: dict[str, ParsedAccount]
+) -> tuple[int, int, int]:
+    """
+    Build accounts_next/values_next from the live tables' own DDL, load and
+    index them outside any lock readers care about, then drop the live tables
+    and rename the staging ones into place in one short IMMEDIATE
+    transaction. On failure the staging tables are simply dropped.
+    """
+    conn = db.connection()
+    schema = conn.exec_driver_sql(
+        "SELECT type, name, sql FROM sqlite_master "
+        f"WHERE tbl_name IN ({', '.join('?' * len(_IMPORT_TABLES))}) "
+        "AND sql IS NOT NULL",
+        _IMPORT_TABLES,
+    ).all()
+    tables = {name: sql for type_, name, sql in schema if type_ == "table"}
+    indexes = [(name, sql) for type_, name, sql in schema if type_ == "index"]
+    deleted = db.query(Value).count()
+
+    staging = MetaData()
+    staged = {
+        name: model.__table__.to_metadata(staging, name=name + STAGING_SUFFIX)
+        for name, model in (("accounts", Account), ("values", Value))
+    }
+    try:
+        for name in _IMPORT_TABLES:
+            conn.exec_driver_sql(f'DROP TABLE IF EXISTS "{name}{STAGING_SUFFIX}"')
+            conn.exec_driver_sql(
+                _CREATE_TABLE.sub(
+                    f'CREATE TABLE "{name}{STAGING_SUFFIX}"', tables[name], count=1
                 )
             )
-            for date, amount in account.values_by_date.items():
-                db.add(Value(account_name=account.name, amount=amount, date=date))
-                values_loaded += 1
 
+        db.execute(
+            insert(staged["accounts"]), [_account_row(a) for a in parsed.values()]
+        )
+        inserted = 0
+        rows = _value_rows(parsed, _account_ids(db, staged["accounts"]))
+        for batch in batched(rows, INSERT_BATCH_SIZE):
+            db.execute(insert(staged["values"]), list(batch))
+            inserted += len(batch)
+
+        # Index after loading: one sort per index instead of per-row upkeep
+        for name, sql in indexes:
+            m = _CREATE_INDEX.match(sql)
+            conn.exec_driver_sql(
+                f'{m["head"]}"{_staging_name(name)}" ON '
+                f'"{m["table"]}{STAGING_SUFFIX}"{sql[m.end() :]}'
+            )
         db.commit()
+
+        conn = db.connection()
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        for name in reversed(_IMPORT_TABLES):
+            conn.exec_driver_sql(f'DROP TABLE "{name}"')
+        for name in _IMPORT_TABLES:
+            conn.exec_driver_sql(
+                f'ALTER TABLE "{name}{STAGING_SUFFIX}" RENAME TO "{name}"'
+            )
     except Exception:
         db.rollback()
+        conn = db.connection()
+        for name in _IMPORT_TABLES:
+            conn.exec_driver_sql(f'DROP TABLE IF EXISTS "{name}{STAGING_SUFFIX}"')
+        db.commit()
         raise
 
-    return ImportSummary(accounts_loaded=len(parsed), values_loaded=values_loaded)
+    return inserted, 0, deleted
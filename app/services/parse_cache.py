@@ -0,0 +1,83 @@
+"""
+On-disk cache of the last parsed workbook, keyed by its content hash.
+
+Lets a sync re-import unchanged bytes (e.g. after restoring the database,
+or a forced sync) without downloading or parsing the xlsx again. Stored as
+gzipped JSON; only the newest entry is kept.
+"""
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+from app.enums import AccountType, AssetClass, Portfolio, Term
+from app.services.importer import ParsedAccount
+
+CACHE_DIR = Path("cache")
+FORMAT_VERSION = 1
+
+
+def _path(content_hash: str) -> Path:
+    return CACHE_DIR / f"parsed-{content_hash}.json.gz"
+
+
+def store(content_hash: str, parsed: dict[str, ParsedAccount]) -> None:
+    """Cache `parsed` under `content_hash`, replacing any older entry."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    payload = {
+        "version": FORMAT_VERSION,
+        "accounts": [
+            [
+                account.name,
+                account.description,
+                account.term and account.term.value,
+                account.type and account.type.value,
+                account.portfolio and account.portfolio.value,
+                account.asset_class and account.asset_class.value,
+                [
+                    [date.strftime("%Y-%m-%d"), amount]
+                    for date, amount in account.values_by_date.items()
+                ],
+            ]
+            for account in parsed.values()
+        ],
+    }
+    dest = _path(content_hash)
+    tmp = dest.with_suffix(".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    tmp.replace(dest)
+
+    for old in CACHE_DIR.glob("parsed-*.json.gz"):
+        if old != dest:
+            old.unlink()
+
+
+def load(content_hash: str) -> dict[str, ParsedAccount] | None:
+    """The cached parse for `content_hash`, or None on a miss."""
+    path = _path(content_hash)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != FORMAT_VERSION:
+        return None
+
+    parsed = {}
+    for name, description, term, type_, portfolio, asset_class, values in payload[
+        "accounts"
+    ]:
+        parsed[name] = ParsedAccount(
+            name=name,
+            description=description,
+            term=term and Term(term),
+            type=type_ and AccountType(type_),
+            portfolio=portfolio and Portfolio(portfolio),
+            asset_class=asset_class and AssetClass(asset_class),
+            values_by_date={
+                datetime.strptime(date, "%Y-%m-%d"): amount for date, amount in values
+            },
+        )
+    return parsed
@@ -0,0 +1,126 @@
+"""
+Periodic Drive sync.
+
+Polling is cheap - an unchanged file costs one metadata request - so the
+scheduler simply submits a sync job every interval on its own thread. After
+a sync that changed data it polls faster for a while (edits tend to come in
+bursts), and after failures it backs off exponentially - Drive being down,
+a broken workbook or missing credentials all take a while to fix. Every
+delay gets random jitter. It isn't started at all without a DRIVE_FILE_ID.
+"""
+
+import random
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from app.services.sync_jobs import SyncJob, SyncJobs
+
+FAST_INTERVAL = timedelta(minutes=2)
+FAST_WINDOW = timedelta(minutes=30)
+MAX_BACKOFF = timedelta(hours=2)
+JITTER = 0.1  # +/- fraction of each delay
+
+
+@dataclass
+class ScheduleState:
+    interval: timedelta
+    next_run_at: datetime | None = None
+    last_run_at: datetime | None = None
+    # "unchanged", "changed" or "failed"
+    last_result: str | None = None
+    consecutive_failures: int = 0
+    fast_until: datetime | None = None
+
+
+class SyncScheduler:
+    def __init__(self, jobs: SyncJobs, interval: timedelta, rng=random):
+        self._jobs = jobs
+        self._rng = rng
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.state = ScheduleState(interval=interval)
+
+    def start(self) -> None:
+        self._schedule(self.state.interval)
+        self._thread = threading.Thread(
+            target=self._loop, name="sync-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _schedule(self, delay: timedelta) -> None:
+        self.state.next_run_at = datetime.now(UTC) + delay
+
+    def _loop(self) -> None:
+        while True:
+            delay = self.state.next_run_at - datetime.now(UTC)
+            if self._stop.wait(max(delay.total_seconds(), 0)):
+                return
+            job = self._jobs.submit()
+            job.done.wait()
+            self._record(job)
+
+    def _record(self, job: SyncJob) -> None:
+        """Update the state from a finished job and schedule the next run."""
+        now = datetime.now(UTC)
+        state = self.state
+        state.last_run_at = now
+        if job.status == "failed":
+            state.last_result = "failed"
+            state.consecutive_failures += 1
+        else:
+            state.consecutive_failures = 0
+            if job.outcome.skipped:
+                state.last_result = "unchanged"
+            else:
+                state.last_result = "changed"
+                state.fast_until = now + FAST_WINDOW
+        self._schedule(self._next_delay(job, now))
+
+    def _next_delay(self, job: SyncJob, now: datetime) -> timedelta:
+        state = self.state
+        if job.status == "failed":
+            delay = min(
+                MAX_BACKOFF, state.interval * 2 ** min(state.consecutive_failures, 16)
+            )
+        elif state.fast_until is not None and now < state.fast_until:
+            delay = min(FAST_INTERVAL, state.interval)
+        else:
+            delay = state.interval
+        return delay * self._rng.uniform(1 - JITTER, 1 + JITTER)
+
+
+_scheduler: SyncScheduler | None = None
+
+
+def start_scheduler(
+    jobs: SyncJobs, interval: timedelta | None, drive_file_id: str | None
+) -> None:
+    """Start the process-wide scheduler; interval None disables it, and so
+    does a missing drive_file_id, since every run would fail."""
+    global _scheduler
+    if interval is None:
+        print("Periodic sync disabled (SYNC_INTERVAL_MINUTES=0)", flush=True)
+        return
+    if drive_file_id is None:
+        print("Periodic sync disabled (DRIVE_FILE_ID not set)", flush=True)
+        return
+    _scheduler = SyncScheduler(jobs, interval)
+    _scheduler.start()
+    print(f"Polling Drive for changes every {interval}", flush=True)
+
+
+def stop_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop()
+        _scheduler = None
+
+
+def current_scheduler() -> SyncScheduler | None:
+    return _scheduler
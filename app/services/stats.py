@@ -0,0 +1,143 @@
+"""
+Dashboard figures computed in SQL: net worth, assets and liabilities at the
+latest date with the change since the previous date and since the end of
+last year, and the per-account change between the latest two dates.
+
+Totals are per date across all accounts, as the charts draw them. Each
+function reads only the few dates it needs, through the date index.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.enums import AccountType
+from app.models.account import Account
+from app.models.value import Value
+
+
+@dataclass
+class Delta:
+    amount: float
+    # None when the baseline is zero
+    pct: float | None
+    baseline_date: date
+
+
+@dataclass
+class Summary:
+    latest_date: date
+    net_worth: float
+    assets: float
+    liabilities: float
+    # Since the previous date, and since the last date of the previous year
+    month_delta: Delta | None
+    ytd_delta: Delta | None
+
+
+@dataclass
+class AccountChange:
+    name: str
+    # None where the account has no value on that date
+    previous: float | None
+    current: float | None
+    change: float
+    pct: float | None
+
+
+@dataclass
+class MonthlyChanges:
+    previous_date: date
+    current_date: date
+    # Largest absolute change first
+    changes: list[AccountChange]
+    total_change: float
+
+
+def _pct(change: float, baseline: float | None) -> float | None:
+    return change / abs(baseline) * 100 if baseline else None
+
+
+def _delta(current: float, baseline: tuple[date, float] | None) -> Delta | None:
+    if baseline is None:
+        return None
+    day, total = baseline
+    return Delta(current - total, _pct(current - total, total), day)
+
+
+def _totals(db: Session, before: date | None = None, limit: int = 2):
+    """(date, total) for the latest `limit` dates, optionally before a date,
+    newest first."""
+    query = select(Value.date, func.sum(Value.amount)).group_by(Value.date)
+    if before is not None:
+        query = query.where(Value.date < before)
+    return db.execute(query.order_by(Value.date.desc()).limit(limit)).all()
+
+
+def summary(db: Session) -> Summary | None:
+    """Headline figures at the latest date, or None with no values yet."""
+    totals = _totals(db)
+    if not totals:
+        return None
+    latest_date, net_worth = totals[0]
+    prior_year = _totals(db, before=date(latest_date.year, 1, 1), limit=1)
+
+    # Account type decides, falling back to the amount's sign where unset
+    liability = (Account.type == AccountType.LIABILITY) | (
+        Account.type.is_(None) & (Value.amount < 0)
+    )
+    assets, liabilities = db.execute(
+        select(
+            func.sum(case((liability, 0.0), else_=Value.amount)),
+            func.sum(case((liability, Value.amount), else_=0.0)),
+        )
+        .join(Value.account)
+        .where(Value.date == latest_date)
+    ).one()
+
+    return Summary(
+        latest_date=latest_date,
+        net_worth=net_worth,
+        assets=assets,
+        liabilities=liabilities,
+        month_delta=_delta(net_worth, totals[1] if len(totals) > 1 else None),
+        ytd_delta=_delta(net_worth, prior_year[0] if prior_year else None),
+    )
+
+
+def monthly_changes(db: Session) -> MonthlyChanges | None:
+    """Each account's change between the latest two dates, or None with
+    fewer than two."""
+    dates = db.scalars(
+        select(Value.date).distinct().order_by(Value.date.desc()).limit(2)
+    ).all()
+    if len(dates) < 2:
+        return None
+    current_date, previous_date = dates
+
+    amounts: dict[str, dict[date, float]] = {}
+    for name, day, amount in db.execute(
+        select(Account.name, Value.date, Value.amount)
+        .join(Value.account)
+        .where(Value.date.in_(dates))
+    ):
+        amounts.setdefault(name, {})[day] = amount
+
+    changes = []
+    for name, by_date in amounts.items():
+        previous = by_date.get(previous_date)
+        current = by_date.get(current_date)
+        change = (current or 0.0) - (previous or 0.0)
+        changes.append(
+            AccountChange(name, previous, current, change, _pct(change, previous))
+        )
+    changes.sort(key=lambda c: abs(c.change), reverse=True)
+
+    return MonthlyChanges(
+        previous_date=previous_date,
+        current_date=current_date,
+        changes=changes,
+        total_change=sum(c.change for c in changes),
+    )
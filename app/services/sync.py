@@ -1,24 +1,66 @@
 """Orchestrates a full sync: Drive download -> parse -> DB reload."""
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from io import BytesIO
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 
 from sqlalchemy.orm import Session
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 from app.models.account import Account
 from app.models.sync_state import SyncState
 from app.models.value import Value
-from app.services.backup import snapshot_db
-from app.services.drive import DriveClient, DriveConfigError
+from app.services import parse_cache
+from app.services.backup import BackgroundSnapshot
+from app.services.drive import DriveClient, DriveMetadata, RequestTiming
 from app.services.importer import import_accounts, parse_workbook
 
+# Phases of a sync, in order; skipped syncs stop after metadata (or download)
+PHASES = ("auth", "metadata", "download", "parse", "snapshot", "import")
+
 
 class SyncNotConfigured(Exception):
     pass
 
 
+@dataclass
+class SyncProgress:
+    """
+    Live progress of one sync. Written by the syncing thread and read by
+    status requests, so every field is a plain value replaced atomically.
+    """
+
+    phase: str | None = None
+    bytes_downloaded: int = 0
+    rows_imported: int = 0
+    # Pages of the pre-import database snapshot copied so far
+    backup_pages: int = 0
+    backup_total_pages: int = 0
+    # Wall-clock seconds spent in each phase reached so far
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def track(self, phase: str) -> Iterator[None]:
+        self.phase = phase
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings = {
+                **self.timings,
+                phase: self.timings.get(phase, 0.0) + time.perf_counter() - started,
+            }
+
+    def downloaded(self, size: int) -> None:
+        self.bytes_downloaded = size
+
+    def backed_up(self, pages: int, total: int) -> None:
+        self.backup_total_pages = total
+        self.backup_pages = pages
+
+
 @dataclass
 class SyncOutcome:
     accounts_loaded: int
@@ -26,22 +68,73 @@ class SyncOutcome:
     file_name: str
     drive_modified_time: str
     skipped: bool = False
+    values_inserted: int = 0
+    values_updated: int = 0
+    values_deleted: int = 0
+    # Latency and retries of each Drive request made by this sync
+    drive_requests: list[RequestTiming] = field(default_factory=list)
+
+
+def _skipped(db: Session, metadata: DriveMetadata) -> SyncOutcome:
+    return SyncOutcome(
+        accounts_loaded=db.query(Account).count(),
+        values_loaded=db.query(Value).count(),
+        file_name=metadata.name,
+        drive_modified_time=metadata.modified_time,
+        skipped=True,
+    )
+
+
+def _record_unchanged(
+    db: Session, state: SyncState, metadata: DriveMetadata
+) -> SyncOutcome:
+    """The file was touched but its bytes are identical: remember the new
+    modifiedTime so the next sync short-circuits on metadata alone."""
+    state.drive_modified_time = metadata.modified_time
+    state.file_name = metadata.name
+    db.commit()
+    return _skipped(db, metadata)
 
 
-def run_drive_sync(db: Session, force: bool = False) -> SyncOutcome:
+def run_drive_sync(
+    db: Session, force: bool = False, progress: SyncProgress | None = None
+) -> SyncOutcome:
     """
     Reload the DB from the Drive workbook. Skips the reload when the file
-    hasn't changed since the last sync (unless force=True).
+    hasn't changed since the last sync (unless force=True): first on Drive's
+    modifiedTime, then on the content hash, so a re-saved but identical
+    workbook is neither parsed nor imported. Changes are applied
+    incrementally; force=True does a full wipe-and-reload instead, reusing
+    the cached parse when the bytes are unchanged.
+    The database is snapshotted in the background while the workbook is
+    downloaded and parsed; the import waits for it to finish.
+    Phase timings, bytes downloaded, snapshot pages copied and rows
+    imported are reported through `progress` as the sync runs.
     Raises SyncNotConfigured / DriveConfigError / DriveError / ExcelParseError.
     """
+    progress = progress or SyncProgress()
     settings = get_settings()
     if not settings.drive_file_id:
         raise SyncNotConfigured(
             "Drive sync is not configured: set DRIVE_FILE_ID in .env"
         )
 
-    client = DriveClient(settings.service_account_file)
-    metadata = client.get_metadata(settings.drive_file_id)
+    with progress.track("auth"):
+        client = DriveClient(settings.service_account_file)
+    outcome = _sync(db, client, settings, force, progress)
+    outcome.drive_requests = client.timings
+    return outcome
+
+
+def _sync(
+    db: Session,
+    client: DriveClient,
+    settings: Settings,
+    force: bool,
+    progress: SyncProgress,
+) -> SyncOutcome:
+    with progress.track("metadata"):
+        metadata = client.get_metadata(settings.drive_file_id)
 
     state = db.get(SyncState, 1)
     if (
@@ -49,26 +142,62 @@ def run_drive_sync(db: Session, force: bool = False) -> SyncOutcome:
         and state is not None
         and state.drive_modified_time == metadata.modified_time
     ):
-        return SyncOutcome(
-            accounts_loaded=db.query(Account).count(),
-            values_loaded=db.query(Value).count(),
-            file_name=metadata.name,
-            drive_modified_time=metadata.modified_time,
-            skipped=True,
-        )
-
-    content = client.download(settings.drive_file_id, metadata.mime_type)
-    parsed = parse_workbook(BytesIO(content))
-
-    snapshot_db()
-    summary = import_accounts(db, parsed)
+        return _skipped(db, metadata)
+
+    def unchanged(content_hash: str) -> bool:
+        return not force and state is not None and state.content_hash == content_hash
+
+    # Drive reports an md5 for binary files, so those can be checked (and
+    # served from the parse cache) without downloading anything
+    content_hash = metadata.md5_checksum
+    if content_hash and unchanged(content_hash):
+        return _record_unchanged(db, state, metadata)
+
+    # An import is likely now: snapshot the database while downloading and
+    # parsing. If the downloaded bytes turn out unchanged after all, it
+    # finishes in the background - the next snapshot waits for it.
+    snapshot = BackgroundSnapshot(progress=progress.backed_up)
+    with progress.track("parse"):
+        parsed = parse_cache.load(content_hash) if content_hash else None
+
+    if parsed is None:
+        with progress.track("download"):
+            download = client.download(
+                settings.drive_file_id,
+                metadata.mime_type,
+                settings.max_download_bytes,
+                on_progress=progress.downloaded,
+            )
+        with download.file:
+            content_hash = content_hash or download.md5
+            if unchanged(content_hash):
+                return _record_unchanged(db, state, metadata)
+            with progress.track("parse"):
+                parsed = parse_cache.load(content_hash)
+                if parsed is None:
+                    parsed = parse_workbook(
+                        download.file,
+                        reader=settings.workbook_reader,
+                        engine=settings.workbook_engine,
+                    )
+                    parse_cache.store(content_hash, parsed)
+
+    # Time spent waiting for the snapshot, not the whole copy
+    with progress.track("snapshot"):
+        snapshot.wait()
+    with progress.track("import"):
+        summary = import_accounts(db, parsed, mode="swap" if force else "incremental")
+    progress.rows_imported = (
+        summary.values_inserted + summary.values_updated + summary.values_deleted
+    )
 
     db.merge(
         SyncState(
             id=1,
             file_name=metadata.name,
             drive_modified_time=metadata.modified_time,
-            synced_at=datetime.now(timezone.utc),
+            content_hash=content_hash,
+            synced_at=datetime.now(UTC),
         )
     )
     db.commit()
@@ -78,31 +207,7 @@ def run_drive_sync(db: Session, force: bool = False) -> SyncOutcome:
         values_loaded=summary.values_loaded,
         file_name=metadata.name,
         drive_modified_time=metadata.modified_time,
+        values_inserted=summary.values_inserted,
+        values_updated=summary.values_updated,
+        values_deleted=summary.values_deleted,
     )
-
-
-def sync_on_startup() -> None:
-    """Best-effort sync at application startup; never raises."""
-    from app.database import SessionLocal
-
-    db = SessionLocal()
-    try:
-        print("Syncing from Google Drive...", flush=True)
-        outcome = run_drive_sync(db)
-        if outcome.skipped:
-            print(
-                f"Startup sync: '{outcome.file_name}' unchanged since last sync",
-                flush=True,
-            )
-        else:
-            print(
-                f"Startup sync: {outcome.accounts_loaded} accounts, "
-                f"{outcome.values_loaded} values from '{outcome.file_name}'",
-                flush=True,
-            )
-    except (SyncNotConfigured, DriveConfigError) as e:
-        print(f"Skipping startup sync - {e}", flush=True)
-    except Exception as e:
-        print(f"Startup sync failed ({e}) - serving existing data", flush=True)
-    finally:
-        db.close()
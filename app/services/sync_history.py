@@ -0,0 +1,111 @@
+"""
+History of sync runs, for working out where a slow sync spends its time.
+
+Every finished job is stored as a SyncRun row with its per-phase wall-clock
+durations, bytes downloaded and row counts, keeping the newest KEEP_RUNS;
+phase_percentiles() summarises the most recent runs that did the work.
+Skipped runs (the scheduler's polls of an unchanged file) are left out of
+it, or they would crowd the real syncs out of the window.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.sync_run import SyncRun
+from app.services.sync import PHASES
+
+if TYPE_CHECKING:
+    from app.services.sync_jobs import SyncJob
+
+# Runs summarised by phase_percentiles() unless asked otherwise
+DEFAULT_WINDOW = 50
+# Rows kept in sync_runs; older ones are deleted as new ones are recorded
+KEEP_RUNS = 1000
+
+
+@dataclass
+class PhaseStats:
+    runs: int
+    p50: float
+    p95: float
+
+
+def record_run(db: Session, job: SyncJob) -> SyncRun:
+    """Store a finished job as a SyncRun row, drop all but the newest
+    KEEP_RUNS, and commit."""
+    outcome = job.outcome
+    if job.status == "failed":
+        status = "failed"
+    else:
+        status = "skipped" if outcome.skipped else "succeeded"
+    run = SyncRun(
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        force=job.force,
+        status=status,
+        error=job.error,
+        error_kind=job.error_kind,
+        bytes_downloaded=job.progress.bytes_downloaded,
+        **{f"{phase}_seconds": job.progress.timings.get(phase) for phase in PHASES},
+    )
+    if outcome is not None:
+        run.accounts_loaded = outcome.accounts_loaded
+        run.values_loaded = outcome.values_loaded
+        run.values_inserted = outcome.values_inserted
+        run.values_updated = outcome.values_updated
+        run.values_deleted = outcome.values_deleted
+    db.add(run)
+    db.flush()
+    db.execute(
+        delete(SyncRun).where(
+            SyncRun.id
+            <= select(SyncRun.id)
+            .order_by(SyncRun.id.desc())
+            .offset(KEEP_RUNS)
+            .limit(1)
+            .scalar_subquery()
+        )
+    )
+    db.commit()
+    return run
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Linear interpolation between the closest ranks of a sorted list."""
+    rank = (len(ordered) - 1) * q
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def phase_percentiles(
+    db: Session, window: int = DEFAULT_WINDOW
+) -> dict[str, PhaseStats]:
+    """p50/p95 of each phase's duration over the last `window` runs that
+    weren't skipped, counting only the runs that reached the phase."""
+    runs = (
+        db.query(SyncRun)
+        .filter(SyncRun.status != "skipped")
+        .order_by(SyncRun.id.desc())
+        .limit(window)
+        .all()
+    )
+    stats = {}
+    for phase in PHASES:
+        durations = sorted(
+            seconds
+            for run in runs
+            if (seconds := getattr(run, f"{phase}_seconds")) is not None
+        )
+        if durations:
+            stats[phase] = PhaseStats(
+                runs=len(durations),
+                p50=_percentile(durations, 0.50),
+                p95=_percentile(durations, 0.95),
+            )
+    return stats
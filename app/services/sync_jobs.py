@@ -0,0 +1,189 @@
+"""
+Drive syncs as background jobs.
+
+A sync can take tens of seconds on a slow network, so it runs on a worker
+thread and callers get a job to poll instead of waiting. Only one sync runs
+at a time - overlapping reloads would corrupt the data - and submitting
+while one is running returns that job rather than starting another.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.services.drive import DriveConfigError, DriveError
+from app.services.importer import ExcelParseError
+from app.services.sync import (
+    SyncNotConfigured,
+    SyncOutcome,
+    SyncProgress,
+    run_drive_sync,
+)
+from app.services.sync_history import record_run
+
+# Finished jobs kept around for status lookups
+KEEP_FINISHED = 20
+
+
+@dataclass
+class SyncJob:
+    id: str
+    force: bool
+    status: str = "queued"  # queued | running | succeeded | failed
+    progress: SyncProgress = field(default_factory=SyncProgress)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    outcome: SyncOutcome | None = None
+    error: str | None = None
+    # "not_configured", "drive", "parse" or "internal" when failed
+    error_kind: str | None = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.done.is_set()
+
+
+def _error_kind(error: Exception) -> str:
+    if isinstance(error, (SyncNotConfigured, DriveConfigError)):
+        return "not_configured"
+    if isinstance(error, DriveError):
+        return "drive"
+    if isinstance(error, ExcelParseError):
+        return "parse"
+    return "internal"
+
+
+def _default_session() -> Session:
+    from app.database import SessionLocal
+
+    return SessionLocal()
+
+
+class SyncJobs:
+    def __init__(
+        self,
+        run: Callable[..., SyncOutcome] = run_drive_sync,
+        session_factory: Callable[[], Session] = _default_session,
+        record_run: Callable[[Session, SyncJob], object] = record_run,
+    ):
+        self._run = run
+        self._session_factory = session_factory
+        self._record_run = record_run
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, SyncJob] = OrderedDict()
+        self._active: SyncJob | None = None
+
+    def submit(self, force: bool = False) -> SyncJob:
+        """Start a sync, or return the one already running."""
+        with self._lock:
+            if self._active is not None and not self._active.finished:
+                return self._active
+            job = SyncJob(id=uuid.uuid4().hex, force=force)
+            self._jobs[job.id] = job
+            self._active = job
+            self._prune()
+        threading.Thread(
+            target=self._execute, args=(job,), name=f"sync-{job.id[:8]}", daemon=True
+        ).start()
+        return job
+
+    def get(self, job_id: str) -> SyncJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def latest(self) -> SyncJob | None:
+        """The most recently submitted job, running or not."""
+        with self._lock:
+            return next(reversed(self._jobs.values()), None)
+
+    def active(self) -> SyncJob | None:
+        """The running (or queued) job, if any."""
+        with self._lock:
+            job = self._active
+        return job if job is not None and not job.finished else None
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:-KEEP_FINISHED]:
+            del self._jobs[job_id]
+
+    def _execute(self, job: SyncJob) -> None:
+        job.started_at = datetime.now(UTC)
+        job.status = "running"
+        db = self._session_factory()
+        try:
+            job.outcome = self._run(db, force=job.force, progress=job.progress)
+            job.status = "succeeded"
+        # Whatever goes wrong fails the job rather than the worker thread;
+        # error_kind tells callers which kind of failure it was
+        except Exception as e:  # noqa: BLE001
+            job.error = str(e)
+            job.error_kind = _error_kind(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.now(UTC)
+            try:
+                self._record(db, job)
+            finally:
+                db.close()
+                job.done.set()
+
+    def _record(self, db: Session, job: SyncJob) -> None:
+        # History is diagnostics only: losing a row must not fail the job
+        try:
+            db.rollback()
+            self._record_run(db, job)
+        except SQLAlchemyError as e:
+            print(f"Could not record sync run {job.id}: {e}", flush=True)
+
+
+sync_jobs = SyncJobs()
+
+
+def _log_startup_sync(job: SyncJob) -> None:
+    job.done.wait()
+    if job.status == "succeeded":
+        outcome = job.outcome
+        if outcome.skipped:
+            print(
+                f"Startup sync: '{outcome.file_name}' unchanged since last sync",
+                flush=True,
+            )
+        else:
+            print(
+                f"Startup sync: {outcome.accounts_loaded} accounts, "
+                f"{outcome.values_loaded} values from '{outcome.file_name}'",
+                flush=True,
+            )
+        for timing in outcome.drive_requests:
+            print(
+                f"  Drive {timing.name}: {timing.seconds:.2f}s, "
+                f"{timing.retries} retries",
+                flush=True,
+            )
+    elif job.error_kind == "not_configured":
+        print(f"Skipping startup sync - {job.error}", flush=True)
+    else:
+        print(f"Startup sync failed ({job.error}) - serving existing data", flush=True)
+
+
+def sync_on_startup() -> SyncJob:
+    """
+    Start a best-effort sync in the background and return straight away, so
+    the app serves the existing data while Drive is contacted. The outcome
+    is logged when the job finishes; it never raises.
+    """
+    print("Syncing from Google Drive in the background...", flush=True)
+    job = sync_jobs.submit()
+    threading.Thread(
+        target=_log_startup_sync, args=(job,), name="startup-sync-log", daemon=True
+    ).start()
+    return job
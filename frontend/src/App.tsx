@@ -39,10 +39,6 @@ function SyncButton({ onSynced }: { onSynced: () => void }) {
   const [message, setMessage] = useState<{ text: string; error: boolean } | null>(null);
   const clearTimer = useRef<ReturnType<typeof setTimeout> | undefined>(undefined);
 
-  useEffect(() => {
-    syncApi.status().then(setStatus).catch(console.error);
-  }, []);
-
   const handleSync = async () => {
     setSyncing(true);
     setMessage(null);
@@ -65,6 +61,19 @@ function SyncButton({ onSynced }: { onSynced: () => void }) {
     }
   };
 
+  useEffect(() => {
+    syncApi.status().then(setStatus).catch(console.error);
+    // The startup sync runs in the background: join it (a sync request while
+    // one is running attaches to it) so the page refreshes when it lands
+    syncApi
+      .health()
+      .then(health => {
+        if (health.sync_in_progress) handleSync();
+      })
+      .catch(console.error);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
+
   const statusText = status ? formatStatus(status) : null;
 
   return (
@@ -22,12 +22,13 @@ import { Separator } from '@/components/ui/separator';
 import { ToggleGroup, ToggleGroupItem } from '@/components/ui/toggle-group';
 import { Button } from '@/components/ui/button';
 import { Popover, PopoverContent, PopoverTrigger } from '@/components/ui/popover';
-import { accountsApi, valuesApi } from '../services/api';
+import { accountsApi, seriesApi, statsApi } from '../services/api';
 import { useTheme } from '../contexts/theme';
-import { computeSummaryStats, computeMonthlyChanges } from '../lib/stats';
+import { toSummaryStats, toMonthlyChanges } from '../lib/stats';
+import type { SummaryStats as Stats, MonthlyChanges as Changes } from '../lib/stats';
 import SummaryStats from '../components/SummaryStats';
 import MonthlyChanges from '../components/MonthlyChanges';
-import type { Account, Value, ViewMode, Term, AccountType } from '../types/api';
+import type { Account, ViewMode, Term, AccountType } from '../types/api';
 
 ChartJS.register(
   CategoryScale, LinearScale, PointElement, LineElement, Tooltip, Legend, TimeScale, Filler
@@ -75,7 +76,8 @@ function NetWorth() {
   const isDark = theme === 'dark';
 
   const [accounts, setAccounts] = useState<Account[]>([]);
-  const [allValues, setAllValues] = useState<Value[]>([]);
+  const [summaryStats, setSummaryStats] = useState<Stats | null>(null);
+  const [monthlyChanges, setMonthlyChanges] = useState<Changes | null>(null);
   const [selectedTerm, setSelectedTerm] = useState<Term[]>([]);
   const [selectedType, setSelectedType] = useState<AccountType[]>([]);
   const [selectedAccounts, setSelectedAccounts] = useState<string[]>([]);
@@ -92,14 +94,11 @@ function NetWorth() {
         setSelectedAccounts(list.map(a => a.name));
       })
       .catch(console.error);
-    valuesApi.getAll().then(setAllValues).catch(console.error);
+    // Computed (and cached) by the server rather than from the full history
+    statsApi.summary().then(s => setSummaryStats(toSummaryStats(s))).catch(console.error);
+    statsApi.monthlyChanges().then(c => setMonthlyChanges(toMonthlyChanges(c))).catch(console.error);
   }, []);
 
-  const summaryStats = useMemo(
-    () => computeSummaryStats(accounts, allValues),
-    [accounts, allValues]
-  );
-  const monthlyChanges = useMemo(() => computeMonthlyChanges(allValues), [allValues]);
 
   useEffect(() => {
     const handleScroll = () => setPopoverOpen(false);
@@ -127,25 +126,20 @@ function NetWorth() {
     const updateChart = async () => {
       try {
         setLoading(true);
-        const responses = await Promise.all(
-          selectedAccounts.map(name => valuesApi.getByAccount(name))
-        );
-        const allValues: Value[] = responses.flat().sort(
-          (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime()
-        );
-        if (allValues.length === 0) { setChartData(null); return; }
+        // One request: summed per day (or split per account) by the server
+        const { labels, series } = await seriesApi.get({
+          group_by: viewMode === 'split' ? 'account' : undefined,
+          accounts: selectedAccounts,
+        });
+        if (labels.length === 0) { setChartData(null); return; }
+        const points = (data: (number | null)[]) =>
+          labels.flatMap((x, i) => (data[i] == null ? [] : [{ x, y: data[i] }]));
 
         let datasets;
         if (viewMode === 'aggregated') {
-          const byDate: Record<string, number> = {};
-          allValues.forEach(v => {
-            const d = v.date.split('T')[0];
-            byDate[d] = (byDate[d] ?? 0) + v.amount;
-          });
-          const data = Object.keys(byDate).sort().map(x => ({ x, y: byDate[x] }));
           datasets = [{
             label: 'Total Net Worth',
-            data,
+            data: points(series[0].data),
             borderColor: COLORS[0],
             backgroundColor: COLORS[0] + '18',
             fill: true,
@@ -154,11 +148,10 @@ function NetWorth() {
             pointHoverRadius: 5,
           }];
         } else {
+          const byName = new Map(series.map(s => [s.name, s.data]));
           datasets = selectedAccounts.map((name, i) => ({
             label: name,
-            data: allValues
-              .filter(v => v.account_name === name)
-              .map(v => ({ x: v.date.split('T')[0], y: v.amount })),
+            data: points(byName.get(name) ?? []),
             borderColor: COLORS[i % COLORS.length],
             backgroundColor: COLORS[i % COLORS.length] + '18',
             fill: false,
@@ -15,7 +15,8 @@ import { Label } from '@/components/ui/label';
 import { Separator } from '@/components/ui/separator';
 import { ToggleGroup, ToggleGroupItem } from '@/components/ui/toggle-group';
 import { Button } from '@/components/ui/button';
-import { accountsApi, valuesApi } from '../services/api';
+import { format } from 'date-fns';
+import { accountsApi, seriesApi } from '../services/api';
 import { useTheme } from '../contexts/theme';
 import type { Account, Portfolio } from '../types/api';
 
@@ -79,42 +80,34 @@ function PortfolioBreakdown() {
     const updateChart = async () => {
       try {
         setLoading(true);
-        const responses = await Promise.all(
-          filteredAccounts.map(account => valuesApi.getByAccount(account.name))
-        );
-        const allValues = responses.flatMap((data, i) =>
-          data.map(v => ({ ...v, asset_class: filteredAccounts[i].asset_class! }))
-        );
-        if (allValues.length === 0) { setChartData(null); return; }
-
         const now = new Date();
-        const cutoffs: Record<TimeRange, Date> = {
+        const cutoffs: Record<TimeRange, Date | null> = {
           '3m': new Date(now.getFullYear(), now.getMonth() - 3, 1),
           '6m': new Date(now.getFullYear(), now.getMonth() - 6, 1),
           '1y': new Date(now.getFullYear() - 1, now.getMonth(), 1),
-          'all': new Date(0),
+          'all': null,
         };
-        const filtered = allValues.filter(v => new Date(v.date) >= cutoffs[timeRange]);
+        const cutoff = cutoffs[timeRange];
 
-        const monthlyData: Record<string, Record<string, number>> = {};
-        filtered.forEach(v => {
-          const d = new Date(v.date);
-          const key = `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`;
-          if (!monthlyData[key]) monthlyData[key] = {};
-          monthlyData[key][v.asset_class] = (monthlyData[key][v.asset_class] ?? 0) + v.amount;
+        // Summed per month and asset class by the server, in one request
+        const { labels: months, series } = await seriesApi.get({
+          group_by: 'asset_class',
+          bucket: 'month',
+          type: ['Asset'],
+          portfolio: selectedPortfolios.filter((p): p is NonNullable<Portfolio> => p !== null),
+          start_date: cutoff ? format(cutoff, 'yyyy-MM-dd') : undefined,
         });
+        const assetClasses = series.filter(s => s.name !== null);
+        if (months.length === 0 || assetClasses.length === 0) { setChartData(null); return; }
 
-        const sortedMonths = Object.keys(monthlyData).sort();
-        const assetClasses = [...new Set(filtered.map(v => v.asset_class))].sort();
-
-        const datasets = assetClasses.map(ac => ({
-          label: ac,
-          data: sortedMonths.map(m => monthlyData[m][ac] ?? 0),
-          backgroundColor: ASSET_CLASS_COLORS[ac] ?? '#6B7280',
+        const datasets = assetClasses.map(s => ({
+          label: s.name!,
+          data: s.data.map(v => v ?? 0),
+          backgroundColor: ASSET_CLASS_COLORS[s.name!] ?? '#6B7280',
           borderRadius: 2,
         }));
 
-        const labels = sortedMonths.map(m => {
+        const labels = months.map(m => {
           const [y, mo] = m.split('-');
           return new Date(parseInt(y), parseInt(mo) - 1).toLocaleDateString('en-GB', { month: 'short', year: 'numeric' });
         });
@@ -128,7 +121,7 @@ function PortfolioBreakdown() {
     };
 
     updateChart();
-  }, [filteredAccounts, timeRange]);
+  }, [filteredAccounts, selectedPortfolios, timeRange]);
 
   const gridColor = isDark ? 'rgba(255,255,255,0.06)' : 'rgba(0,0,0,0.05)';
   const tickColor = isDark ? '#94a3b8' : '#64748b';
@@ -1,12 +1,20 @@
-import type { Account, Value } from '../types/api';
+import type {
+  Account, AccountType, ApiMonthlyChanges, ApiSummaryStats, AssetClass, Portfolio, SeriesBucket, SeriesGroupBy, SeriesResponse, Term, Value,
+} from '../types/api';
 
 // Same-origin in production (served by FastAPI); proxied to the backend by Vite in dev
 const API_BASE_URL = '/api';
 
-async function apiFetch<T>(path: string, params?: Record<string, string>): Promise<T> {
+// Array values become repeated parameters (?type=Asset&type=Liability)
+type QueryParams = Record<string, string | string[] | undefined>;
+
+async function apiFetch<T>(path: string, params?: QueryParams): Promise<T> {
   const url = new URL(`${API_BASE_URL}${path}`, window.location.origin);
   if (params) {
-    Object.entries(params).forEach(([k, v]) => url.searchParams.set(k, v));
+    Object.entries(params).forEach(([k, v]) => {
+      if (Array.isArray(v)) v.forEach(item => url.searchParams.append(k, item));
+      else if (v !== undefined) url.searchParams.set(k, v);
+    });
   }
   const response = await fetch(url.toString(), {
     headers: { 'Content-Type': 'application/json' },
@@ -33,31 +41,113 @@ async function apiPost<T>(path: string): Promise<T> {
   return response.json() as Promise<T>;
 }
 
+export interface DriveRequest {
+  name: string;
+  status: number | null;
+  seconds: number;
+  retries: number;
+}
+
 export interface SyncResult {
   accounts_loaded: number;
   values_loaded: number;
   file_name: string;
   drive_modified_time: string;
   skipped: boolean;
+  values_inserted: number;
+  values_updated: number;
+  values_deleted: number;
+  drive_requests: DriveRequest[];
+}
+
+export interface SyncJob {
+  id: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  force: boolean;
+  phase: string | null;
+  bytes_downloaded: number;
+  rows_imported: number;
+  backup_pages: number;
+  backup_total_pages: number;
+  timings: Record<string, number>;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  error: string | null;
+  error_kind: string | null;
+  result: SyncResult | null;
+}
+
+const SYNC_POLL_MS = 500;
+
+/** Start a sync (or join the running one) and resolve once it finishes. */
+async function runSync(): Promise<SyncResult> {
+  let job = await apiPost<SyncJob>('/sync/');
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise(resolve => setTimeout(resolve, SYNC_POLL_MS));
+    job = await apiFetch<SyncJob>(`/sync/jobs/${job.id}`);
+  }
+  if (job.status === 'failed' || !job.result) throw new Error(job.error ?? 'Sync failed');
+  return job.result;
 }
 
 export const accountsApi = {
   getAll: () => apiFetch<Account[]>('/accounts/'),
 };
 
+export interface ScheduleStatus {
+  interval_seconds: number;
+  next_run_at: string | null;
+  last_run_at: string | null;
+  last_result: 'unchanged' | 'changed' | 'failed' | null;
+  consecutive_failures: number;
+  fast_until: string | null;
+}
+
 export interface SyncStatus {
   file_name: string | null;
   last_synced_at: string | null;
   latest_value_date: string | null;
+  schedule: ScheduleStatus | null;
+}
+
+export interface Health {
+  status: string;
+  data: 'fresh' | 'stale';
+  sync_in_progress: boolean;
+  detail: string;
+  last_sync_error: string | null;
 }
 
 export const syncApi = {
-  run: () => apiPost<SyncResult>('/sync/'),
+  run: runSync,
   status: () => apiFetch<SyncStatus>('/sync/status'),
+  health: () => apiFetch<Health>('/health/'),
 };
 
 export const valuesApi = {
   getByAccount: (accountName: string, params?: { start_date?: string; end_date?: string }) =>
-    apiFetch<Value[]>(`/values/account/${encodeURIComponent(accountName)}`, params as Record<string, string>),
+    apiFetch<Value[]>(`/values/account/${encodeURIComponent(accountName)}`, params),
   getAll: () => apiFetch<Value[]>('/values/', { limit: '100000' }),
 };
+
+export interface SeriesParams {
+  group_by?: SeriesGroupBy;
+  bucket?: SeriesBucket;
+  term?: NonNullable<Term>[];
+  type?: NonNullable<AccountType>[];
+  portfolio?: NonNullable<Portfolio>[];
+  asset_class?: NonNullable<AssetClass>[];
+  accounts?: string[];
+  start_date?: string;
+  end_date?: string;
+}
+
+export const seriesApi = {
+  get: (params: SeriesParams) => apiFetch<SeriesResponse>('/series/', { ...params }),
+};
+
+export const statsApi = {
+  summary: () => apiFetch<ApiSummaryStats | null>('/stats/summary'),
+  monthlyChanges: () => apiFetch<ApiMonthlyChanges | null>('/stats/monthly-changes'),
+};
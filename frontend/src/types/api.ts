@@ -45,4 +45,51 @@ export interface AggregatedDataPoint {
   total: number;
 }
 
-export type ViewMode = 'aggregated' | 'split';
\ No newline at end of file
+export type ViewMode = 'aggregated' | 'split';
+
+// GET /api/stats/summary and /api/stats/monthly-changes
+export interface ApiDelta {
+  amount: number;
+  pct: number | null;
+  baseline_date: string;
+}
+
+export interface ApiSummaryStats {
+  latest_date: string;
+  net_worth: number;
+  assets: number;
+  liabilities: number;
+  month_delta: ApiDelta | null;
+  ytd_delta: ApiDelta | null;
+}
+
+export interface ApiAccountChange {
+  name: string;
+  previous: number | null;
+  current: number | null;
+  change: number;
+  pct: number | null;
+}
+
+export interface ApiMonthlyChanges {
+  previous_date: string;
+  current_date: string;
+  changes: ApiAccountChange[];
+  total_change: number;
+}
+
+export type SeriesGroupBy = 'term' | 'type' | 'portfolio' | 'asset_class' | 'account';
+export type SeriesBucket = 'day' | 'month' | 'quarter' | 'year';
+
+export interface Series {
+  name: string | null;
+  // One point per label, null where the group has no value in that bucket
+  data: (number | null)[];
+}
+
+export interface SeriesResponse {
+  group_by: SeriesGroupBy | null;
+  bucket: SeriesBucket;
+  labels: string[];
+  series: Series[];
+}
\ No newline at end of file
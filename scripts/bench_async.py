@@ -0,0 +1,162 @@
+"""
+Benchmark GET /api/values/ under concurrent load: the async endpoint on the
+aiosqlite read engine against the same query in a plain `def` endpoint on a
+sync read-only engine, which Starlette runs on its threadpool (default size,
+printed below).
+
+Builds a throwaway database in a temporary directory and drives both
+endpoints in-process through httpx's ASGI transport:
+
+    uv run python scripts/bench_async.py [--concurrency 200] [--requests 4000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import anyio
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app.models  # noqa: F401
+from app.api.endpoints import values
+from app.config import get_settings
+from app.database import get_read_db
+from app.database.database import (
+    READ_POOL_SIZE,
+    Base,
+    connection_pragmas,
+    create_read_engine,
+    create_sqlite_engine,
+)
+from app.models.account import Account
+from app.models.value import Value
+from app.schemas.value import Value as ValueSchema
+
+
+def populate(path: str, accounts: int, days: int) -> None:
+    engine = create_sqlite_engine(
+        f"sqlite:///{path}", connection_pragmas(get_settings())
+    )
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.execute(insert(Account), [{"name": f"Account {i}"} for i in range(accounts)])
+        db.execute(
+            insert(Value),
+            [
+                {
+                    "account_id": a,
+                    "amount": float(d),
+                    "date": date(2000, 1, 1) + timedelta(days=d),
+                }
+                for a in range(1, accounts + 1)
+                for d in range(days)
+            ],
+        )
+        db.commit()
+    engine.dispose()
+
+
+def build_app(path: str, threads: int) -> tuple[FastAPI, object, object]:
+    pragmas = connection_pragmas(get_settings())
+    read_pragmas = {k: v for k, v in pragmas.items() if k != "journal_mode"}
+    # One connection per worker thread
+    sync_engine = create_sqlite_engine(
+        f"sqlite:///file:{path}?mode=ro&uri=true",
+        {**read_pragmas, "query_only": 1},
+        pool_size=threads,
+        max_overflow=0,
+    )
+    sync_sessions = sessionmaker(bind=sync_engine)
+    async_engine = create_read_engine(path, pragmas, pool_size=READ_POOL_SIZE)
+    async_sessions = async_sessionmaker(async_engine)
+
+    async def get_async_db():
+        async with async_sessions() as db:
+            yield db
+
+    bench = FastAPI()
+    bench.include_router(values.router, prefix="/async/values")
+    bench.dependency_overrides[get_read_db] = get_async_db
+
+    # The session is opened in the endpoint: a `yield` dependency's cleanup
+    # needs a second worker thread, and once every worker is waiting for a
+    # connection held by a session awaiting cleanup, requests deadlock until
+    # the pool times out
+    @bench.get("/threadpool/values/", response_model=list[ValueSchema])
+    def threadpool_values(limit: int = 100):
+        with sync_sessions() as db:
+            query = select(Value).order_by(Value.date.desc()).limit(limit)
+            return [ValueSchema.model_validate(value) for value in db.scalars(query)]
+
+    return bench, sync_engine, async_engine
+
+
+async def hammer(
+    client: httpx.AsyncClient, url: str, concurrency: int, total: int
+) -> tuple[float, list[float]]:
+    latencies = []
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+async def run(path: str, concurrency: int, total: int) -> None:
+    threads = anyio.to_thread.current_default_thread_limiter().total_tokens
+    print(f"{concurrency} concurrent clients, {total} requests, threadpool {threads}")
+    bench, sync_engine, async_engine = build_app(path, threads)
+    transport = httpx.ASGITransport(app=bench)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for label, url in (
+            ("def + threadpool", "/threadpool/values/"),
+            ("async + aiosqlite", "/async/values/"),
+        ):
+            await hammer(client, url, concurrency, concurrency)  # warm the pools
+            elapsed, ms = await hammer(client, url, concurrency, total)
+            ms.sort()
+            print(
+                f"  {label:<18} {total / elapsed:7.0f} req/s, "
+                f"p50 {statistics.median(ms):6.1f} ms, "
+                f"p95 {ms[int(len(ms) * 0.95)]:6.1f} ms"
+            )
+    await async_engine.dispose()
+    sync_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--days", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/bench.db"
+        populate(path, args.accounts, args.days)
+        asyncio.run(run(path, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
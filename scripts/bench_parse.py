@@ -0,0 +1,72 @@
+"""
+Benchmark the vectorized workbook parser against the old row-at-a-time loop.
+
+Builds a synthetic "Net Worth" sheet in memory (no files written), reads it
+once, then times both parsers on the same DataFrame:
+
+    uv run python scripts/bench_parse.py [--rows 400] [--months 120]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.importer import _parse_frame, _read_sheet
+from tests.reference_parser import parse_frame_rowwise
+
+HEADER = ["Description", "Term", "Type", "Portfolio", "Asset Class", "Account"]
+
+
+def build_workbook(rows: int, months: int) -> BytesIO:
+    dates = [datetime(2000 + m // 12, m % 12 + 1, 1) for m in range(months)]
+    data = [
+        # Every fourth account is split across two rows to exercise the sum
+        [f"Row {i}", "Long Term", "Asset", "Liquid", "Equities", f"Account {i // 2}"]
+        + [float(i * 10 + m) if (i + m) % 7 else None for m in range(months)]
+        for i in range(rows)
+    ]
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        pd.DataFrame(data, columns=HEADER + dates).to_excel(
+            writer, sheet_name="Net Worth", index=False
+        )
+    buffer.seek(0)
+    return buffer
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--months", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = _read_sheet(build_workbook(args.rows, args.months))
+    assert _parse_frame(df) == parse_frame_rowwise(df), "parsers disagree"
+
+    rowwise = best_of(lambda: parse_frame_rowwise(df), args.repeat)
+    vectorized = best_of(lambda: _parse_frame(df), args.repeat)
+
+    print(f"{args.rows} rows x {args.months} date columns (best of {args.repeat})")
+    print(f"  row loop:   {rowwise * 1000:8.1f} ms")
+    print(f"  vectorized: {vectorized * 1000:8.1f} ms  ({rowwise / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark dashboard read latency while a full import is writing, with
+SQLite's defaults against the connection profile the app uses (WAL,
+synchronous=NORMAL, page cache, mmap; see SQLITE_* in .env).
+
+Each profile gets a fresh database in a temporary directory, loaded once;
+a second full load then runs while another thread repeats the dashboard's
+net-worth-by-date query and times every read:
+
+    uv run python scripts/bench_sqlite.py [--accounts 200] [--months 240]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.config import get_settings
+from app.database.database import (
+    Base,
+    connection_pragmas,
+    create_sqlite_engine,
+    effective_pragmas,
+)
+from app.models.value import Value
+from app.services.importer import ParsedAccount, import_accounts
+
+# SQLite's own defaults: rollback journal, full fsync, 2 MB cache, no mmap
+DEFAULT_PRAGMAS = {"journal_mode": "delete", "busy_timeout": 5000}
+
+
+def build_parsed(accounts: int, months: int) -> dict[str, ParsedAccount]:
+    dates = [datetime(2000 + m // 12, m % 12 + 1, 1) for m in range(months)]
+    return {
+        f"Account {i}": ParsedAccount(
+            name=f"Account {i}",
+            description=None,
+            term=None,
+            type=None,
+            portfolio=None,
+            asset_class=None,
+            values_by_date={date: float(i * 10 + m) for m, date in enumerate(dates)},
+        )
+        for i in range(accounts)
+    }
+
+
+def run_profile(pragmas: dict, parsed: dict, mode: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{tmp}/bench.db", pragmas)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            import_accounts(db, parsed)
+
+        latencies = []
+        writing = threading.Event()
+        done = threading.Event()
+
+        def read_loop():
+            with Session() as db:
+                writing.wait()
+                while not done.is_set():
+                    start = time.perf_counter()
+                    db.query(Value.date, func.sum(Value.amount)).group_by(
+                        Value.date
+                    ).all()
+                    db.rollback()  # end the read transaction, like a request
+                    latencies.append(time.perf_counter() - start)
+
+        reader = threading.Thread(target=read_loop)
+        reader.start()
+        with Session() as db:
+            writing.set()
+            start = time.perf_counter()
+            import_accounts(db, parsed, mode=mode)
+            import_seconds = time.perf_counter() - start
+        done.set()
+        reader.join()
+
+        applied = effective_pragmas(engine)
+        engine.dispose()
+
+    ms = sorted(latency * 1000 for latency in latencies)
+    print(
+        f"  journal_mode={applied['journal_mode']}, "
+        f"synchronous={applied['synchronous']}, cache_size={applied['cache_size']}, "
+        f"mmap_size={applied['mmap_size']}"
+    )
+    print(f"    import:  {import_seconds * 1000:8.1f} ms")
+    if not ms:
+        print("    reads:   none completed during the import")
+        return
+    print(
+        f"    reads:   {len(ms)} during the import, "
+        f"p50 {statistics.median(ms):.1f} ms, "
+        f"p95 {ms[int(len(ms) * 0.95)]:.1f} ms, max {ms[-1]:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--months", type=int, default=240)
+    parser.add_argument("--mode", default="replace", help="import mode to time")
+    args = parser.parse_args()
+
+    parsed = build_parsed(args.accounts, args.months)
+    print(
+        f"{args.accounts} accounts x {args.months} months "
+        f"({args.accounts * args.months} values), {args.mode} import"
+    )
+    print("SQLite defaults:")
+    run_profile(DEFAULT_PRAGMAS, parsed, args.mode)
+    print("App profile:")
+    run_profile(connection_pragmas(get_settings()), parsed, args.mode)
+
+
+if __name__ == "__main__":
+    main()
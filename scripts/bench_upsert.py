@@ -0,0 +1,145 @@
+"""
+Benchmark manual value entry (POST /api/values/) against a large values
+table: the old lookup-then-write - func.date() on the column, so no index
+on date can be used, then an UPDATE or INSERT and a refresh - against the
+single INSERT ... ON CONFLICT DO UPDATE ... RETURNING the endpoint now runs.
+
+Builds a throwaway database in a temporary directory with the app's
+connection profile, then times each entry (half overwrite an existing day,
+half add a new one):
+
+    uv run python scripts/bench_upsert.py [--accounts 100] [--days 5000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.api.endpoints.values import create_value
+from app.config import get_settings
+from app.database.database import (
+    Base,
+    connection_pragmas,
+    create_sqlite_engine,
+)
+from app.models.account import Account
+from app.models.value import Value
+from app.schemas.value import ValueCreate
+
+START = date(2000, 1, 1)
+
+
+def lookup_then_write(value: ValueCreate, db):
+    """create_value as it was: function-wrapped date lookup, then a write
+    and a refresh."""
+    account = db.query(Account).filter(Account.name == value.account_name).first()
+    existing = (
+        db.query(Value)
+        .filter(
+            Value.account_id == account.id,
+            func.date(Value.date) == func.date(value.date),
+        )
+        .first()
+    )
+    if existing:
+        existing.amount = value.amount
+        db.commit()
+        db.refresh(existing)
+        return existing
+    db_value = Value(account_id=account.id, amount=value.amount, date=value.date.date())
+    db.add(db_value)
+    db.commit()
+    db.refresh(db_value)
+    return db_value
+
+
+def populate(db, accounts: int, days: int) -> None:
+    db.execute(insert(Account), [{"name": f"Account {i}"} for i in range(accounts)])
+    for account_id in range(1, accounts + 1):
+        db.execute(
+            insert(Value),
+            [
+                {
+                    "account_id": account_id,
+                    "amount": float(d),
+                    "date": START + timedelta(days=d),
+                }
+                for d in range(days)
+            ],
+        )
+    db.commit()
+
+
+def entries(accounts: int, days: int, count: int, new_from: int, seed: int):
+    rng = random.Random(seed)
+    for i in range(count):
+        # Even entries overwrite an existing day, odd ones add a later day
+        offset = rng.randrange(days) if i % 2 == 0 else new_from + i
+        yield ValueCreate(
+            account_name=f"Account {rng.randrange(accounts)}",
+            amount=rng.random() * 1000,
+            date=datetime.combine(START + timedelta(days=offset), datetime.min.time()),
+        )
+
+
+def time_entries(write, Session, values: list[ValueCreate]) -> list[float]:
+    latencies = []
+    with Session() as db:
+        for value in values:
+            start = time.perf_counter()
+            write(value, db)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, ms: list[float]) -> None:
+    ms = sorted(ms)
+    print(
+        f"  {label:<18} p50 {statistics.median(ms):6.2f} ms, "
+        f"p95 {ms[int(len(ms) * 0.95)]:6.2f} ms, max {ms[-1]:6.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--days", type=int, default=5000)
+    parser.add_argument("--entries", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(
+            f"sqlite:///{tmp}/bench.db", connection_pragmas(get_settings())
+        )
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            populate(db, args.accounts, args.days)
+        print(
+            f"{args.accounts} accounts x {args.days} days "
+            f"({args.accounts * args.days} values), {args.entries} entries each"
+        )
+
+        # The second run adds days after the first run's, so both insert
+        old = list(entries(args.accounts, args.days, args.entries, args.days, 1))
+        new = list(
+            entries(args.accounts, args.days, args.entries, args.days + args.entries, 2)
+        )
+        report("lookup then write", time_entries(lookup_then_write, Session, old))
+        report("upsert", time_entries(create_value, Session, new))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,17 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from app.database import SessionLocal, init_db  # noqa: E402
-from app.services.backup import snapshot_db  # noqa: E402
-from app.services.importer import (  # noqa: E402
+from app.config import get_settings
+from app.database import SessionLocal, init_db
+from app.services.backup import snapshot_db
+from app.services.importer import (
+    ENGINES,
+    IMPORT_MODES,
+    READERS,
     ExcelParseError,
     import_accounts,
     parse_workbook,
+    report_engine,
 )
 
 
@@ -32,15 +37,35 @@ def main():
         default="Net Worth Tracker.xlsx",
         help='Path to the workbook (default: "Net Worth Tracker.xlsx")',
     )
+    parser.add_argument(
+        "--reader",
+        choices=READERS,
+        default=get_settings().workbook_reader,
+        help="workbook reader (default: WORKBOOK_READER from .env, else pandas)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=get_settings().workbook_engine,
+        help="pandas reader engine (default: WORKBOOK_ENGINE from .env, else openpyxl)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=IMPORT_MODES,
+        default="swap",
+        help="how to write the data (default: swap, which keeps the live tables "
+        "readable until an atomic rename)",
+    )
     args = parser.parse_args()
 
     if not Path(args.xlsx_file).exists():
         sys.exit(f"File not found: {args.xlsx_file}")
 
     init_db()
+    report_engine(args.engine)
 
     try:
-        parsed = parse_workbook(args.xlsx_file)
+        parsed = parse_workbook(args.xlsx_file, reader=args.reader, engine=args.engine)
     except ExcelParseError as e:
         sys.exit(f"Parse error: {e}")
 
@@ -48,12 +73,13 @@ def main():
 
     db = SessionLocal()
     try:
-        summary = import_accounts(db, parsed)
+        summary = import_accounts(db, parsed, mode=args.mode)
     finally:
         db.close()
 
     print(f"✓ Accounts loaded: {summary.accounts_loaded}")
     print(f"✓ Values loaded: {summary.values_loaded}")
+    print(f"✓ Import rate: {summary.rows_per_second:,.0f} rows/s")
 
 
 if __name__ == "__main__":
@@ -5,12 +5,33 @@ import pandas as pd
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.database import Base
+from app.services.sync import SyncOutcome
+from app.services.sync_jobs import SyncJobs
 
 HEADER = ["Description", "Term", "Type", "Portfolio", "Asset Class", "Account"]
 DATES = [datetime(2026, 5, 1), datetime(2026, 6, 1)]
 
+# What a stub sync run returns
+OUTCOME = SyncOutcome(
+    accounts_loaded=1,
+    values_loaded=2,
+    file_name="Tracker.xlsx",
+    drive_modified_time="t",
+)
+
+
+class FakeSession:
+    """The session a sync job gets when its run never touches the database."""
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
 
 def make_workbook(rows: list[list], dates: list[datetime] = DATES) -> BytesIO:
     """Build an in-memory xlsx with the expected 'Net Worth' sheet layout."""
@@ -32,3 +53,31 @@ def db_session():
     finally:
         session.close()
         engine.dispose()
+
+
+@pytest.fixture
+def shared_sessions():
+    """Session factory over one in-memory database visible from any thread
+    (worker threads, TestClient's threadpool)."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield sessionmaker(bind=engine)
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def make_jobs():
+    """SyncJobs over a stub run, with no database or sync history."""
+
+    def make(run) -> SyncJobs:
+        return SyncJobs(
+            run=run, session_factory=FakeSession, record_run=lambda db, job: None
+        )
+
+    return make
@@ -0,0 +1,80 @@
+"""
+The row-at-a-time workbook parser that the vectorized _parse_frame replaced,
+kept as a reference for tests and scripts/bench_parse.py.
+"""
+
+import pandas as pd
+
+from app.enums import AccountType, AssetClass, Portfolio, Term
+from app.services.importer import (
+    SHEET_NAME,
+    ExcelParseError,
+    ParsedAccount,
+    _parse_cell,
+    _parse_enum,
+    _parse_header_date,
+)
+
+
+def parse_frame_rowwise(df: pd.DataFrame) -> dict[str, ParsedAccount]:
+    """Parse the sheet one row at a time, as the importer used to."""
+    date_columns = [col for col in df.columns[6:] if not pd.isna(col)]
+
+    accounts: dict[str, ParsedAccount] = {}
+
+    for idx, row in df.iterrows():
+        row_num = idx + 2  # +2 because header is row 1
+
+        # Summary rows (no Description) mark the end of account data
+        if pd.isna(row[df.columns[0]]):
+            break
+
+        account_name = row[df.columns[5]]
+        if pd.isna(account_name):
+            continue
+        account_name = str(account_name).strip()
+
+        parsed = ParsedAccount(
+            name=account_name,
+            description=_parse_cell(row[df.columns[0]]),
+            term=_parse_enum(Term, row[df.columns[1]], "Term", row_num),
+            type=_parse_enum(AccountType, row[df.columns[2]], "Type", row_num),
+            portfolio=_parse_enum(Portfolio, row[df.columns[3]], "Portfolio", row_num),
+            asset_class=_parse_enum(
+                AssetClass, row[df.columns[4]], "Asset Class", row_num
+            ),
+        )
+
+        existing = accounts.setdefault(account_name, parsed)
+        if existing is not parsed and (
+            existing.term != parsed.term
+            or existing.type != parsed.type
+            or existing.portfolio != parsed.portfolio
+            or existing.asset_class != parsed.asset_class
+        ):
+            raise ExcelParseError(
+                f"Account '{account_name}' has inconsistent attributes across rows "
+                f"(row {row_num} differs from an earlier row)"
+            )
+
+        for date_col in date_columns:
+            value = row[date_col]
+            if pd.isna(value):
+                continue
+            try:
+                amount = float(value)
+            except (ValueError, TypeError):
+                continue
+
+            date = _parse_header_date(date_col)
+            if date is None:
+                continue
+
+            existing.values_by_date[date] = (
+                existing.values_by_date.get(date, 0.0) + amount
+            )
+
+    if not accounts:
+        raise ExcelParseError(f"No account rows found in sheet '{SHEET_NAME}'")
+
+    return accounts
@@ -0,0 +1,448 @@
+import asyncio
+import dataclasses
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import Base, get_db, get_read_db
+from app.database.database import (
+    connection_pragmas,
+    create_read_engine,
+    create_sqlite_engine,
+)
+from app.enums import AccountType, AssetClass
+from app.main import app
+from app.models.account import Account
+from app.models.sync_run import SyncRun
+from app.models.value import Value
+from app.services import data_version
+from app.services import stats as stats_service
+from app.services.drive import RequestTiming
+from tests.conftest import OUTCOME
+
+
+def write_from_another_process(db, *statements):
+    """Commit statements and a data version bump on a connection of their
+    own, as scripts/load_from_excel.py does while the server runs."""
+    with closing(sqlite3.connect(db.get_bind().url.database)) as conn, conn:
+        for statement in statements:
+            conn.execute(statement)
+        conn.execute(
+            "UPDATE data_version SET version = version + 1, "
+            "changed_at = '2030-01-01 00:00:00.000000'"
+        )
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestHealth:
+    @pytest.fixture
+    def jobs(self, make_jobs, monkeypatch):
+        release = threading.Event()
+
+        def run(db, force, progress):
+            release.wait(5)
+            return OUTCOME
+
+        jobs = make_jobs(run)
+        jobs.release = release
+        monkeypatch.setattr("app.api.endpoints.health.sync_jobs", jobs)
+        return jobs
+
+    def test_stale_while_startup_sync_runs_then_fresh(self, client, jobs):
+        job = jobs.submit()
+
+        health = client.get("/api/health/").json()
+        assert (health["data"], health["sync_in_progress"]) == ("stale", True)
+        assert health["detail"] == "stale, sync in progress"
+
+        jobs.release.set()
+        job.done.wait(5)
+        health = client.get("/api/health/").json()
+        assert (health["data"], health["sync_in_progress"]) == ("fresh", False)
+
+    def test_stale_before_any_sync(self, client, jobs):
+        assert client.get("/api/health/").json()["data"] == "stale"
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A database file served through the app's own write and read engines."""
+    path = str(tmp_path / "tracker.db")
+    pragmas = connection_pragmas(get_settings())
+    engine = create_sqlite_engine(f"sqlite:///{path}", pragmas)
+    Base.metadata.create_all(bind=engine)
+    sessions = sessionmaker(bind=engine)
+    read_engine = create_read_engine(path, pragmas)
+    read_sessions = async_sessionmaker(read_engine)
+
+    def override():
+        with sessions() as db:
+            yield db
+
+    async def read_override():
+        async with read_sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override
+    app.dependency_overrides[get_read_db] = read_override
+    with sessions() as db:
+        data_version.load(db)
+        yield db
+    app.dependency_overrides.clear()
+    asyncio.run(read_engine.dispose())
+    engine.dispose()
+
+
+class TestValues:
+    def test_values_are_addressed_by_account_name(self, client, db):
+        client.post("/api/accounts/", json={"name": "ISA", "type": "Asset"})
+        posted = client.post(
+            "/api/values/",
+            json={"account_name": "ISA", "amount": 100, "date": "2026-05-01T09:30:00"},
+        ).json()
+        # Same day again: updates rather than adding a second point
+        client.post(
+            "/api/values/",
+            json={"account_name": "ISA", "amount": 120, "date": "2026-05-01T00:00:00"},
+        )
+
+        unknown = client.post(
+            "/api/values/",
+            json={"account_name": "Nope", "amount": 1, "date": "2026-05-01T00:00:00"},
+        )
+        assert unknown.status_code == 404
+
+        values = client.get("/api/values/?account_name=ISA").json()
+        assert values == [
+            {
+                "id": posted["id"],
+                "account_name": "ISA",
+                "amount": 120.0,
+                "date": "2026-05-01T00:00:00",
+            }
+        ]
+        in_range = client.get(
+            "/api/values/account/ISA",
+            params={"start_date": "2026-05-01T12:00:00", "end_date": "2026-05-01"},
+        ).json()
+        assert [v["id"] for v in in_range] == [posted["id"]]
+
+        assert client.delete(f"/api/values/{posted['id']}").status_code == 200
+        assert client.delete("/api/values/not-an-id").status_code == 404
+
+
+class TestSyncJobStatus:
+    def test_reports_the_drive_requests(self, client, make_jobs, monkeypatch):
+        outcome = dataclasses.replace(
+            OUTCOME,
+            drive_requests=[
+                RequestTiming(name="metadata", status=200, seconds=0.2, retries=0),
+                RequestTiming(name="download", status=200, seconds=1.5, retries=1),
+            ],
+        )
+        jobs = make_jobs(lambda db, force, progress: outcome)
+        monkeypatch.setattr("app.api.endpoints.sync.sync_jobs", jobs)
+        job = jobs.submit()
+        assert job.done.wait(5)
+
+        result = client.get(f"/api/sync/jobs/{job.id}").json()["result"]
+        assert result["drive_requests"] == [
+            {"name": "metadata", "status": 200, "seconds": 0.2, "retries": 0},
+            {"name": "download", "status": 200, "seconds": 1.5, "retries": 1},
+        ]
+
+
+class TestSyncHistory:
+    def test_pages_runs_newest_first_with_phase_percentiles(self, client, db):
+        started = datetime(2026, 6, 1)
+        for seconds in range(1, 11):
+            db.add(
+                SyncRun(
+                    started_at=started,
+                    finished_at=started,
+                    status="succeeded",
+                    metadata_seconds=float(seconds),
+                    download_seconds=float(seconds) if seconds > 5 else None,
+                )
+            )
+        # Polls of an unchanged file don't count towards the percentiles
+        db.add(
+            SyncRun(
+                started_at=started,
+                finished_at=started,
+                status="skipped",
+                metadata_seconds=100.0,
+            )
+        )
+        db.commit()
+
+        history = client.get("/api/sync/history?limit=3&offset=2").json()
+
+        assert history["total"] == 11
+        assert [r["metadata_seconds"] for r in history["runs"]] == [9.0, 8.0, 7.0]
+        assert history["phases"]["metadata"] == pytest.approx(
+            {"runs": 10, "p50": 5.5, "p95": 9.55}
+        )
+        assert history["phases"]["download"]["runs"] == 5
+        assert "import" not in history["phases"]
+
+        recent = client.get("/api/sync/history?window=2").json()["phases"]
+        assert recent["metadata"] == pytest.approx({"runs": 2, "p50": 9.5, "p95": 9.95})
+
+
+class TestSeries:
+    @pytest.fixture
+    def accounts(self, db):
+        db.add_all(
+            [
+                Account(
+                    id=1,
+                    name="ISA",
+                    type=AccountType.ASSET,
+                    asset_class=AssetClass.EQUITIES,
+                ),
+                Account(
+                    id=2,
+                    name="Cash",
+                    type=AccountType.ASSET,
+                    asset_class=AssetClass.CASH,
+                ),
+                Account(id=3, name="Loan", type=AccountType.LIABILITY),
+            ]
+        )
+        db.add_all(
+            [
+                Value(account_id=1, amount=100, date=date(2026, 1, 5)),
+                Value(account_id=1, amount=110, date=date(2026, 1, 20)),
+                Value(account_id=1, amount=130, date=date(2026, 4, 2)),
+                Value(account_id=2, amount=50, date=date(2026, 1, 20)),
+                Value(account_id=3, amount=-40, date=date(2026, 2, 1)),
+            ]
+        )
+        db.commit()
+
+    def test_total_sums_each_accounts_latest_value_per_bucket(self, client, accounts):
+        series = client.get("/api/series/?bucket=month").json()
+
+        assert series["labels"] == ["2026-01-01", "2026-02-01", "2026-04-01"]
+        # January counts the ISA's 20th, not its 5th
+        assert series["series"] == [{"name": "Total", "data": [160.0, -40.0, 130.0]}]
+
+    def test_groups_by_attribute_with_filters(self, client, accounts):
+        series = client.get(
+            "/api/series/",
+            params={"group_by": "asset_class", "bucket": "quarter", "type": ["Asset"]},
+        ).json()
+
+        assert series["labels"] == ["2026-01-01", "2026-04-01"]
+        assert series["series"] == [
+            {"name": "Cash", "data": [50.0, None]},
+            {"name": "Equities", "data": [110.0, 130.0]},
+        ]
+
+    def test_accounts_and_date_range(self, client, accounts):
+        series = client.get(
+            "/api/series/",
+            params={
+                "group_by": "account",
+                "accounts": ["ISA", "Loan"],
+                "start_date": "2026-01-10",
+                "end_date": "2026-03-31",
+            },
+        ).json()
+
+        assert series["labels"] == ["2026-01-20", "2026-02-01"]
+        assert series["series"] == [
+            {"name": "ISA", "data": [110.0, None]},
+            {"name": "Loan", "data": [None, -40.0]},
+        ]
+
+
+class TestValuesBatch:
+    def test_groups_values_per_account_in_request_order(self, client, db):
+        db.add_all([Account(id=1, name="ISA"), Account(id=2, name="Cash")])
+        db.add_all(
+            [
+                Value(account_id=1, amount=100, date=date(2026, 1, 5)),
+                Value(account_id=1, amount=110, date=date(2026, 2, 5)),
+                Value(account_id=2, amount=50, date=date(2026, 1, 5)),
+            ]
+        )
+        db.commit()
+
+        batch = client.get(
+            "/api/values/batch", params={"accounts": ["Cash", "ISA"]}
+        ).json()
+        assert list(batch) == ["Cash", "ISA"]
+        assert [v["amount"] for v in batch["ISA"]] == [110.0, 100.0]
+        assert {v["account_name"] for v in batch["Cash"]} == {"Cash"}
+
+        since = client.get(
+            "/api/values/batch",
+            params={"accounts": ["ISA", "Cash"], "start_date": "2026-02-01"},
+        ).json()
+        assert since == {"ISA": [batch["ISA"][0]], "Cash": []}
+
+        unknown = client.get("/api/values/batch", params={"accounts": ["ISA", "Nope"]})
+        assert unknown.status_code == 404
+        assert unknown.json()["detail"] == "Accounts not found: Nope"
+
+
+class TestStats:
+    @pytest.fixture
+    def accounts(self, db):
+        db.add_all(
+            [
+                Account(id=1, name="ISA", type=AccountType.ASSET),
+                Account(id=2, name="Loan", type=AccountType.LIABILITY),
+                Account(id=3, name="Card"),
+            ]
+        )
+        db.add_all(
+            [
+                Value(account_id=1, amount=800, date=date(2025, 12, 1)),
+                Value(account_id=1, amount=900, date=date(2026, 1, 1)),
+                Value(account_id=2, amount=-200, date=date(2026, 1, 1)),
+                Value(account_id=1, amount=1000, date=date(2026, 2, 1)),
+                Value(account_id=2, amount=-150, date=date(2026, 2, 1)),
+                Value(account_id=3, amount=-50, date=date(2026, 2, 1)),
+            ]
+        )
+        db.commit()
+
+    def test_summary(self, client, accounts):
+        summary = client.get("/api/stats/summary").json()
+
+        assert summary == {
+            "latest_date": "2026-02-01",
+            "net_worth": 800.0,
+            "assets": 1000.0,
+            # Card has no type: counted by its sign
+            "liabilities": -200.0,
+            "month_delta": {
+                "amount": 100.0,
+                "pct": pytest.approx(100 / 7),
+                "baseline_date": "2026-01-01",
+            },
+            "ytd_delta": {"amount": 0.0, "pct": 0.0, "baseline_date": "2025-12-01"},
+        }
+
+    def test_monthly_changes(self, client, accounts):
+        changes = client.get("/api/stats/monthly-changes").json()
+
+        assert (changes["previous_date"], changes["current_date"]) == (
+            "2026-01-01",
+            "2026-02-01",
+        )
+        assert [(c["name"], c["change"]) for c in changes["changes"]] == [
+            ("ISA", 100.0),
+            ("Loan", 50.0),
+            ("Card", -50.0),
+        ]
+        assert changes["changes"][2]["previous"] is None
+        assert changes["total_change"] == 100.0
+
+    def test_cached_until_the_data_changes(self, client, accounts, monkeypatch):
+        calls = []
+        original = stats_service.summary
+
+        def counting(db):
+            calls.append(1)
+            return original(db)
+
+        monkeypatch.setattr(stats_service, "summary", counting)
+
+        client.get("/api/stats/summary")
+        client.get("/api/stats/summary")
+        assert len(calls) == 1
+
+        client.post(
+            "/api/values/",
+            json={"account_name": "ISA", "amount": 1100, "date": "2026-02-01"},
+        )
+        assert client.get("/api/stats/summary").json()["net_worth"] == 900.0
+        assert len(calls) == 2
+
+    def test_cache_sees_another_process_writing(self, client, db, accounts):
+        before = client.get("/api/stats/summary").json()["net_worth"]
+
+        write_from_another_process(
+            db,
+            'UPDATE "values" SET amount = amount + 100 '
+            "WHERE account_id = 1 AND date = '2026-02-01'",
+        )
+
+        assert client.get("/api/stats/summary").json()["net_worth"] == before + 100
+
+    def test_no_values(self, client, db):
+        assert client.get("/api/stats/summary").json() is None
+        assert client.get("/api/stats/monthly-changes").json() is None
+
+
+class TestConditionalGet:
+    def test_revalidates_against_the_data_version(self, client, db):
+        client.post("/api/accounts/", json={"name": "ISA"})
+        first = client.get("/api/accounts/")
+        etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+        assert first.headers["cache-control"] == "no-cache"
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            for headers in (
+                {"If-None-Match": etag},
+                {"If-None-Match": f'"other", W/{etag}'},
+                {"If-Modified-Since": last_modified},
+            ):
+                cached = client.get("/api/accounts/", headers=headers)
+                assert cached.status_code == 304
+                assert cached.headers["etag"] == etag
+                assert cached.content == b""
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+        # Only the version is read
+        assert len(statements) == 3
+        assert all("FROM data_version" in statement for statement in statements)
+
+    def test_a_write_changes_the_etag(self, client, db):
+        client.post("/api/accounts/", json={"name": "ISA"})
+        etag = client.get("/api/values/").headers["etag"]
+
+        client.post(
+            "/api/values/",
+            json={"account_name": "ISA", "amount": 1, "date": "2026-05-01"},
+        )
+
+        fresh = client.get("/api/values/", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert len(fresh.json()) == 1
+
+    def test_another_process_writing_changes_the_etag(self, client, db):
+        etag = client.get("/api/accounts/").headers["etag"]
+
+        write_from_another_process(db, "INSERT INTO accounts (name) VALUES ('ISA')")
+
+        fresh = client.get("/api/accounts/", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert [a["name"] for a in fresh.json()] == ["ISA"]
+
+    def test_sync_and_health_are_not_versioned(self, client, db):
+        assert "etag" not in client.get("/api/sync/history").headers
@@ -0,0 +1,126 @@
+import gzip
+import sqlite3
+
+import pytest
+
+from app.services import backup
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "tracker.db"
+    monkeypatch.setattr(backup, "DB_PATH", path)
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path / "backups")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+    return path
+
+
+def write(path, value):
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE t SET x = ?", (value,))
+    conn.close()
+
+
+def read(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT x FROM t").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSnapshots:
+    def test_snapshot_is_compressed_and_deduplicated(self, db_path):
+        first = backup.snapshot_db()
+        assert first.name.endswith(".db.gz")
+        with gzip.open(first) as f:
+            assert f.read(16) == b"SQLite format 3\x00"
+
+        assert backup.snapshot_db() == first
+        assert backup.list_snapshots() == [first]
+
+        write(db_path, 2)
+        second = backup.snapshot_db()
+        assert second != first
+        assert backup.list_snapshots() == [first, second]
+
+    def test_prunes_to_newest(self, db_path, monkeypatch):
+        stamps = iter(["20260101-000000", "20260102-000000", "20260103-000000"])
+        monkeypatch.setattr(backup.time, "strftime", lambda fmt: next(stamps))
+        for value in (2, 3, 4):
+            write(db_path, value)
+            backup.snapshot_db(keep=2)
+
+        assert [p.name[:23] for p in backup.list_snapshots()] == [
+            "tracker-20260102-000000",
+            "tracker-20260103-000000",
+        ]
+
+    def test_copies_in_steps_reporting_progress(self, db_path, monkeypatch):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE blobs (b BLOB)")
+            conn.execute("INSERT INTO blobs VALUES (zeroblob(100000))")
+        monkeypatch.setattr(backup, "BACKUP_STEP_PAGES", 5)
+        steps = []
+
+        backup.BackgroundSnapshot(progress=lambda *p: steps.append(p)).wait()
+
+        assert len(steps) > 2
+        assert steps[-1][0] == steps[-1][1]
+        assert len(backup.list_snapshots()) == 1
+
+    def test_no_database_yet(self, db_path):
+        db_path.unlink()
+        assert backup.snapshot_db() is None
+
+    def test_restore_round_trip(self, db_path):
+        snapshot = backup.snapshot_db()
+        write(db_path, 99)
+
+        assert backup.restore_snapshot(snapshot) == snapshot
+        assert read(db_path) == 1
+        # the overwritten state was snapshotted first
+        restored_from = backup.list_snapshots()[-1]
+        backup.restore_snapshot(restored_from)
+        assert read(db_path) == 99
+
+    def test_restore_without_snapshots(self, db_path):
+        with pytest.raises(FileNotFoundError):
+            backup.restore_snapshot()
+
+
+class TestChangeMarker:
+    @pytest.fixture
+    def versioned(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE data_version (id INTEGER PRIMARY KEY, "
+                "version INTEGER, changed_at TEXT)"
+            )
+            conn.execute("INSERT INTO data_version VALUES (1, 1, 't1')")
+        return db_path
+
+    def test_unchanged_version_skips_the_copy(self, versioned, monkeypatch):
+        first = backup.snapshot_db()
+
+        def no_copy(*args, **kwargs):
+            raise AssertionError("copied an unchanged database")
+
+        monkeypatch.setattr(backup, "_copy_database", no_copy)
+        # Not a data change: covered by the newest snapshot
+        with sqlite3.connect(versioned) as conn:
+            conn.execute("CREATE TABLE sync_runs (id INTEGER)")
+        assert backup.snapshot_db() == first
+
+    def test_bumped_version_copies(self, versioned):
+        first = backup.snapshot_db()
+        write(versioned, 2)
+        with sqlite3.connect(versioned) as conn:
+            conn.execute("UPDATE data_version SET version = 2, changed_at = 't2'")
+
+        second = backup.snapshot_db()
+        assert second != first
+        assert backup.list_snapshots() == [first, second]
@@ -0,0 +1,46 @@
+from app.services import data_version
+from app.services.importer import ParsedAccount, import_accounts
+
+
+def test_load_starts_the_counter(db_session):
+    assert data_version.load(db_session).version == 1
+    assert data_version.current().version == 1
+
+
+def test_bump_publishes_on_commit_only(db_session):
+    data_version.load(db_session)
+
+    data_version.bump(db_session)
+    assert data_version.current().version == 1
+    db_session.commit()
+    assert data_version.current().version == 2
+
+    data_version.bump(db_session)
+    db_session.rollback()
+    assert data_version.current().version == 2
+    assert data_version.persisted(db_session) == 2
+
+
+def test_bump_past_another_version(db_session):
+    data_version.load(db_session)
+
+    data_version.bump(db_session, past=40)
+    db_session.commit()
+
+    assert data_version.current().version == 41
+
+
+def test_import_bumps(db_session):
+    data_version.load(db_session)
+
+    account = ParsedAccount(
+        name="ISA",
+        description=None,
+        term=None,
+        type=None,
+        portfolio=None,
+        asset_class=None,
+    )
+    import_accounts(db_session, {"ISA": account})
+
+    assert data_version.current().version == 2
@@ -0,0 +1,81 @@
+import asyncio
+import dataclasses
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.config import get_settings
+from app.database.database import (
+    READ_POOL_OVERFLOW,
+    READ_POOL_SIZE,
+    READ_POOL_TIMEOUT,
+    connection_pragmas,
+    create_read_engine,
+    create_sqlite_engine,
+    effective_pragmas,
+)
+
+
+class TestConnectionPragmas:
+    def test_profile_is_applied_to_every_connection(self, tmp_path):
+        settings = dataclasses.replace(
+            get_settings(),
+            sqlite_journal_mode="wal",
+            sqlite_synchronous="normal",
+            sqlite_cache_bytes=8 << 20,
+            sqlite_mmap_bytes=16 << 20,
+            sqlite_busy_timeout_ms=1234,
+        )
+        engine = create_sqlite_engine(
+            f"sqlite:///{tmp_path / 'tracker.db'}", connection_pragmas(settings)
+        )
+        try:
+            assert effective_pragmas(engine) == {
+                "journal_mode": "wal",
+                "synchronous": "normal",
+                "cache_size": -8192,
+                "mmap_size": 16 << 20,
+                "temp_store": "memory",
+                "busy_timeout": 1234,
+            }
+        finally:
+            engine.dispose()
+
+
+class TestReadEngine:
+    def test_reads_committed_data_and_refuses_writes(self, tmp_path):
+        path = str(tmp_path / "tracker.db")
+        pragmas = connection_pragmas(get_settings())
+        writer = create_sqlite_engine(f"sqlite:///{path}", pragmas)
+        with writer.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+
+        async def read():
+            reader = create_read_engine(path, pragmas, pool_size=2)
+            try:
+                async with reader.connect() as conn:
+                    with writer.begin() as write:
+                        write.exec_driver_sql("INSERT INTO t VALUES (1)")
+                    assert (await conn.exec_driver_sql("SELECT x FROM t")).scalar() == 1
+                    query_only = await conn.exec_driver_sql("PRAGMA query_only")
+                    assert query_only.scalar() == 1
+                    with pytest.raises(OperationalError, match="readonly"):
+                        await conn.exec_driver_sql("INSERT INTO t VALUES (2)")
+            finally:
+                await reader.dispose()
+
+        try:
+            asyncio.run(read())
+        finally:
+            writer.dispose()
+
+    def test_pool_covers_the_threadpool_and_fails_fast(self, tmp_path):
+        reader = create_read_engine(
+            str(tmp_path / "tracker.db"), connection_pragmas(get_settings())
+        )
+        try:
+            assert READ_POOL_SIZE + READ_POOL_OVERFLOW == 40
+            assert reader.pool.size() == READ_POOL_SIZE
+            assert reader.pool.timeout() == READ_POOL_TIMEOUT
+        finally:
+            asyncio.run(reader.dispose())
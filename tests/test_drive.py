@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services import drive
+from app.services.drive import XLSX_MIME, DriveClient, DriveConfigError, DriveError
+
+
+class StubDrive(BaseHTTPRequestHandler):
+    """Replies from `server.script`, a list of (status, headers, body)."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.server.seen.append((self.path, self.client_address[1]))
+        status, headers, body = self.server.script.pop(0)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeCredentials:
+    service_account_email = "sync@example.iam.gserviceaccount.com"
+
+    def __init__(self):
+        self.token = None
+        self.expiry = None
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubDrive)
+    httpd.script = []
+    httpd.seen = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def loaded():
+    """Every FakeCredentials created from a key file, in order."""
+    return []
+
+
+@pytest.fixture
+def key_file(monkeypatch, tmp_path, loaded):
+    def from_service_account_file(*args, **kwargs):
+        loaded.append(FakeCredentials())
+        return loaded[-1]
+
+    monkeypatch.setattr(
+        drive.service_account.Credentials,
+        "from_service_account_file",
+        from_service_account_file,
+    )
+    monkeypatch.setattr(drive, "_credentials", {})
+    path = tmp_path / "key.json"
+    path.write_text("{}")
+    return path
+
+
+@pytest.fixture
+def client(server, monkeypatch, key_file):
+    sleeps = []
+    monkeypatch.setattr(drive.time, "sleep", sleeps.append)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/files"
+    client = DriveClient(key_file, base_url=base_url)
+    client.sleeps = sleeps
+    return client
+
+
+def metadata_body():
+    return json.dumps(
+        {"name": "Tracker.xlsx", "mimeType": XLSX_MIME, "modifiedTime": "t1"}
+    ).encode()
+
+
+class TestDriveClient:
+    def test_reuses_one_connection(self, client, server):
+        server.script = [(200, {}, metadata_body()), (200, {}, b"xlsx bytes")]
+
+        metadata = client.get_metadata("abc")
+        with client.download("abc", metadata.mime_type, max_bytes=100).file as f:
+            assert f.read() == b"xlsx bytes"
+
+        assert [path.split("?")[0] for path, _ in server.seen] == [
+            "/files/abc",
+            "/files/abc",
+        ]
+        assert server.seen[0][1] == server.seen[1][1]  # same client port
+        assert [(t.name, t.status, t.retries) for t in client.timings] == [
+            ("metadata", 200, 0),
+            ("download", 200, 0),
+        ]
+
+    def test_retries_transient_errors_honouring_retry_after(self, client, server):
+        server.script = [
+            (503, {"Retry-After": "2"}, b"busy"),
+            (429, {}, b"slow down"),
+            (200, {}, metadata_body()),
+        ]
+
+        assert client.get_metadata("abc").name == "Tracker.xlsx"
+
+        assert client.sleeps[0] == 2.0
+        assert 0 <= client.sleeps[1] <= drive.BACKOFF_BASE_SECONDS * 2
+        assert client.timings[0].retries == 2
+
+    def test_gives_up_after_max_retries(self, client, server, monkeypatch):
+        monkeypatch.setattr(drive, "MAX_RETRIES", 2)
+        server.script = [(500, {}, b"oops")] * 3
+
+        with pytest.raises(DriveError, match="returned 500"):
+            client.get_metadata("abc")
+
+        assert len(server.seen) == 3
+        assert client.timings[0].retries == 2
+
+    def test_download_streams_and_hashes(self, client, server, monkeypatch):
+        monkeypatch.setattr(drive, "DOWNLOAD_CHUNK_BYTES", 4)
+        monkeypatch.setattr(drive, "SPOOL_MAX_MEMORY_BYTES", 8)
+        body = b"0123456789" * 5
+        server.script = [(200, {}, body)]
+
+        download = client.download("abc", XLSX_MIME, max_bytes=len(body))
+
+        with download.file as f:
+            assert f.read() == body
+        assert download.size == len(body)
+        assert download.md5 == hashlib.md5(body).hexdigest()
+
+    def test_download_rejects_files_over_the_size_cap(self, client, server):
+        server.script = [(200, {}, b"x" * 20)]
+
+        with pytest.raises(DriveError, match="larger than the 10 byte limit"):
+            client.download("abc", XLSX_MIME, max_bytes=10)
+
+    def test_does_not_retry_missing_file(self, client, server):
+        server.script = [(404, {}, b"not found")]
+
+        with pytest.raises(DriveError, match="not shared with the service account"):
+            client.get_metadata("abc")
+
+        assert client.sleeps == []
+
+
+class TestCredentialCache:
+    def test_token_is_reused_across_clients(self, key_file, loaded):
+        DriveClient(key_file)
+        DriveClient(key_file)
+
+        assert len(loaded) == 1
+        assert loaded[0].refreshes == 1
+
+    def test_token_is_refreshed_shortly_before_expiry(self, key_file, loaded):
+        DriveClient(key_file)
+        credentials = loaded[0]
+        credentials.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(
+            minutes=1
+        )
+
+        DriveClient(key_file)
+
+        assert credentials.refreshes == 2
+
+    def test_changed_key_file_is_reloaded(self, key_file, loaded):
+        DriveClient(key_file)
+        stat = key_file.stat()
+        os.utime(key_file, (stat.st_atime, stat.st_mtime + 10))
+
+        DriveClient(key_file)
+
+        assert len(loaded) == 2
+        assert len(drive._credentials) == 1
+
+    def test_missing_key_file_is_a_config_error(self, tmp_path):
+        with pytest.raises(DriveConfigError, match="not found"):
+            DriveClient(tmp_path / "missing.json")
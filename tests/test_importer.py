@@ -1,19 +1,28 @@
-from datetime import datetime
+from datetime import date, datetime
+from io import BytesIO
 
+import pandas as pd
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from app.enums import AccountType, AssetClass, Portfolio, Term
 from app.models.account import Account
 from app.models.value import Value
 from app.services.importer import (
     ExcelParseError,
+    _parse_frame,
+    _read_sheet,
     import_accounts,
     parse_workbook,
+    report_engine,
 )
 from tests.conftest import make_workbook
+from tests.reference_parser import parse_frame_rowwise
 
 MAY = datetime(2026, 5, 1)
 JUNE = datetime(2026, 6, 1)
+# Stored values are date-only
+MAY_DAY, JUNE_DAY, JULY_DAY = MAY.date(), JUNE.date(), date(2026, 7, 1)
 
 
 class TestParseWorkbook:
@@ -101,9 +110,6 @@ class TestParseWorkbook:
             parse_workbook(wb)
 
     def test_rejects_missing_sheet(self):
-        import pandas as pd
-        from io import BytesIO
-
         buffer = BytesIO()
         with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
             pd.DataFrame({"a": [1]}).to_excel(writer, sheet_name="Wrong", index=False)
@@ -128,16 +134,72 @@ class TestImportAccounts:
         assert account.name == "ISA"
         assert account.term == Term.SHORT_TERM
         amounts = {v.date: v.amount for v in db_session.query(Value).all()}
-        assert amounts == {MAY: 100.0, JUNE: 150.0}
+        assert amounts == {MAY_DAY: 100.0, JUNE_DAY: 150.0}
+
+    def test_loads_in_batches_with_generated_ids(self, db_session, monkeypatch):
+        monkeypatch.setattr("app.services.importer.INSERT_BATCH_SIZE", 1)
+        summary = import_accounts(db_session, self._parsed())
+
+        assert summary.values_loaded == 2
+        assert summary.rows_per_second > 0
+        ids = [v.id for v in db_session.query(Value).all()]
+        assert sorted(ids) == [1, 2]
+        assert db_session.query(Value).first().account.name == "ISA"
 
     def test_reimport_replaces_existing_data(self, db_session):
         import_accounts(db_session, self._parsed(amount=100))
         import_accounts(db_session, self._parsed(amount=999))
 
         assert db_session.query(Account).count() == 1
-        may_value = db_session.query(Value).filter(Value.date == MAY).one()
+        may_value = db_session.query(Value).filter(Value.date == MAY_DAY).one()
         assert may_value.amount == 999.0
 
+    def test_incremental_import_writes_only_the_diff(self, db_session):
+        import_accounts(db_session, self._parsed(amount=100))
+        original_ids = {v.date: v.id for v in db_session.query(Value).all()}
+
+        parsed = self._parsed(amount=120)
+        del parsed["ISA"].values_by_date[JUNE]
+        parsed["ISA"].values_by_date[datetime(2026, 7, 1)] = 175.0
+        parsed["ISA"].portfolio = Portfolio.ILLIQUID
+        summary = import_accounts(db_session, parsed, mode="incremental")
+
+        assert (
+            summary.values_inserted,
+            summary.values_updated,
+            summary.values_deleted,
+        ) == (1, 1, 1)
+        db_session.expire_all()
+        assert db_session.query(Account).one().portfolio == Portfolio.ILLIQUID
+        values = {v.date: v for v in db_session.query(Value).all()}
+        assert {d: v.amount for d, v in values.items()} == {
+            MAY_DAY: 120.0,
+            JULY_DAY: 175.0,
+        }
+        assert values[MAY_DAY].id == original_ids[MAY_DAY]
+
+    def test_incremental_import_adds_and_removes_accounts(self, db_session):
+        import_accounts(db_session, self._parsed())
+        other = parse_workbook(
+            make_workbook(
+                [["Loan", "Long Term", "Liability", None, None, "Mortgage", -5, -4]]
+            )
+        )
+        summary = import_accounts(db_session, other, mode="incremental")
+
+        assert (summary.values_inserted, summary.values_deleted) == (2, 2)
+        assert [a.name for a in db_session.query(Account).all()] == ["Mortgage"]
+        assert db_session.query(Value).count() == 2
+
+    def test_unchanged_incremental_import_writes_nothing(self, db_session):
+        import_accounts(db_session, self._parsed())
+        summary = import_accounts(db_session, self._parsed(), mode="incremental")
+        assert (
+            summary.values_inserted,
+            summary.values_updated,
+            summary.values_deleted,
+        ) == (0, 0, 0)
+
     def test_failed_import_keeps_existing_data(self, db_session):
         import_accounts(db_session, self._parsed())
 
@@ -148,4 +210,166 @@ class TestImportAccounts:
 
         assert db_session.query(Account).count() == 1
         assert db_session.query(Value).count() == 2
-        assert db_session.query(Value).filter(Value.date == MAY).one().amount == 100.0
+        assert (
+            db_session.query(Value).filter(Value.date == MAY_DAY).one().amount == 100.0
+        )
+
+    def _schema(self, db_session):
+        return {
+            name: tbl
+            for name, tbl in db_session.connection().exec_driver_sql(
+                "SELECT name, tbl_name FROM sqlite_master WHERE sql IS NOT NULL"
+            )
+        }
+
+    def test_swap_import_replaces_tables_and_rebuilds_indexes(self, db_session):
+        import_accounts(db_session, self._parsed(amount=100))
+        before = self._schema(db_session)
+
+        for amount in (500, 999):  # twice: index names alternate back
+            summary = import_accounts(db_session, self._parsed(amount), mode="swap")
+
+            assert (summary.values_inserted, summary.values_deleted) == (2, 2)
+            db_session.expire_all()
+            assert db_session.query(Account).one().name == "ISA"
+            may_value = db_session.query(Value).filter(Value.date == MAY_DAY).one()
+            assert may_value.amount == float(amount)
+            assert may_value.account.name == "ISA"
+            schema = self._schema(db_session)
+            assert sorted(schema.values()) == sorted(before.values())
+            assert not any(t.endswith("_next") for t in schema.values())
+
+    def test_failed_swap_keeps_live_tables_and_drops_staging(self, db_session):
+        import_accounts(db_session, self._parsed())
+
+        bad = self._parsed()
+        bad["ISA"].values_by_date[JUNE] = None
+        with pytest.raises(IntegrityError):
+            import_accounts(db_session, bad, mode="swap")
+
+        assert db_session.query(Value).count() == 2
+        assert not any(t.endswith("_next") for t in self._schema(db_session))
+
+
+class TestVectorizedParity:
+    """_parse_frame must match the row-at-a-time reference parser exactly."""
+
+    CASES = (
+        [
+            ["Savings", "Short Term", "Asset", "Liquid", "Cash", "ISA", 100, 150],
+            ["Loan", "Long Term", "Liability", None, None, "Mortgage", -500, -490],
+        ],
+        [
+            ["Pot A", "Short Term", "Asset", "Liquid", "Cash", "Bank", 100, None],
+            ["Header row", None, None, None, None, None, None, None],
+            ["Pot B", "Short Term", "Asset", "Liquid", "Cash", " Bank ", 25, 50],
+            [None, None, None, None, None, "Total", 125, 50],
+            ["After", "Short Term", "Asset", "Liquid", "Cash", "Ghost", 1, 2],
+        ],
+        [["Savings", "none", "Asset", "None", "Cash", "ISA", "n/a", 150]],
+    )
+
+    @pytest.mark.parametrize("rows", CASES)
+    def test_matches_rowwise_parser(self, rows):
+        df = _read_sheet(make_workbook(rows))
+        assert _parse_frame(df) == parse_frame_rowwise(df)
+
+    def test_sums_columns_sharing_a_date(self):
+        dates = [datetime(2026, 5, 1), datetime(2026, 5, 1, 12), JUNE]
+        df = _read_sheet(
+            make_workbook(
+                [["Savings", None, None, None, None, "ISA", 1, 2, 3]], dates=dates
+            )
+        )
+        assert _parse_frame(df) == parse_frame_rowwise(df)
+        assert _parse_frame(df)["ISA"].values_by_date == {MAY: 3.0, JUNE: 3.0}
+
+    @pytest.mark.parametrize(
+        "rows, message",
+        [
+            (
+                [
+                    ["A", "Short Term", "Asset", "Liquid", "Cash", "Bank", 1, 2],
+                    ["B", "Long Term", "Asset", "Liquid", "Cash", "Bank", 1, 2],
+                    ["C", "Short Term", "Asset", "Wrong", "Cash", "Other", 1, 2],
+                ],
+                "inconsistent attributes",
+            ),
+            (
+                [
+                    ["A", "Short Term", "Asset", "Liquid", "Bonds", "Bank", 1, 2],
+                    ["B", "Medium Term", "Asset", "Liquid", "Cash", "Other", 1, 2],
+                ],
+                r"Row 2: invalid Asset Class 'Bonds'",
+            ),
+        ],
+    )
+    def test_raises_the_same_first_error(self, rows, message):
+        df = _read_sheet(make_workbook(rows))
+        with pytest.raises(ExcelParseError, match=message) as vectorized:
+            _parse_frame(df)
+        with pytest.raises(ExcelParseError) as rowwise:
+            parse_frame_rowwise(df)
+        assert str(vectorized.value) == str(rowwise.value)
+
+
+class TestStreamingReader:
+    """The openpyxl streaming reader must agree with the DataFrame reader."""
+
+    @pytest.mark.parametrize("rows", TestVectorizedParity.CASES)
+    def test_matches_pandas_reader(self, rows):
+        assert parse_workbook(make_workbook(rows), reader="streaming") == (
+            parse_workbook(make_workbook(rows))
+        )
+
+    def test_stops_reading_at_summary_rows(self):
+        wb = make_workbook(
+            [
+                ["Savings", "Short Term", "Asset", "Liquid", "Cash", "ISA", 1, 2],
+                [None, None, None, None, None, "Total", 1, 2],
+                ["After", "Bogus", "Asset", "Liquid", "Cash", "Ghost", 1, 2],
+            ]
+        )
+        # The invalid Term below the summary row is never read
+        assert set(parse_workbook(wb, reader="streaming")) == {"ISA"}
+
+    def test_reports_errors_with_row_numbers(self):
+        wb = make_workbook(
+            [
+                ["Savings", "Short Term", "Asset", "Liquid", "Cash", "ISA", 1, 2],
+                ["Savings", "Medium Term", "Asset", "Liquid", "Cash", "ISA", 1, 2],
+            ]
+        )
+        with pytest.raises(ExcelParseError, match="Row 3: invalid Term"):
+            parse_workbook(wb, reader="streaming")
+
+    def test_rejects_missing_sheet(self):
+        buffer = BytesIO()
+        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+            pd.DataFrame({"a": [1]}).to_excel(writer, sheet_name="Wrong", index=False)
+        buffer.seek(0)
+        with pytest.raises(ExcelParseError, match="Net Worth"):
+            parse_workbook(buffer, reader="streaming")
+
+
+class TestReaderEngines:
+    @pytest.mark.parametrize("rows", TestVectorizedParity.CASES)
+    def test_calamine_matches_openpyxl(self, rows):
+        pytest.importorskip("python_calamine")
+        assert parse_workbook(make_workbook(rows), engine="calamine") == (
+            parse_workbook(make_workbook(rows), engine="openpyxl")
+        )
+
+    def test_falls_back_to_openpyxl_without_calamine(self, monkeypatch, capsys):
+        monkeypatch.setattr("app.services.importer._CALAMINE_INSTALLED", False)
+        wb = make_workbook(
+            [["Savings", "Short Term", "Asset", "Liquid", "Cash", "ISA", 1, 2]]
+        )
+        assert parse_workbook(wb, engine="calamine")["ISA"].values_by_date == {
+            MAY: 1.0,
+            JUNE: 2.0,
+        }
+        assert capsys.readouterr().out == ""
+
+        report_engine("calamine")
+        assert "reading workbooks with openpyxl" in capsys.readouterr().out
@@ -0,0 +1,99 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.database import Base
+from app.database.migrations import SCHEMA_VERSION, upgrade
+from app.models.account import Account
+from app.models.value import Value
+from app.services import backup
+
+# The schema before integer keys, as create_all() used to emit it
+UUID_SCHEMA = [
+    (
+        "CREATE TABLE accounts (id VARCHAR(36) NOT NULL, name VARCHAR(100) NOT NULL, "
+        "description TEXT, term VARCHAR(10), type VARCHAR(9), portfolio VARCHAR(13), "
+        "asset_class VARCHAR(11), PRIMARY KEY (id))"
+    ),
+    "CREATE INDEX ix_accounts_id ON accounts (id)",
+    "CREATE UNIQUE INDEX ix_accounts_name ON accounts (name)",
+    (
+        'CREATE TABLE "values" (id VARCHAR(36) NOT NULL, account_name VARCHAR(100) '
+        "NOT NULL, amount FLOAT NOT NULL, date DATETIME NOT NULL, PRIMARY KEY (id), "
+        "FOREIGN KEY(account_name) REFERENCES accounts (name))"
+    ),
+    'CREATE INDEX ix_values_date ON "values" (date)',
+    'CREATE INDEX ix_values_id ON "values" (id)',
+    'CREATE INDEX ix_values_account_name ON "values" (account_name)',
+    (
+        "INSERT INTO accounts VALUES ('a-1', 'ISA', 'Savings', 'SHORT_TERM', 'ASSET', "
+        "'LIQUID', 'CASH')"
+    ),
+    (
+        "INSERT INTO accounts VALUES ('a-2', 'Mortgage', 'Loan', NULL, 'LIABILITY', "
+        "NULL, NULL)"
+    ),
+    "INSERT INTO \"values\" VALUES ('v-1', 'ISA', 100, '2026-05-01 00:00:00.000000')",
+    # Two values on one day (e.g. posted at different times): the latest wins
+    "INSERT INTO \"values\" VALUES ('v-2', 'ISA', 150, '2026-06-01 00:00:00.000000')",
+    "INSERT INTO \"values\" VALUES ('v-3', 'ISA', 175, '2026-06-01 12:00:00.000000')",
+    (
+        "INSERT INTO \"values\" VALUES ('v-4', 'Mortgage', -500, "
+        "'2026-05-01 00:00:00.000000')"
+    ),
+]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup, "DB_PATH", tmp_path / "tracker.db")
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path / "backups")
+    engine = create_engine(f"sqlite:///{backup.DB_PATH}")
+    yield engine
+    engine.dispose()
+
+
+def user_version(engine):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+class TestIntegerKeysMigration:
+    def test_migrates_uuid_schema_keeping_data(self, engine):
+        with engine.begin() as conn:
+            for statement in UUID_SCHEMA:
+                conn.exec_driver_sql(statement)
+        Base.metadata.create_all(bind=engine)
+
+        upgrade(engine)
+
+        assert user_version(engine) == SCHEMA_VERSION
+        assert len(backup.list_snapshots()) == 1
+        columns = {c["name"] for c in inspect(engine).get_columns("values")}
+        assert columns == {"id", "account_id", "amount", "date"}
+        indexes = {i["name"] for i in inspect(engine).get_indexes("values")}
+        assert indexes == {"ix_values_date", "ux_values_account_date"}
+        db = sessionmaker(bind=engine)()
+        isa = db.query(Account).filter(Account.name == "ISA").one()
+        assert isa.description == "Savings" and isinstance(isa.id, int)
+        values = {
+            (v.account_name, v.date): v.amount
+            for v in db.query(Value).order_by(Value.id)
+        }
+        assert values == {
+            ("ISA", date(2026, 5, 1)): 100.0,
+            ("ISA", date(2026, 6, 1)): 175.0,
+            ("Mortgage", date(2026, 5, 1)): -500.0,
+        }
+        db.close()
+
+    def test_new_database_is_stamped_without_migrating(self, engine):
+        Base.metadata.create_all(bind=engine)
+
+        upgrade(engine)
+
+        assert user_version(engine) == SCHEMA_VERSION
+        assert backup.list_snapshots() == []
@@ -0,0 +1,131 @@
+import dataclasses
+import threading
+from datetime import timedelta
+
+import pytest
+
+from app.services import scheduler
+from app.services.drive import DriveConfigError, DriveError
+from app.services.importer import ExcelParseError
+from app.services.scheduler import SyncScheduler
+from tests.conftest import OUTCOME
+
+INTERVAL = timedelta(minutes=15)
+
+
+class NoJitter:
+    def uniform(self, low, high):
+        return 1.0
+
+
+def outcome(skipped):
+    return dataclasses.replace(OUTCOME, skipped=skipped)
+
+
+@pytest.fixture
+def finished_job(make_jobs):
+    def finish(run):
+        job = make_jobs(run).submit()
+        assert job.done.wait(5)
+        return job
+
+    return finish
+
+
+def unchanged(db, force, progress):
+    return outcome(skipped=True)
+
+
+def changed(db, force, progress):
+    return outcome(skipped=False)
+
+
+def drive_down(db, force, progress):
+    raise DriveError("Drive is down")
+
+
+def bad_key(db, force, progress):
+    raise DriveConfigError("Service account key not found")
+
+
+def broken_workbook(db, force, progress):
+    raise ExcelParseError("No account rows found")
+
+
+def next_delay(sched):
+    return sched.state.next_run_at - sched.state.last_run_at
+
+
+class TestSyncScheduler:
+    def make(self):
+        return SyncScheduler(jobs=None, interval=INTERVAL, rng=NoJitter())
+
+    def test_unchanged_file_keeps_the_interval(self, finished_job):
+        sched = self.make()
+        sched._record(finished_job(unchanged))
+
+        assert sched.state.last_result == "unchanged"
+        assert abs(next_delay(sched) - INTERVAL) < timedelta(seconds=1)
+
+    def test_polls_faster_after_a_change(self, finished_job):
+        sched = self.make()
+        sched._record(finished_job(changed))
+        assert abs(next_delay(sched) - scheduler.FAST_INTERVAL) < timedelta(seconds=1)
+
+        # Still inside the fast window even when the next poll finds nothing
+        sched._record(finished_job(unchanged))
+        assert abs(next_delay(sched) - scheduler.FAST_INTERVAL) < timedelta(seconds=1)
+
+    def test_backs_off_exponentially_on_drive_errors(self, finished_job):
+        sched = self.make()
+        delays = []
+        for _ in range(5):
+            sched._record(finished_job(drive_down))
+            delays.append(round(next_delay(sched) / INTERVAL))
+
+        assert delays == [2, 4, 8, 8, 8]  # capped at MAX_BACKOFF (2h)
+        assert sched.state.consecutive_failures == 5
+
+        sched._record(finished_job(unchanged))
+        assert sched.state.consecutive_failures == 0
+
+    def test_backs_off_on_config_and_parse_errors_too(self, finished_job):
+        for run in (bad_key, broken_workbook):
+            sched = self.make()
+            sched._record(finished_job(run))
+            sched._record(finished_job(run))
+            assert round(next_delay(sched) / INTERVAL) == 4
+
+    def test_jitter_stays_within_bounds(self, finished_job):
+        sched = SyncScheduler(jobs=None, interval=INTERVAL)
+        for _ in range(20):
+            sched._record(finished_job(unchanged))
+            ratio = next_delay(sched) / INTERVAL
+            assert 1 - scheduler.JITTER - 0.01 <= ratio <= 1 + scheduler.JITTER
+
+    def test_runs_syncs_on_its_own_thread(self, make_jobs):
+        ran = threading.Event()
+        callers = []
+
+        def run(db, force, progress):
+            callers.append(threading.current_thread().name)
+            ran.set()
+            return outcome(skipped=True)
+
+        sched = SyncScheduler(
+            make_jobs(run),
+            interval=timedelta(milliseconds=10),
+        )
+        sched.start()
+        try:
+            assert ran.wait(5)
+        finally:
+            sched.stop()
+        assert callers[0].startswith("sync-")
+
+
+def test_not_started_without_a_drive_file(capsys):
+    scheduler.start_scheduler(None, INTERVAL, drive_file_id=None)
+
+    assert scheduler.current_scheduler() is None
+    assert "DRIVE_FILE_ID not set" in capsys.readouterr().out
@@ -0,0 +1,151 @@
+import dataclasses
+import hashlib
+import sqlite3
+from io import BytesIO
+
+import pytest
+
+from app.config import get_settings
+from app.models.sync_state import SyncState
+from app.models.value import Value
+from app.services import backup, parse_cache
+from app.services.drive import (
+    GOOGLE_SHEET_MIME,
+    XLSX_MIME,
+    Download,
+    DriveMetadata,
+)
+from app.services.sync import SyncProgress, run_drive_sync
+from tests.conftest import make_workbook
+
+ROW = ["Savings", "Short Term", "Asset", "Liquid", "Cash", "ISA"]
+
+
+class FakeDrive:
+    """Stands in for DriveClient; serves one workbook and counts downloads."""
+
+    def __init__(self, amounts=(100, 150), mime_type=XLSX_MIME):
+        self.mime_type = mime_type
+        self.downloads = 0
+        self.timings = []
+        self.publish(amounts, "2026-06-01T10:00:00Z")
+
+    def publish(self, amounts, modified_time):
+        self.content = make_workbook([ROW + list(amounts)]).getvalue()
+        self.modified_time = modified_time
+
+    def resave(self, modified_time):
+        """Touch the file without changing its bytes."""
+        self.modified_time = modified_time
+
+    def __call__(self, service_account_file):
+        return self
+
+    def get_metadata(self, file_id):
+        return DriveMetadata(
+            name="Net Worth Tracker.xlsx",
+            mime_type=self.mime_type,
+            modified_time=self.modified_time,
+            md5_checksum=(
+                hashlib.md5(self.content).hexdigest()
+                if self.mime_type == XLSX_MIME
+                else None
+            ),
+        )
+
+    def download(self, file_id, mime_type, max_bytes, on_progress=None):
+        self.downloads += 1
+        return Download(
+            file=BytesIO(self.content),
+            size=len(self.content),
+            md5=hashlib.md5(self.content).hexdigest(),
+        )
+
+
+@pytest.fixture
+def drive(monkeypatch, tmp_path):
+    fake = FakeDrive()
+    settings = dataclasses.replace(get_settings(), drive_file_id="file-id")
+    monkeypatch.setattr("app.services.sync.get_settings", lambda: settings)
+    monkeypatch.setattr("app.services.sync.DriveClient", fake)
+    monkeypatch.setattr(backup, "DB_PATH", tmp_path / "tracker.db")
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path / "backups")
+    monkeypatch.setattr(parse_cache, "CACHE_DIR", tmp_path / "cache")
+    return fake
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("workbook should not be parsed")
+
+
+def _fail_snapshot(*args, **kwargs):
+    raise AssertionError("database should not be snapshotted")
+
+
+class TestRunDriveSync:
+    def test_first_sync_imports_and_records_hash(self, db_session, drive):
+        outcome = run_drive_sync(db_session)
+
+        assert not outcome.skipped
+        assert outcome.values_inserted == 2
+        state = db_session.get(SyncState, 1)
+        assert state.content_hash == hashlib.md5(drive.content).hexdigest()
+
+    def test_resaved_identical_file_skips_download_and_snapshot(
+        self, db_session, drive, monkeypatch
+    ):
+        run_drive_sync(db_session)
+        drive.resave("2026-06-02T09:00:00Z")
+
+        monkeypatch.setattr("app.services.sync.BackgroundSnapshot", _fail_snapshot)
+
+        outcome = run_drive_sync(db_session)
+
+        assert outcome.skipped
+        assert drive.downloads == 1
+        state = db_session.get(SyncState, 1)
+        assert state.drive_modified_time == "2026-06-02T09:00:00Z"
+
+    def test_google_sheet_is_hashed_locally(self, db_session, drive, monkeypatch):
+        drive.mime_type = GOOGLE_SHEET_MIME
+        run_drive_sync(db_session)
+        drive.resave("2026-06-02T09:00:00Z")
+        monkeypatch.setattr("app.services.sync.parse_workbook", _fail_parse)
+
+        outcome = run_drive_sync(db_session)
+
+        assert outcome.skipped
+        assert drive.downloads == 2
+
+    def test_changed_file_is_imported_incrementally(self, db_session, drive):
+        run_drive_sync(db_session)
+        drive.publish((100, 175), "2026-06-02T09:00:00Z")
+
+        outcome = run_drive_sync(db_session)
+
+        assert not outcome.skipped
+        assert (outcome.values_inserted, outcome.values_updated) == (0, 1)
+        amounts = sorted(v.amount for v in db_session.query(Value).all())
+        assert amounts == [100.0, 175.0]
+
+    def test_forced_reload_uses_parse_cache(self, db_session, drive, monkeypatch):
+        run_drive_sync(db_session)
+        monkeypatch.setattr("app.services.sync.parse_workbook", _fail_parse)
+
+        outcome = run_drive_sync(db_session, force=True)
+
+        assert not outcome.skipped
+        assert outcome.values_loaded == 2
+        assert drive.downloads == 1
+
+    def test_database_is_snapshotted_before_import(self, db_session, drive):
+        with sqlite3.connect(backup.DB_PATH) as conn:
+            conn.execute("CREATE TABLE t (x BLOB)")
+            conn.execute("INSERT INTO t VALUES (zeroblob(100000))")
+        progress = SyncProgress()
+
+        run_drive_sync(db_session, progress=progress)
+
+        assert len(backup.list_snapshots()) == 1
+        assert progress.backup_pages == progress.backup_total_pages > 1
+        assert "snapshot" in progress.timings
@@ -0,0 +1,103 @@
+import threading
+
+from app.models.sync_run import SyncRun
+from app.services import sync_history
+from app.services.drive import DriveError
+from app.services.sync_jobs import SyncJobs
+from tests.conftest import OUTCOME
+
+
+class TestSyncJobs:
+    def test_runs_in_background_and_reports_progress(self, make_jobs):
+        release = threading.Event()
+
+        def run(db, force, progress):
+            with progress.track("download"):
+                progress.downloaded(1024)
+                release.wait(5)
+            return OUTCOME
+
+        jobs = make_jobs(run)
+        job = jobs.submit()
+        assert job.status in ("queued", "running")
+
+        release.set()
+        assert job.done.wait(5)
+        assert job.status == "succeeded"
+        assert job.outcome is OUTCOME
+        assert job.progress.bytes_downloaded == 1024
+        assert "download" in job.progress.timings
+        assert jobs.get(job.id) is job
+
+    def test_concurrent_submits_coalesce(self, make_jobs):
+        release = threading.Event()
+        calls = []
+
+        def run(db, force, progress):
+            calls.append(force)
+            release.wait(5)
+            return OUTCOME
+
+        jobs = make_jobs(run)
+        first = jobs.submit()
+        second = jobs.submit(force=True)
+        assert second is first
+        assert jobs.active() is first
+
+        release.set()
+        assert first.done.wait(5)
+        assert calls == [False]
+        assert jobs.active() is None
+        assert jobs.submit() is not first
+
+    def test_failure_is_recorded_on_the_job(self, make_jobs):
+        def run(db, force, progress):
+            raise DriveError("Drive is down")
+
+        job = make_jobs(run).submit()
+
+        assert job.done.wait(5)
+        assert job.status == "failed"
+        assert (job.error, job.error_kind) == ("Drive is down", "drive")
+
+
+class TestSyncHistory:
+    def test_finished_jobs_are_recorded(self, shared_sessions):
+        def run(db, force, progress):
+            with progress.track("metadata"):
+                pass
+            if force:
+                raise DriveError("Drive is down")
+            with progress.track("download"):
+                progress.downloaded(2048)
+            return OUTCOME
+
+        jobs = SyncJobs(run=run, session_factory=shared_sessions)
+        assert jobs.submit().done.wait(5)
+        assert jobs.submit(force=True).done.wait(5)
+
+        db = shared_sessions()
+        ok, failed = db.query(SyncRun).order_by(SyncRun.id).all()
+        assert (ok.status, ok.bytes_downloaded, ok.values_loaded) == (
+            "succeeded",
+            2048,
+            2,
+        )
+        assert ok.download_seconds is not None and ok.import_seconds is None
+        assert (failed.status, failed.force, failed.error_kind) == (
+            "failed",
+            True,
+            "drive",
+        )
+        assert failed.metadata_seconds is not None and failed.values_loaded is None
+
+    def test_keeps_the_newest_runs(self, shared_sessions, monkeypatch):
+        monkeypatch.setattr(sync_history, "KEEP_RUNS", 3)
+        jobs = SyncJobs(
+            run=lambda db, force, progress: OUTCOME, session_factory=shared_sessions
+        )
+        for _ in range(5):
+            assert jobs.submit().done.wait(5)
+
+        db = shared_sessions()
+        assert [run.id for run in db.query(SyncRun).order_by(SyncRun.id)] == [3, 4, 5]